@@ -4,22 +4,24 @@ import json
 import os
 import pathlib
 import time
-from datetime import datetime
+from collections.abc import Callable
 from logging import Logger
-from typing import Any
-
-import pandas as pd
-import yaml
-from google.api_core import exceptions as google_exceptions
-from google.api_core.page_iterator import Iterator
-from google.cloud.bigquery import client as bq_client
+from typing import TYPE_CHECKING, Any
 
 from src.actions import utils as bq_utils
-from src.common import environment, paths
-from src.managed_table.entrypoints import local
+from src.common import clients, environment, paths
+from src.managed_table.domain import value_objects
 from src.query_constructor import query_template
 from src.scripts import utils
 
+# Actions run as short lived pods, so modules only some actions need (bigquery, the managed
+# table service, yaml) are imported by those actions rather than at module load.
+if TYPE_CHECKING:
+    from google.api_core.page_iterator import Iterator
+    from google.cloud.bigquery import client as bq_client
+
+    from src.managed_table.entrypoints import local
+
 LOGGER: Logger = utils.get_logger(name='actions')
 
 
@@ -36,9 +38,11 @@ def default_environment_template_fields(start_date: str, table_name: str) -> dic
 def restore_table_from_backup(
     backup_table_name: str,
     destination_table_name: str,
-    managed_table_entrypoint: local.Entrypoint | None = None,
+    managed_table_entrypoint: 'local.Entrypoint | None' = None,
 ) -> None:
     if managed_table_entrypoint is None:
+        from src.managed_table.entrypoints import local  # noqa: PLC0415
+
         managed_table_entrypoint = local.Entrypoint.from_default()
 
     managed_table_entrypoint.replace_table(
@@ -52,9 +56,16 @@ def sync_partitioned_table(  # noqa: PLR0913
     run_day: str,
     partition_field: str,
     upstream_table_names: list[str],
-    managed_table_entrypoint: local.Entrypoint | None = None,
+    managed_table_entrypoint: 'local.Entrypoint | None' = None,
+    backfill_concurrency: int = environment.BACKFILL_CONCURRENCY,
+    backfill_batch_size: int = 1,
 ) -> None:
     if managed_table_entrypoint is None:
+        from src.managed_table.entrypoints import local  # noqa: PLC0415
+
+        # the default entrypoint writes through the shared BigQuery client, whose pool is only
+        # sized for `BACKFILL_CONCURRENCY` workers
+        clients.reserve_bigquery_connections(concurrency=backfill_concurrency)
         managed_table_entrypoint = local.Entrypoint.from_default()
 
     query: query_template.QueryTemplate = get_query(
@@ -64,28 +75,36 @@ def sync_partitioned_table(  # noqa: PLR0913
         ),
     )
 
+    definition: str = query.render(run_day='unused')
+    # a table built from the same definition already has the schema a dry run would return
+    schema: list[dict[str, Any]] | None = managed_table_entrypoint.get_table_schema(
+        table_name=table_name, definition=definition
+    )
+    if schema is None:
+        schema = bq_utils.get_bq_schema_api_repr(
+            query=query.render(run_day=start_date), definition=definition
+        )  # TODO: this is extremely fragile for recursive queries, must be start date
     managed_table_entrypoint.sync_partitioned_table(
         table_name=table_name,
-        schema=bq_utils.get_bq_schema_api_repr_from_query_dry_run(
-            query=query.render(run_day=start_date)
-        ),  # TODO: this is extremely fragile for recursive queries, must be start date
+        schema=schema,
         partition_field=partition_field,
         upstream_table_names=upstream_table_names,
-        partitions=[
-            datetime.strftime(day, '%Y-%m-%d')
-            for day in pd.date_range(start=start_date, end=run_day)
-        ],
-        definition=query.render(run_day='unused'),
+        partitions=value_objects.Partitions.from_range(start=start_date, end=run_day),
+        definition=definition,
         query_renderer=query.render,
+        backfill_concurrency=backfill_concurrency,
+        backfill_batch_size=backfill_batch_size,
     )
 
 
 def sync_unpartitioned_table(
     table_name: str,
     run_day: str,
-    managed_table_entrypoint: local.Entrypoint | None = None,
+    managed_table_entrypoint: 'local.Entrypoint | None' = None,
 ) -> None:
     if managed_table_entrypoint is None:
+        from src.managed_table.entrypoints import local  # noqa: PLC0415
+
         managed_table_entrypoint = local.Entrypoint.from_default()
 
     query: query_template.QueryTemplate = get_query(
@@ -121,6 +140,8 @@ def get_query_template(
                 template=query, environment_template_fields=environment_template_fields
             )
         case '.yaml':
+            import yaml  # noqa: PLC0415
+
             config: dict[str, Any] = yaml.safe_load(stream=query)
             # resolving base query for recursive templates
             if config['template'] == 'recursive_template':
@@ -150,27 +171,14 @@ def _get_base_query(query_path: pathlib.Path) -> str:
 
 
 def _get_query_candidate(query_name: str) -> pathlib.Path:
-    candidates = list(paths.get_path(path_type='configs').rglob(pattern=f'{query_name}.*'))
-
-    if len(candidates) > 1:
-        sql_candidates: list[pathlib.Path] = [
-            candidate for candidate in candidates if 'sql' in candidate.name
-        ]
-        if len(sql_candidates) == 1:
-            return sql_candidates[0]
-        raise ValueError(f'Multiple candidates found for query name: {query_name}')
-    if not candidates:
-        msg: str = f'Candidate not found for query: {query_name}.'
-        raise NotImplementedError(msg)
-    candidate: pathlib.Path = candidates[0]
-    return candidate
+    return paths.get_config_index().get_query_path(name=query_name)
 
 
 def run_bq_assertion(
     assertion: str,
     run_day: str,
     template_fields: dict[str, Any] | None = None,
-    client: bq_client.Client | None = None,
+    client: 'bq_client.Client | None' = None,
 ) -> None:
     if template_fields is None:
         template_fields = {}
@@ -185,6 +193,8 @@ def run_bq_assertion(
     )
     job = client.query(query=query.render(run_day=run_day))
 
+    from google.api_core import exceptions as google_exceptions  # noqa: PLC0415
+
     try:
         job.result()
     except google_exceptions.BadRequest as e:
@@ -213,7 +223,7 @@ def check_bq_partition(
     raise ValueError(msg)
 
 
-def cleanup_sideload_tables_in_bigquery(client: bq_client.Client | None = None):
+def cleanup_sideload_tables_in_bigquery(client: 'bq_client.Client | None' = None):
     if client is None:
         client = bq_utils.default_client()
     tables: Iterator = client.list_tables(dataset=environment.BQ_DATASET)
@@ -224,6 +234,47 @@ def cleanup_sideload_tables_in_bigquery(client: bq_client.Client | None = None):
             client.delete_table(table=table, not_found_ok=True)
 
 
+def run_actions(requests: list[dict[str, Any]]) -> None:
+    """Runs actions one after another in this process, so they share its clients and caches.
+
+    Each request is a dict with an `action` name and its `parameters`. The first failure stops
+    the batch, and a retry runs the whole batch again.
+    """
+    for request in requests:
+        run_action(action=request['action'], parameters=request.get('parameters', {}))
+
+
+ACTIONS: dict[str, Callable[..., None]] = {
+    action.__name__: action
+    for action in (
+        restore_table_from_backup,
+        sync_partitioned_table,
+        sync_unpartitioned_table,
+        run_bq_assertion,
+        check_bq_partition,
+        cleanup_sideload_tables_in_bigquery,
+        run_actions,
+    )
+}
+
+
+def run_action(action: str, parameters: dict[str, Any]) -> None:
+    function: Callable[..., None] | None = ACTIONS.get(action)
+    if function is None:
+        msg: str = f"Function '{action}' does not exist."
+        raise ValueError(msg)
+
+    # TODO: this could be refined.
+    # filter out unused runtime parameters
+    filtered_parameters = {
+        parameter: parameters[parameter]
+        for parameter in inspect.signature(function).parameters
+        if parameter in parameters
+    }
+
+    function(**filtered_parameters)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description='Run an action.')
     parser.add_argument('action', type=str, help='The name of the action to run.')
@@ -244,22 +295,7 @@ def main() -> None:
 
     args: argparse.Namespace = parser.parse_args()
 
-    action = globals().get(args.action)
-    if not callable(action):
-        msg: str = f"Function '{args.action}' does not exist."
-        raise ValueError(msg)
-
-    all_parameters = args.parameters | args.run_time_parameters
-
-    # TODO: this could be refined.
-    # filter out unused runtime parameters
-    filtered_parameters = {
-        parameter: all_parameters[parameter]
-        for parameter in inspect.signature(action).parameters
-        if parameter in all_parameters
-    }
-
-    action(**filtered_parameters)
+    run_action(action=args.action, parameters=args.parameters | args.run_time_parameters)
 
 
 if __name__ == '__main__':
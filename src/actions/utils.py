@@ -1,22 +1,79 @@
-from typing import Any
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
 
-from google.cloud.bigquery import client as bq_client
-from google.cloud.bigquery import job
+from src.common import clients
+from src.managed_table import utils
 
-from src.common import environment
+if TYPE_CHECKING:
+    from google.cloud.bigquery import client as bq_client
 
+SCHEMA_CACHE_DIR: Final[Path] = Path(
+    os.environ.get(
+        'ALGO_FEATURES_SCHEMA_CACHE',
+        default=Path(tempfile.gettempdir()) / 'algo_features_schema_cache',
+    )
+)
+
+_schema_cache: dict[str, list[dict[str, Any]]] = {}
 
-def default_client() -> bq_client.Client:
-    return bq_client.Client(project=environment.BQ_BILLING_PROJECT)
+
+default_client = clients.get_bigquery_client
 
 
 def get_bq_schema_api_repr_from_query_dry_run(
     query: str,
+    client: 'bq_client.Client | None' = None,
 ) -> list[dict[str, Any]]:
-    client: bq_client.Client = default_client()
+    from google.cloud.bigquery import job  # noqa: PLC0415
+
+    client = client or default_client()
     query_job: job.QueryJob = client.query(
         query=query,
         job_config=job.QueryJobConfig(dry_run=True),
     )
     # TODO: this feels dangerous, but is currently the only way to pull this information without running a query
     return query_job._properties['statistics']['query']['schema']['fields']  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def get_bq_schema_api_repr(
+    query: str,
+    definition: str,
+    client: 'bq_client.Client | None' = None,
+    cache_dir: Path = SCHEMA_CACHE_DIR,
+) -> list[dict[str, Any]]:
+    """Gets the schema of a query, dry running it only when its definition has not been seen.
+
+    Schemas are cached in memory and as json files in `cache_dir`, keyed by the same definition
+    hash that managed tables store in their `definition` label. Schema changes that do not
+    change the definition, e.g. a new upstream column behind `SELECT *`, are not picked up.
+    """
+    key: str = utils.hash_definition(definition=definition)
+    if key in _schema_cache:
+        return _schema_cache[key]
+
+    cache_path: Path = cache_dir / f'{key}.json'
+    try:
+        with cache_path.open() as file:
+            schema: list[dict[str, Any]] = json.load(fp=file)
+    except (OSError, ValueError):
+        schema = get_bq_schema_api_repr_from_query_dry_run(query=query, client=client)
+        _write_schema(cache_path=cache_path, schema=schema)
+
+    _schema_cache[key] = schema
+    return schema
+
+
+def _write_schema(cache_path: Path, schema: list[dict[str, Any]]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='w', dir=cache_path.parent, suffix='.tmp', delete=False
+        ) as file:
+            json.dump(obj=schema, fp=file)
+        os.replace(src=file.name, dst=cache_path)
+    except OSError:
+        # the cache is an optimisation, a read-only filesystem should not fail the sync
+        pass
@@ -0,0 +1,83 @@
+"""Long-lived process that runs action requests, amortising interpreter and client start up.
+
+Requests are json lines of the form `{"action": "<name>", "parameters": {...}}`, read from stdin
+or from a unix socket. Each request is answered with a json line reporting its status. Clients,
+config indexes and compiled templates are kept between requests, table metadata is not.
+"""
+
+import argparse
+import json
+import socketserver
+import sys
+from collections.abc import Iterable
+from typing import Any, TextIO
+
+from src.actions import actions
+from src.managed_table import configs
+from src.scripts import utils
+
+LOGGER = utils.get_logger(name='worker')
+
+
+def handle_request(request: str) -> dict[str, Any]:
+    try:
+        parsed_request: dict[str, Any] = json.loads(request)
+        action: str = parsed_request['action']
+        actions.run_action(action=action, parameters=parsed_request.get('parameters', {}))
+    except Exception as e:
+        LOGGER.exception(f'Failed to run request: {request}')
+        return {'status': 'failed', 'error': repr(e)}
+    finally:
+        _clear_request_state()
+    return {'status': 'succeeded', 'action': action}
+
+
+def _clear_request_state() -> None:
+    # tables may be changed by other processes between requests
+    if configs.get_default_config.cache_info().currsize:
+        configs.get_default_config().table_repository.clear_cache()
+
+
+def serve(requests: Iterable[str], responses: TextIO) -> None:
+    for request in requests:
+        if request.strip():
+            responses.write(json.dumps(handle_request(request=request)) + '\n')
+            responses.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for request in self.rfile:
+            if request.strip():
+                response: dict[str, Any] = handle_request(request=request.decode())
+                self.wfile.write((json.dumps(response) + '\n').encode())
+
+
+def serve_socket(path: str) -> None:
+    with socketserver.UnixStreamServer(
+        server_address=path, RequestHandlerClass=_RequestHandler
+    ) as server:
+        LOGGER.info(f'Serving action requests on: {path}')
+        server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run action requests in a long-lived process.')
+    parser.add_argument(
+        '--socket',
+        help='Path of a unix socket to serve requests on. Requests are read from stdin otherwise.',
+        type=str,
+        required=False,
+        default=None,
+    )
+
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.socket:
+        serve_socket(path=args.socket)
+    else:
+        serve(requests=sys.stdin, responses=sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"Process-wide clients shared by actions and managed table repositories."
+
+import functools
+from typing import TYPE_CHECKING, Final
+
+from src.common import environment
+
+if TYPE_CHECKING:
+    import requests
+    from google.cloud.bigquery import client as bq_client
+
+# Every concurrent backfill worker holds a connection, plus headroom for metadata calls made
+# alongside them.
+BQ_CONNECTION_POOL_HEADROOM: Final[int] = 4
+BQ_CONNECTION_POOL_SIZE: Final[int] = (
+    max(environment.BACKFILL_CONCURRENCY, 1) + BQ_CONNECTION_POOL_HEADROOM
+)
+
+
+@functools.cache
+def get_bigquery_client() -> 'bq_client.Client':
+    """Gets the BigQuery client of this process, constructing it on first use.
+
+    The client's session keeps up to `BQ_CONNECTION_POOL_SIZE` warm connections, so concurrent
+    jobs reuse connections and one set of credentials instead of each opening their own. See
+    `reserve_bigquery_connections` for more concurrent workers than `BACKFILL_CONCURRENCY`.
+    """
+    # imported here so that processes which never query BigQuery do not pay for the import
+    import google.auth  # noqa: PLC0415
+    from google.auth.transport import requests as auth_requests  # noqa: PLC0415
+    from google.cloud.bigquery import client as bq_client  # noqa: PLC0415
+
+    credentials, _ = google.auth.default(scopes=bq_client.Client.SCOPE)
+    session = auth_requests.AuthorizedSession(credentials=credentials)
+    _mount_connection_pool(session=session, pool_size=BQ_CONNECTION_POOL_SIZE)
+    return bq_client.Client(
+        project=environment.BQ_BILLING_PROJECT, credentials=credentials, _http=session
+    )
+
+
+def reserve_bigquery_connections(concurrency: int) -> None:
+    """Grows the connection pool of the BigQuery client so that `concurrency` workers, e.g. a
+    task's own `backfill_concurrency`, each keep a connection. Larger pools are left as is."""
+    from requests import adapters  # noqa: PLC0415
+
+    pool_size: int = max(concurrency, 1) + BQ_CONNECTION_POOL_HEADROOM
+    if pool_size <= BQ_CONNECTION_POOL_SIZE:
+        return
+    session: requests.Session = get_bigquery_client()._http
+    adapter = session.get_adapter(url='https://')
+    if (
+        isinstance(adapter, adapters.HTTPAdapter)
+        and pool_size <= adapter.poolmanager.connection_pool_kw['maxsize']
+    ):
+        return
+    _mount_connection_pool(session=session, pool_size=pool_size)
+
+
+def _mount_connection_pool(session: 'requests.Session', pool_size: int) -> None:
+    from requests import adapters  # noqa: PLC0415
+
+    adapter = adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount(prefix='https://', adapter=adapter)
@@ -13,6 +13,9 @@ ALGO_PROJECT: Final[str] = os.environ.get(
 )
 BQ_BILLING_PROJECT: Final[str] = ALGO_PROJECT
 BQ_DATA_ENV: Final[str] = 'nbcu-ds-prod-001'
+BACKFILL_CONCURRENCY: Final[int] = int(
+    os.environ.get('AIRFLOW_VAR_BACKFILL_CONCURRENCY', default='1')
+)
 
 DB_CATALOG: str = 'DB_CATALOG'
 DB_SCHEMA: str = 'DB_SCHEMA'
@@ -1,5 +1,7 @@
+import functools
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -31,3 +33,97 @@ def get_config_names() -> Generator[str, None, None]:
         for path in config_dir.rglob(pattern='*.yaml')
         if 'sql' not in path.parts
     )
+
+
+@dataclass(frozen=True)
+class ConfigIndex:
+    """Config files under a config directory, keyed by the names they can be looked up by.
+
+    A file is indexed under every prefix of its name that ends before a '.', so
+    `user_features.sql.jinja2` is found as `user_features` and `user_features.sql`. Queries are
+    searched recursively and pipelines one directory deep. Ambiguous names are resolved or
+    recorded as duplicates when the index is built, so lookups are dictionary accesses.
+    """
+
+    queries: Mapping[str, Path]
+    pipelines: Mapping[str, Path]
+    duplicate_queries: Mapping[str, tuple[Path, ...]]
+    duplicate_pipelines: Mapping[str, tuple[Path, ...]]
+
+    @classmethod
+    def build(cls, config_directory: Path) -> 'ConfigIndex':
+        files: list[Path] = sorted(path for path in config_directory.rglob('*') if path.is_file())
+        query_candidates: dict[str, list[Path]] = _group_by_name(paths=files)
+        pipeline_candidates: dict[str, list[Path]] = _group_by_name(
+            paths=(path for path in files if len(path.relative_to(config_directory).parts) == 2)
+        )
+
+        queries: dict[str, Path] = {}
+        duplicate_queries: dict[str, tuple[Path, ...]] = {}
+        for name, candidates in query_candidates.items():
+            sql_candidates: list[Path] = [path for path in candidates if 'sql' in path.name]
+            if len(candidates) == 1:
+                queries[name] = candidates[0]
+            elif len(sql_candidates) == 1:
+                queries[name] = sql_candidates[0]
+            else:
+                duplicate_queries[name] = tuple(candidates)
+
+        return cls(
+            queries=queries,
+            pipelines={
+                name: candidates[0]
+                for name, candidates in pipeline_candidates.items()
+                if len(candidates) == 1
+            },
+            duplicate_queries=duplicate_queries,
+            duplicate_pipelines={
+                name: tuple(candidates)
+                for name, candidates in pipeline_candidates.items()
+                if len(candidates) > 1
+            },
+        )
+
+    def get_query_path(self, name: str) -> Path:
+        if name in self.duplicate_queries:
+            raise ValueError(f'Multiple candidates found for query name: {name}')
+        if name not in self.queries:
+            msg: str = f'Candidate not found for query: {name}.'
+            raise NotImplementedError(msg)
+        return self.queries[name]
+
+    def get_pipeline_path(self, name: str) -> Path | None:
+        if name in self.duplicate_pipelines:
+            msg: str = (
+                f'More than one config found matching the name: {name}. '
+                f'Found: {list(self.duplicate_pipelines[name])}.'
+            )
+            raise ValueError(msg)
+        return self.pipelines.get(name)
+
+
+def _group_by_name(paths: Iterable[Path]) -> dict[str, list[Path]]:
+    groups: dict[str, list[Path]] = {}
+    for path in paths:
+        parts: list[str] = path.name.split('.')
+        for end in range(1, len(parts)):
+            if name := '.'.join(parts[:end]):
+                groups.setdefault(name, []).append(path)
+    return groups
+
+
+@functools.cache
+def _get_config_index(config_directory: Path) -> ConfigIndex:
+    return ConfigIndex.build(config_directory=config_directory)
+
+
+def get_config_index(config_directory: Path | None = None) -> ConfigIndex:
+    """Gets the index of a config directory, building it once per process."""
+    return _get_config_index(
+        config_directory=(config_directory or get_path(path_type='configs')).resolve()
+    )
+
+
+def invalidate_config_index() -> None:
+    """Drops every built index. Call after adding or removing config files."""
+    _get_config_index.cache_clear()
@@ -0,0 +1,58 @@
+"Shared jinja2 environment for rendering templates from files and strings."
+
+import os
+from pathlib import Path
+from typing import Any, Final, NoReturn
+
+import jinja2
+
+TEMPLATE_CACHE_SIZE: Final[int] = 400
+BYTECODE_CACHE_DIR: Final[str | None] = os.environ.get('ALGO_FEATURES_TEMPLATE_BYTECODE_CACHE')
+
+
+class TemplateException(Exception):
+    pass
+
+
+def raise_template_exception(message: str) -> NoReturn:
+    raise TemplateException(message)
+
+
+def _get_bytecode_cache() -> jinja2.BytecodeCache | None:
+    if BYTECODE_CACHE_DIR is None:
+        return None
+    Path(BYTECODE_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(directory=BYTECODE_CACHE_DIR)
+
+
+# Templates are loaded by absolute path. The environment keeps an LRU of compiled templates and,
+# with auto_reload, recompiles a template only when its file's mtime changes. Setting
+# ALGO_FEATURES_TEMPLATE_BYTECODE_CACHE persists compiled bytecode across processes.
+jinja2_environment = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(searchpath=Path.cwd().anchor),
+    auto_reload=True,
+    cache_size=TEMPLATE_CACHE_SIZE,
+    bytecode_cache=_get_bytecode_cache(),
+)
+jinja2_environment.globals['raise_template_exception'] = raise_template_exception
+
+
+def get_template(template_path: Path) -> jinja2.Template:
+    """Gets the compiled template for a file, compiling it only if it is new or has changed."""
+    resolved_path: Path = template_path.resolve()
+    return jinja2_environment.get_template(
+        name=resolved_path.relative_to(resolved_path.anchor).as_posix()
+    )
+
+
+def read_template(template_path: Path, template_fields: dict[str, Any] | None = None) -> str:
+    """Function for reading and formatting a jinja template.
+
+    Args:
+        template_path (Path): path to the template
+        template_fields (Optional[dict], optional): fields to template. Defaults to None.
+
+    Returns:
+        (str): formatted template
+    """
+    return get_template(template_path=template_path).render(**(template_fields or {}))
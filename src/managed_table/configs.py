@@ -1,4 +1,7 @@
+import functools
+import os
 from dataclasses import dataclass
+from typing import Final
 
 from src.managed_table.repositories.config.adapters import local as local_config_repo
 from src.managed_table.repositories.config.base import AbstractTableConfigRepository
@@ -7,6 +10,9 @@ from src.managed_table.repositories.query.base import AbstractQueryRepository
 from src.managed_table.repositories.table.adapters import bigquery
 from src.managed_table.repositories.table.base import AbstractTableRepository
 
+# submit BigQuery writes and poll for their completion, instead of waiting on each in a thread
+ASYNC_BIGQUERY_WRITES: Final[bool] = os.environ.get('ALGO_FEATURES_ASYNC_BIGQUERY_WRITES') == 'true'
+
 
 @dataclass(frozen=True)
 class BootstrapConfig:
@@ -15,8 +21,15 @@ class BootstrapConfig:
     table_config_repository: AbstractTableConfigRepository | None = None
 
 
-DEFAULT_CONFIG = BootstrapConfig(
-    query_repository=local_query_repo.InMemoryQueryRepository(),
-    table_repository=bigquery.BigQueryTableRepository(),
-    table_config_repository=local_config_repo.InMemoryTableConfigRepository(),
-)
+@functools.cache
+def get_default_config() -> BootstrapConfig:
+    """Gets the default config, constructing its BigQuery client on first use."""
+    return BootstrapConfig(
+        query_repository=local_query_repo.InMemoryQueryRepository(),
+        table_repository=(
+            bigquery.AsyncBigQueryTableRepository()
+            if ASYNC_BIGQUERY_WRITES
+            else bigquery.BigQueryTableRepository()
+        ),
+        table_config_repository=local_config_repo.InMemoryTableConfigRepository(),
+    )
@@ -1,5 +1,5 @@
 from collections.abc import Callable, Collection, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -50,16 +50,30 @@ class CheckTablePartitionsAreNotEmpty(Command):
 @dataclass(frozen=True)
 class CheckTablePartitions(Command):
     table_name: str
-    expected_partitions: Sequence[str]
+    expected_partitions: value_objects.Partitions
 
 
 @dataclass(frozen=True)
 class UpdateTablePartition(Command):
     table_name: str
-    query: str
+    query: str = field(repr=False)
     partition: str
 
 
+@dataclass(frozen=True)
+class UpdateTablePartitionBatch(Command):
+    table_name: str
+    partition_field: str
+    updates: Sequence[UpdateTablePartition]
+
+
+@dataclass(frozen=True)
+class UpdateTablePartitions(Command):
+    table_name: str
+    chains: Sequence[Sequence[UpdateTablePartition | UpdateTablePartitionBatch]]
+    max_concurrency: int
+
+
 @dataclass(frozen=True)
 class CreateTable(Command):
     table_name: str
@@ -81,7 +95,7 @@ class DeleteTable(Command):
 @dataclass(frozen=True)
 class PlanBackfill(Command):
     table_name: str
-    partitions: Sequence[str]
+    partitions: value_objects.Partitions
 
 
 @dataclass(frozen=True)
@@ -89,10 +103,21 @@ class PlanSideload(Command):
     table_name: str
 
 
+@dataclass(frozen=True)
+class AddTableColumns(Command):
+    table_name: str
+    columns: Collection[dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class UpdateTableDefinition(Command):
+    table_name: str
+
+
 @dataclass(frozen=True)
 class AddQuery(Command):
     query_name: str
-    query_renderer: Callable[[str, dict | None], str]
+    query_renderer: Callable[[str, dict | None], str] = field(repr=False)
 
 
 @dataclass(frozen=True)
@@ -104,10 +129,10 @@ class ReplaceTable(Command):
 @dataclass(frozen=True)
 class SyncPartitionedTable(Command):
     expected_metadata: value_objects.TableConfig
-    query_renderer: Callable[[str, dict | None], str]
+    query_renderer: Callable[[str, dict | None], str] = field(repr=False)
 
 
 @dataclass(frozen=True)
 class SyncUnpartitionedTable(Command):
     table_name: str
-    query: str
+    query: str = field(repr=False)
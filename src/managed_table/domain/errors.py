@@ -1,4 +1,3 @@
-from collections.abc import Sequence
 from dataclasses import dataclass
 
 from src.managed_table.domain import value_objects
@@ -21,7 +20,7 @@ class TableAlreadyExists(Error):
 @dataclass
 class TableHasNoPartitions(Error):
     table_name: str
-    missing_partitions: Sequence[str]
+    missing_partitions: value_objects.Partitions
 
 
 @dataclass
@@ -42,7 +41,7 @@ class DefinitionDoesNotMatchExpectation(Error):
 @dataclass
 class PartitionsDoNotMatchExpectation(Error):
     table_name: str
-    missing_partitions: Sequence[str]
+    missing_partitions: value_objects.Partitions
 
 
 @dataclass
@@ -53,3 +52,4 @@ class ExistingPartitionsExceedExpectations(Error):
 @dataclass
 class NewUpstreamDependenciesSinceLastUpdate(Error):
     table_name: str
+    stale_partitions: value_objects.Partitions
@@ -2,6 +2,7 @@ from collections.abc import Collection
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.managed_table.domain import value_objects
 from src.managed_table.domain.messages import Message
 
 
@@ -39,10 +40,16 @@ class TableCreated(Event):
 @dataclass(frozen=True)
 class TablePartitionUpdated(Event):
     table_name: str
-    query: str
+    query_hash: str
     partition: str
 
 
+@dataclass(frozen=True)
+class TablePartitionsUpdated(Event):
+    table_name: str
+    partitions: value_objects.Partitions
+
+
 @dataclass(frozen=True)
 class TableDefinitionUpToDate(Event):
     table_name: str
@@ -83,6 +90,17 @@ class TableReplaced(Event):
     table_name: str
 
 
+@dataclass(frozen=True)
+class TableColumnsAdded(Event):
+    table_name: str
+    columns: Collection[dict[str, Any]] = field(repr=False)
+
+
+@dataclass(frozen=True)
+class TableDefinitionUpdated(Event):
+    table_name: str
+
+
 @dataclass(frozen=True)
 class TableSynchronized(Event):
     table_name: str
@@ -1,7 +1,9 @@
-from collections.abc import Collection, Sequence
+import bisect
+import itertools
+from collections.abc import Collection, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from typing import Any, overload
 
 
 @dataclass(frozen=True)
@@ -11,10 +13,15 @@ class TableConfig:
     table_name: str
     schema: Collection[dict[str, Any]] = field(repr=False)
     partition_field: str
-    partitions: Sequence[str]
+    partitions: 'Partitions'
     definition: str
     upstream_table_names: list[str] = field(default_factory=list)
     expires: datetime | None = None
+    backfill_concurrency: int = 1
+    backfill_batch_size: int = 1
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'partitions', Partitions.from_partitions(self.partitions))
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -23,3 +30,205 @@ class TableMetadata(TableConfig):
 
     created: datetime
     updated: datetime
+
+
+@dataclass(frozen=True)
+class TableTimestamps:
+    """When a table was created and last updated, without the rest of its metadata."""
+
+    table_name: str
+    created: datetime
+    updated: datetime
+
+
+@dataclass(frozen=True)
+class PartitionStats:
+    """When a single partition was last modified, and how many rows it holds if known."""
+
+    partition: str
+    last_modified: datetime
+    total_rows: int | None = None
+
+
+@dataclass(frozen=True)
+class PartitionRange:
+    """Contiguous, inclusive range of daily partitions."""
+
+    start: str
+    end: str
+
+    def __iter__(self) -> Iterator[str]:
+        for ordinal in range(_to_ordinal(self.start), _to_ordinal(self.end) + 1):
+            yield date.fromordinal(ordinal).isoformat()
+
+    def __len__(self) -> int:
+        return _to_ordinal(self.end) - _to_ordinal(self.start) + 1
+
+
+class Partitions(Sequence[str]):
+    """Immutable, sorted set of daily 'YYYY-MM-DD' partitions.
+
+    Partitions are stored as inclusive ranges of ordinal days, so their size grows with the
+    number of gaps rather than the number of days. Indexing, slicing and membership are
+    logarithmic in the number of ranges, and difference is linear.
+    """
+
+    __slots__ = ('_offsets', '_ranges')
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        self._ranges: tuple[tuple[int, int], ...] = tuple(merged)
+        self._offsets: tuple[int, ...] = tuple(
+            itertools.accumulate((end - start + 1 for start, end in merged), initial=0)
+        )
+
+    @classmethod
+    def from_partitions(cls, partitions: Iterable[str]) -> 'Partitions':
+        if isinstance(partitions, Partitions):
+            return partitions
+        return cls((ordinal, ordinal) for ordinal in map(_to_ordinal, partitions))
+
+    @classmethod
+    def from_range(cls, start: str, end: str) -> 'Partitions':
+        return cls([(_to_ordinal(start), _to_ordinal(end))])
+
+    @property
+    def ranges(self) -> tuple[PartitionRange, ...]:
+        return tuple(
+            PartitionRange(start=_from_ordinal(start), end=_from_ordinal(end))
+            for start, end in self._ranges
+        )
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'Partitions': ...
+
+    def __getitem__(self, index: int | slice) -> 'str | Partitions':
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return Partitions.from_partitions(
+                    self[position] for position in range(start, stop, step)
+                )
+            if start >= stop:
+                return Partitions()
+            return self._between(lower=_to_ordinal(self[start]), upper=_to_ordinal(self[stop - 1]))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Partitions index out of range')
+        position: int = bisect.bisect_right(self._offsets, index) - 1
+        return _from_ordinal(self._ranges[position][0] + index - self._offsets[position])
+
+    def __iter__(self) -> Iterator[str]:
+        for start, end in self._ranges:
+            for ordinal in range(start, end + 1):
+                yield _from_ordinal(ordinal)
+
+    def __reversed__(self) -> Iterator[str]:
+        for start, end in reversed(self._ranges):
+            for ordinal in range(end, start - 1, -1):
+                yield _from_ordinal(ordinal)
+
+    def __contains__(self, partition: object) -> bool:
+        if not isinstance(partition, str):
+            return False
+        try:
+            ordinal: int = _to_ordinal(partition)
+        except ValueError:
+            return False
+        position: int = bisect.bisect_right(self._ranges, ordinal, key=lambda bounds: bounds[0]) - 1
+        return position >= 0 and ordinal <= self._ranges[position][1]
+
+    def __sub__(self, other: 'Partitions') -> 'Partitions':
+        difference: list[tuple[int, int]] = []
+        others: Iterator[tuple[int, int]] = iter(other._ranges)
+        other_range: tuple[int, int] | None = next(others, None)
+        for range_start, end in self._ranges:
+            start: int = range_start
+            while other_range is not None and other_range[1] < start:
+                other_range = next(others, None)
+            while other_range is not None and other_range[0] <= end:
+                if other_range[0] > start:
+                    difference.append((start, other_range[0] - 1))
+                start = max(start, other_range[1] + 1)
+                if other_range[1] > end:
+                    break
+                other_range = next(others, None)
+            if start <= end:
+                difference.append((start, end))
+        return Partitions(difference)
+
+    def __or__(self, other: 'Partitions') -> 'Partitions':
+        return Partitions(self._ranges + other._ranges)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Partitions):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    def __hash__(self) -> int:
+        return hash(self._ranges)
+
+    def __repr__(self) -> str:
+        return f'Partitions({", ".join(_format_range(*bounds) for bounds in self._ranges)})'
+
+    def _between(self, lower: int, upper: int) -> 'Partitions':
+        return Partitions(
+            (max(start, lower), min(end, upper))
+            for start, end in self._ranges
+            if start <= upper and end >= lower
+        )
+
+
+@dataclass(frozen=True)
+class PartitionDiff:
+    """Differences between the partitions a table is expected to have and the ones it has.
+
+    Excess partitions before the first expected partition are past excess, all other excess
+    partitions are future excess.
+    """
+
+    missing: Partitions = field(default_factory=Partitions)
+    excess_past: Partitions = field(default_factory=Partitions)
+    excess_future: Partitions = field(default_factory=Partitions)
+
+    @classmethod
+    def from_partitions(cls, expected: Iterable[str], actual: Iterable[str]) -> 'PartitionDiff':
+        expected_partitions: Partitions = Partitions.from_partitions(expected)
+        actual_partitions: Partitions = Partitions.from_partitions(actual)
+        excess: Partitions = actual_partitions - expected_partitions
+        if not expected_partitions:
+            return cls(excess_future=excess)
+        start: int = _to_ordinal(expected_partitions[0])
+        return cls(
+            missing=expected_partitions - actual_partitions,
+            excess_past=excess._between(lower=date.min.toordinal(), upper=start - 1),
+            excess_future=excess._between(lower=start + 1, upper=date.max.toordinal()),
+        )
+
+
+def _to_ordinal(partition: str) -> int:
+    return date.fromisoformat(partition).toordinal()
+
+
+def _from_ordinal(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _format_range(start: int, end: int) -> str:
+    if start == end:
+        return _from_ordinal(start)
+    return f'{_from_ordinal(start)}..{_from_ordinal(end)}'
@@ -6,12 +6,33 @@ from typing_extensions import Self
 
 from src.managed_table import bootstrap, configs
 from src.managed_table.domain import commands, value_objects
+from src.managed_table.repositories.table import exceptions
+from src.managed_table.repositories.table.base import AbstractTableRepository
 from src.managed_table.services import message_bus
 
 
 @dataclass
 class Entrypoint:
     bus: message_bus.MessageBus
+    table_repository: AbstractTableRepository | None = None
+
+    def get_table_schema(self, table_name: str, definition: str) -> list[dict[str, Any]] | None:
+        """Gets the schema of a table if it was built from `definition`, None otherwise.
+
+        Table metadata is cached by the repository and read again by the sync, so this saves
+        dry running queries whose definition has not changed.
+        """
+        if self.table_repository is None:
+            return None
+        try:
+            metadata: value_objects.TableMetadata = self.table_repository.get_table_metadata(
+                table_name=table_name
+            )
+        except exceptions.TableDoesNotExistError:
+            return None
+        if metadata.definition != self.table_repository.format_definition(definition=definition):
+            return None
+        return list(metadata.schema)
 
     def sync_partitioned_table(  # noqa: PLR0913
         self,
@@ -22,14 +43,18 @@ class Entrypoint:
         definition: str,
         upstream_table_names: list[str],
         query_renderer: Callable[[str, dict | None], str],
+        backfill_concurrency: int = 1,
+        backfill_batch_size: int = 1,
     ) -> None:
         expected_metadata = value_objects.TableConfig(
             table_name=table_name,
             schema=schema,
             partition_field=partition_field,
-            partitions=partitions,
+            partitions=value_objects.Partitions.from_partitions(partitions),
             definition=definition,
             upstream_table_names=upstream_table_names,
+            backfill_concurrency=backfill_concurrency,
+            backfill_batch_size=backfill_batch_size,
         )
         cmd = commands.SyncPartitionedTable(
             expected_metadata=expected_metadata, query_renderer=query_renderer
@@ -54,10 +79,13 @@ class Entrypoint:
     def from_config(cls, config: configs.BootstrapConfig) -> Self:
         return cls(
             bus=bootstrap.bootstrap_from_config(config=config),
+            table_repository=config.table_repository,
         )
 
     @classmethod
     def from_default(cls) -> Self:
+        config: configs.BootstrapConfig = configs.get_default_config()
         return cls(
-            bus=bootstrap.bootstrap_from_config(config=configs.DEFAULT_CONFIG),
+            bus=bootstrap.bootstrap_from_config(config=config),
+            table_repository=config.table_repository,
         )
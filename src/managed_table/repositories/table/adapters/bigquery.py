@@ -1,7 +1,11 @@
 import datetime
+import threading
+import time
+from collections.abc import Callable, Collection, Mapping
+from concurrent import futures
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from google.api_core import exceptions as google_exceptions
 from google.cloud.bigquery import client as bq_client
@@ -17,9 +21,12 @@ from src.managed_table.repositories.table import base, exceptions
 
 logger = utils.get_logger(name='bigquery_table_repository')
 
-
-def default_client() -> bq_client.Client:
-    return bq_client.Client(project=environment.BQ_BILLING_PROJECT)
+# jobs are looked up by creation time, which is set by BigQuery rather than by this machine
+JOB_CLOCK_SKEW: Final[datetime.timedelta] = datetime.timedelta(minutes=5)
+# longer than any single write or copy is expected to take, so a lost job cannot hang a sync
+JOB_TIMEOUT: Final[datetime.timedelta] = datetime.timedelta(hours=6)
+# raised by the batched partition write when a partition's query returns no rows
+NO_DATA_MESSAGE: Final[str] = 'Queries returned no data for partitions: '
 
 
 class QueryReturnedNoDataError(Exception):
@@ -28,7 +35,25 @@ class QueryReturnedNoDataError(Exception):
 
 @dataclass
 class BigQueryTableRepository(base.AbstractTableRepository):
-    client: bq_client.Client = field(default_factory=default_client)
+    """BigQuery backed table repository.
+
+    Table resources and partition listings are cached per table name for the lifetime of the
+    repository, so repeated metadata checks during a sync only hit the API once per table.
+    Write paths invalidate the cache entries of the tables they modify.
+
+    The first partition listing in a dataset scans `INFORMATION_SCHEMA.PARTITIONS` for the whole
+    dataset and caches the partitions of every table in it. Tables written to or created after
+    that scan are listed on their own.
+    """
+
+    client: bq_client.Client = field(default_factory=utils.default_client)
+    _table_cache: dict[str, bq_table.Table] = field(default_factory=dict, init=False, repr=False)
+    _partition_cache: dict[str, dict[str, value_objects.PartitionStats]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _scanned_datasets: set[tuple[str, str]] = field(default_factory=set, init=False, repr=False)
+    # guards the caches above, which concurrent partition writes update from pool threads
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def get_table_metadata(self, table_name: str) -> value_objects.TableMetadata:
         try:
@@ -36,7 +61,9 @@ class BigQueryTableRepository(base.AbstractTableRepository):
                 table_name=table_name,
                 schema=self._get_schema(table_name=table_name),
                 partition_field=self._get_partition_field(table_name=table_name),
-                partitions=self._get_partitions(table_name=table_name),
+                partitions=value_objects.Partitions.from_partitions(
+                    self._get_partitions(table_name=table_name)
+                ),
                 definition=self._get_definition(table_name=table_name),
                 created=self._get_creation_time(table_name=table_name),
                 updated=self._get_last_update_time(table_name=table_name),
@@ -78,8 +105,66 @@ class BigQueryTableRepository(base.AbstractTableRepository):
         return table.modified
 
     def _get_table(self, table_name: str) -> bq_table.Table:
+        if (table := self._table_cache.get(table_name)) is not None:
+            return table
         table_id: str = self._convert_table_name_to_id(table_name=table_name)
-        return self.client.get_table(table=table_id)
+        table = self.client.get_table(table=table_id)
+        with self._cache_lock:
+            self._table_cache[table_name] = table
+        return table
+
+    def invalidate_cache(self, table_name: str) -> None:
+        """Drops all cached metadata for the given table."""
+        with self._cache_lock:
+            self._table_cache.pop(table_name, None)
+            self._partition_cache.pop(table_name, None)
+
+    def clear_cache(self) -> None:
+        """Drops all cached metadata."""
+        with self._cache_lock:
+            self._table_cache.clear()
+            self._partition_cache.clear()
+            self._scanned_datasets.clear()
+
+    def get_table_timestamps(
+        self, table_names: Collection[str]
+    ) -> dict[str, value_objects.TableTimestamps]:
+        """Gets table timestamps from the table cache, or with one query per dataset for tables
+        that are not cached. Partitions are not listed."""
+        timestamps: dict[str, value_objects.TableTimestamps] = {
+            table_name: value_objects.TableTimestamps(
+                table_name=table_name,
+                created=self._get_creation_time(table_name=table_name),
+                updated=self._get_last_update_time(table_name=table_name),
+            )
+            for table_name in table_names
+            if table_name in self._table_cache
+        }
+        uncached_tables: dict[tuple[str, str], dict[str, str]] = {}
+        for table_name in table_names:
+            if table_name not in timestamps:
+                project, dataset, table = self._convert_table_name_to_id(
+                    table_name=table_name
+                ).split('.', maxsplit=2)
+                uncached_tables.setdefault((project, dataset), {})[table] = table_name
+
+        for (project, dataset), tables in uncached_tables.items():
+            job: bq_job.QueryJob = self.client.query(
+                query=utils.read_template(
+                    Path(__file__).parent / 'templates' / 'get_table_timestamps.sql.jinja2',
+                    template_fields={'project': project, 'dataset': dataset, 'tables': tables},
+                )
+            )
+            for row in job.result():
+                table_name: str = tables[row['table_id']]
+                timestamps[table_name] = value_objects.TableTimestamps(
+                    table_name=table_name, created=row['created'], updated=row['updated']
+                )
+
+        if missing_tables := sorted(set(table_names) - timestamps.keys()):
+            msg: str = f'Tables: {missing_tables} do not exist.'
+            raise exceptions.TableDoesNotExistError(msg)
+        return timestamps
 
     def table_exists(self, table_name: str) -> None:
         try:
@@ -89,8 +174,30 @@ class BigQueryTableRepository(base.AbstractTableRepository):
             raise exceptions.TableDoesNotExistError(msg) from e
 
     def _get_partitions(self, table_name: str) -> list[str]:
-        project, dataset, table = self._convert_table_name_to_id(table_name=table_name).split('.')
+        return sorted(self.get_partition_stats(table_name=table_name))
 
+    def get_partition_stats(self, table_name: str) -> dict[str, value_objects.PartitionStats]:
+        """Gets partitions from the dataset's partition listing. Tables missing from the listing,
+        including tables that do not exist, have no partitions."""
+        if (partition_stats := self._partition_cache.get(table_name)) is not None:
+            return dict(partition_stats)
+        project, dataset, table = self._convert_table_name_to_id(table_name=table_name).split(
+            '.', maxsplit=2
+        )
+        if (project, dataset) in self._scanned_datasets:
+            self._list_partitions(project=project, dataset=dataset, table=table)
+        else:
+            self._list_partitions(project=project, dataset=dataset)
+        with self._cache_lock:
+            self._scanned_datasets.add((project, dataset))
+            # tables missing from the listing have no partitions
+            return dict(self._partition_cache.setdefault(table_name, {}))
+
+    def _list_partitions(self, project: str, dataset: str, table: str | None = None) -> None:
+        """Caches the partitions of `table`, or of every table in the dataset if not given.
+
+        Table names are the table ids of the dataset, see `_convert_table_name_to_id`.
+        """
         job: bq_job.QueryJob = self.client.query(
             query=utils.read_template(
                 Path(__file__).parent / 'templates' / 'get_partitions.sql.jinja2',
@@ -101,7 +208,21 @@ class BigQueryTableRepository(base.AbstractTableRepository):
                 },
             )
         )
-        return sorted([row['days'].strftime('%Y-%m-%d') for row in job.result()])
+        partition_stats: dict[str, dict[str, value_objects.PartitionStats]] = (
+            {table: {}} if table else {}
+        )
+        for row in job.result():
+            table_partitions = partition_stats.setdefault(row['table_name'], {})
+            if row['day'] is not None:
+                partition: str = row['day'].strftime('%Y-%m-%d')
+                table_partitions[partition] = value_objects.PartitionStats(
+                    partition=partition,
+                    last_modified=row['last_modified_time'],
+                    total_rows=row['total_rows'],
+                )
+        with self._cache_lock:
+            for table_name, table_partitions in partition_stats.items():
+                self._partition_cache[table_name] = dict(sorted(table_partitions.items()))
 
     def create_table(self, table_config: value_objects.TableConfig) -> None:
         schema_fields: list[bq_schema.SchemaField] = self._convert_schema_to_schema_fields(
@@ -118,6 +239,22 @@ class BigQueryTableRepository(base.AbstractTableRepository):
         )
         table.labels = {'definition': self.format_definition(definition=table_config.definition)}
         self.client.create_table(table=table)
+        self.invalidate_cache(table_name=table_config.table_name)
+
+    def add_columns(self, table_name: str, columns: Collection[dict[str, Any]]) -> None:
+        table: bq_table.Table = self._get_table(table_name=table_name)
+        table.schema = [*table.schema, *self._convert_schema_to_schema_fields(schema=columns)]
+        self.client.update_table(table=table, fields=['schema'])
+        self.invalidate_cache(table_name=table_name)
+        logger.info(
+            f'Added columns: {[column["name"] for column in columns]} to table: {table_name}'
+        )
+
+    def update_definition(self, table_name: str, definition: str) -> None:
+        table: bq_table.Table = self._get_table(table_name=table_name)
+        table.labels = {**table.labels, 'definition': self.format_definition(definition=definition)}
+        self.client.update_table(table=table, fields=['labels'])
+        self.invalidate_cache(table_name=table_name)
 
     def _convert_schema_to_schema_fields(self, schema):
         return [bq_schema.SchemaField.from_api_repr(field) for field in schema]
@@ -128,6 +265,21 @@ class BigQueryTableRepository(base.AbstractTableRepository):
         destination_table_name: str,
         expires: datetime.datetime | None = None,
     ) -> None:
+        self._finish_copy_table(
+            job=self._start_copy_table(
+                source_table_name=source_table_name,
+                destination_table_name=destination_table_name,
+                expires=expires,
+            ),
+            destination_table_name=destination_table_name,
+        )
+
+    def _start_copy_table(
+        self,
+        source_table_name: str,
+        destination_table_name: str,
+        expires: datetime.datetime | None = None,
+    ) -> bq_job.CopyJob:
         logger.info(
             f'Copying source table: {source_table_name} to destination table: {destination_table_name}'
         )
@@ -141,7 +293,11 @@ class BigQueryTableRepository(base.AbstractTableRepository):
             job_config=job_config,
         )
         logger.info(f'Job id: {job.job_id}. Link: {job.self_link}')
+        return job
+
+    def _finish_copy_table(self, job: bq_job.CopyJob, destination_table_name: str) -> None:
         job.result()
+        self.invalidate_cache(table_name=destination_table_name)
         if job.error_result:
             raise Exception(f'Copy job failed. Job metadata: {job}')
         logger.info('Copy complete.')
@@ -150,8 +306,21 @@ class BigQueryTableRepository(base.AbstractTableRepository):
         self.client.delete_table(
             table=self._convert_table_name_to_id(table_name=table_name), not_found_ok=not_found_ok
         )
+        self.invalidate_cache(table_name=table_name)
 
     def write_query_results_to_table_partition(self, table_name: str, query: str, partition: str):
+        self._finish_table_partition_write(
+            job=self._start_table_partition_write(
+                table_name=table_name, query=query, partition=partition
+            ),
+            table_name=table_name,
+            query=query,
+            partition=partition,
+        )
+
+    def _start_table_partition_write(
+        self, table_name: str, query: str, partition: str
+    ) -> bq_job.QueryJob:
         destination: str = '$'.join(
             [
                 self._convert_table_name_to_id(table_name=table_name),
@@ -164,24 +333,106 @@ class BigQueryTableRepository(base.AbstractTableRepository):
             job_config=self._get_query_job_config(destination=destination),
         )
         logger.info(f'Writing query results to table. Job id: {job.job_id}. Link: {job.self_link}.')
+        return job
+
+    def _finish_table_partition_write(
+        self, job: bq_job.QueryJob, table_name: str, query: str, partition: str
+    ) -> None:
         result = job.result()
         if result.total_rows == 0:
+            self.invalidate_cache(table_name=table_name)
             msg = f'Attempted to write to partition: {partition} in table: {table_name}, but the query returned no data.\n Query: {query}'
             raise QueryReturnedNoDataError(msg)
+        partition_stats = value_objects.PartitionStats(
+            partition=partition,
+            last_modified=job.ended or datetime.datetime.now(tz=datetime.UTC),
+            total_rows=result.total_rows,
+        )
+        # a non-empty partition write only replaces this partition, so the listing can be
+        # patched. Concurrent writes to the same table patch it one at a time.
+        with self._cache_lock:
+            self._table_cache.pop(table_name, None)
+            if (cached_partitions := self._partition_cache.get(table_name)) is not None:
+                self._partition_cache[table_name] = dict(
+                    sorted({**cached_partitions, partition: partition_stats}.items())
+                )
+
+    def write_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ):
+        self._finish_table_partitions_write(
+            job=self._start_table_partitions_write(
+                table_name=table_name,
+                partition_field=partition_field,
+                partition_queries=partition_queries,
+            ),
+            table_name=table_name,
+            partitions=sorted(partition_queries),
+        )
+
+    def _start_table_partitions_write(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ) -> bq_job.QueryJob:
+        partitions: list[str] = sorted(partition_queries)
+        job = self.client.query(
+            query=utils.read_template(
+                Path(__file__).parent / 'templates' / 'merge_partitions.sql.jinja2',
+                template_fields={
+                    'table_id': self._convert_table_name_to_id(table_name=table_name),
+                    'partition_field': partition_field,
+                    'partitions': partitions,
+                    'no_data_message': NO_DATA_MESSAGE,
+                    'queries': [
+                        partition_queries[partition].strip().rstrip(';') for partition in partitions
+                    ],
+                },
+            ),
+            job_config=bq_job.QueryJobConfig(
+                priority=enums.QueryPriority.INTERACTIVE,
+                use_query_cache=False,
+                use_legacy_sql=False,
+            ),
+        )
+        logger.info(
+            f'Merging query results into {len(partitions)} partitions of table: {table_name}. Job id: {job.job_id}. Link: {job.self_link}.'
+        )
+        return job
+
+    def _finish_table_partitions_write(
+        self, job: bq_job.QueryJob, table_name: str, partitions: list[str]
+    ) -> None:
+        # the script raises before merging if any partition's query returned no rows, as the
+        # merge would otherwise delete that partition
+        try:
+            job.result()
+        except google_exceptions.GoogleAPICallError as e:
+            if NO_DATA_MESSAGE not in str(e):
+                raise
+            msg = f'Attempted to write to partitions: {partitions[0]} to {partitions[-1]} in table: {table_name}, but the queries returned no data. {e.message}'
+            raise QueryReturnedNoDataError(msg) from e
+        finally:
+            self.invalidate_cache(table_name=table_name)
 
     def write_query_results_to_table(self, table_name: str, query: str):
-        self.client.query(
+        self._finish_table_write(
+            job=self._start_table_write(table_name=table_name, query=query), table_name=table_name
+        )
+
+    def _start_table_write(self, table_name: str, query: str) -> bq_job.QueryJob:
+        return self.client.query(
             query=query,
             job_config=self._get_query_job_config(
                 destination=self._convert_table_name_to_id(table_name=table_name)
             ),
-        ).result()
+        )
+
+    def _finish_table_write(self, job: bq_job.QueryJob, table_name: str) -> None:
+        job.result()
+        self.invalidate_cache(table_name=table_name)
 
     # TODO: format_definitionegression test to ensure definitions are compared
     def format_definition(self, definition: str) -> str:
-        return str(utils.hash_string(string=definition))[
-            :63
-        ]  # bq labels have to be < 63 characters
+        return utils.hash_definition(definition=definition)
 
     @staticmethod
     def _convert_table_name_to_id(table_name: str) -> str:
@@ -200,3 +451,198 @@ class BigQueryTableRepository(base.AbstractTableRepository):
             use_query_cache=False,
             use_legacy_sql=False,
         )
+
+
+@dataclass
+class _WatchedJob:
+    job: bq_job.CopyJob | bq_job.QueryJob
+    on_done: Callable[[Any], None]
+    future: futures.Future[None]
+    submitted_at: datetime.datetime
+
+
+@dataclass
+class BigQueryJobPoller:
+    """Completes futures of BigQuery jobs, polling the state of all watched jobs at once.
+
+    Every `poll_interval` seconds, a single background thread lists the jobs that finished since
+    the oldest watched job was submitted. This is one request per page of jobs, however many
+    jobs are watched. The thread stops when no jobs are left to watch.
+
+    Jobs not done within `job_timeout` of being watched are cancelled and fail with a
+    `TimeoutError`. Should polling fail for any reason other than an API error, all watched jobs
+    fail with that error.
+    """
+
+    client: bq_client.Client
+    poll_interval: float = 1.0
+    job_timeout: datetime.timedelta = JOB_TIMEOUT
+    _jobs: dict[str, _WatchedJob] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _thread: threading.Thread | None = field(default=None, init=False, repr=False)
+
+    def watch(
+        self, job: bq_job.CopyJob | bq_job.QueryJob, on_done: Callable[[Any], None]
+    ) -> futures.Future[None]:
+        """Calls `on_done` with the job once it has finished, completing the returned future
+        with its result."""
+        if job.job_id is None:
+            msg: str = f'Cannot watch a job without a job id: {job}'
+            raise ValueError(msg)
+        future: futures.Future[None] = futures.Future()
+        with self._lock:
+            self._jobs[job.job_id] = _WatchedJob(
+                job=job,
+                on_done=on_done,
+                future=future,
+                submitted_at=datetime.datetime.now(tz=datetime.UTC),
+            )
+            if self._thread is None:
+                self._start_thread()
+        return future
+
+    def _start_thread(self) -> None:
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+
+    def _poll(self) -> None:
+        failed: list[_WatchedJob] = []
+        error: Exception | None = None
+        try:
+            while self._poll_once():
+                pass
+        except Exception as e:
+            logger.exception('Failed to poll BigQuery jobs, failing all watched jobs.')
+            error = e
+        finally:
+            with self._lock:
+                if error is not None:
+                    failed = list(self._jobs.values())
+                    self._jobs.clear()
+                self._thread = None
+                # jobs watched after the last poll need a thread of their own
+                if self._jobs:
+                    self._start_thread()
+        if error is not None:
+            for watched_job in failed:
+                watched_job.future.set_exception(error)
+
+    def _poll_once(self) -> bool:
+        """Completes the jobs that finished or timed out, returning whether any are left."""
+        time.sleep(self.poll_interval)
+        with self._lock:
+            if not self._jobs:
+                return False
+            since: datetime.datetime = min(job.submitted_at for job in self._jobs.values())
+
+        try:
+            done_job_ids: set[str] = self._get_done_job_ids(since=since - JOB_CLOCK_SKEW)
+        except google_exceptions.GoogleAPICallError:
+            logger.exception('Failed to poll BigQuery jobs, retrying.')
+            done_job_ids = set()
+        deadline: datetime.datetime = datetime.datetime.now(tz=datetime.UTC) - self.job_timeout
+        with self._lock:
+            done: list[_WatchedJob] = [
+                self._jobs.pop(job_id) for job_id in done_job_ids & self._jobs.keys()
+            ]
+            timed_out: dict[str, _WatchedJob] = {
+                job_id: self._jobs.pop(job_id)
+                for job_id, watched_job in list(self._jobs.items())
+                if watched_job.submitted_at < deadline
+            }
+        for watched_job in done:
+            self._complete(watched_job=watched_job)
+        for job_id, watched_job in timed_out.items():
+            # the job could otherwise still write after its write has been retried
+            self._cancel(job_id=job_id, location=watched_job.job.location)
+            msg: str = f'Job: {job_id} did not finish within {self.job_timeout}.'
+            watched_job.future.set_exception(TimeoutError(msg))
+        return True
+
+    def _cancel(self, job_id: str, location: str | None) -> None:
+        try:
+            self.client.cancel_job(job_id=job_id, location=location)
+        except Exception:
+            logger.exception(f'Failed to cancel job: {job_id}.')
+
+    def _get_done_job_ids(self, since: datetime.datetime) -> set[str]:
+        return {
+            job.job_id
+            for job in self.client.list_jobs(state_filter='done', min_creation_time=since)
+        }
+
+    @staticmethod
+    def _complete(watched_job: _WatchedJob) -> None:
+        try:
+            watched_job.on_done(watched_job.job)
+        except Exception as e:
+            watched_job.future.set_exception(e)
+        else:
+            watched_job.future.set_result(None)
+
+
+@dataclass
+class AsyncBigQueryTableRepository(BigQueryTableRepository, base.AbstractAsyncTableRepository):
+    """BigQuery table repository that submits writes and copies without waiting on them.
+
+    Finished jobs are found by a shared `BigQueryJobPoller`, whose thread completes the futures
+    returned by the `submit_*` methods, so writes in flight do not each hold a thread.
+    """
+
+    poll_interval: float = 1.0
+    job_timeout: datetime.timedelta = JOB_TIMEOUT
+    _poller: BigQueryJobPoller = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._poller = BigQueryJobPoller(
+            client=self.client, poll_interval=self.poll_interval, job_timeout=self.job_timeout
+        )
+
+    def submit_copy_table(
+        self,
+        source_table_name: str,
+        destination_table_name: str,
+        expires: datetime.datetime | None = None,
+    ) -> futures.Future[None]:
+        return self._poller.watch(
+            job=self._start_copy_table(
+                source_table_name=source_table_name,
+                destination_table_name=destination_table_name,
+                expires=expires,
+            ),
+            on_done=lambda job: self._finish_copy_table(
+                job=job, destination_table_name=destination_table_name
+            ),
+        )
+
+    def submit_query_results_to_table_partition(
+        self, table_name: str, query: str, partition: str
+    ) -> futures.Future[None]:
+        return self._poller.watch(
+            job=self._start_table_partition_write(
+                table_name=table_name, query=query, partition=partition
+            ),
+            on_done=lambda job: self._finish_table_partition_write(
+                job=job, table_name=table_name, query=query, partition=partition
+            ),
+        )
+
+    def submit_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ) -> futures.Future[None]:
+        return self._poller.watch(
+            job=self._start_table_partitions_write(
+                table_name=table_name,
+                partition_field=partition_field,
+                partition_queries=partition_queries,
+            ),
+            on_done=lambda job: self._finish_table_partitions_write(
+                job=job, table_name=table_name, partitions=sorted(partition_queries)
+            ),
+        )
+
+    def submit_query_results_to_table(self, table_name: str, query: str) -> futures.Future[None]:
+        return self._poller.watch(
+            job=self._start_table_write(table_name=table_name, query=query),
+            on_done=lambda job: self._finish_table_write(job=job, table_name=table_name),
+        )
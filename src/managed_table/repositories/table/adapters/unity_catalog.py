@@ -1,9 +1,11 @@
 import datetime
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.catalog import TableInfo
+from databricks.sdk.service.sql import StatementResponse
 
 from src.common import environment
 from src.managed_table import utils
@@ -31,7 +33,9 @@ class UnityCatalogTableRepository(base.AbstractTableRepository):
                 table_name=table_name,
                 schema=self._get_schema(table_name=table_name),
                 partition_field=self._get_partition_field(table_name=table_name),
-                partitions=self._get_partitions(table_name=table_name),
+                partitions=value_objects.Partitions.from_partitions(
+                    self._get_partitions(table_name=table_name)
+                ),
                 definition=self._get_definition(table_name=table_name),
                 created=self._get_creation_time(table_name=table_name),
                 updated=self._get_last_update_time(table_name=table_name),
@@ -71,11 +75,17 @@ class UnityCatalogTableRepository(base.AbstractTableRepository):
         return table_info.columns[0].name or ''
 
     def _get_partitions(self, table_name: str) -> list[str]:
-        table_info = self._get_table(table_name=table_name)
+        partition_field: str = self._get_partition_field(table_name=table_name)
+        select_sql = (
+            f'SELECT DISTINCT CAST({partition_field} AS DATE) FROM {table_name} '
+            f'WHERE {partition_field} IS NOT NULL'
+        )
+        response = self._execute_statement(statement=select_sql)
+        rows: list[list[str]] = (response.result and response.result.data_array) or []
+        return sorted(row[0] for row in rows if row and row[0])
 
-        if hasattr(table_info, 'columns') and table_info.columns:
-            return [col.name for col in table_info.columns if col.name]
-        return []
+    def _execute_statement(self, statement: str) -> StatementResponse:
+        return self.client.statement_execution.execute(statement)  # pyright: ignore[reportAttributeAccessIssue]
 
     def _get_creation_time(self, table_name: str) -> datetime.datetime:
         table_info: TableInfo = self._get_table(table_name=table_name)
@@ -135,9 +145,57 @@ class UnityCatalogTableRepository(base.AbstractTableRepository):
         insert_sql = f'INSERT INTO {table_name} PARTITION ({partition}) {query}'
         self.client.statement_execution.execute(insert_sql)
 
+    def write_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ) -> None:
+        partitions: list[str] = sorted(partition_queries)
+        query = ' UNION ALL '.join(f'({partition_queries[partition]})' for partition in partitions)
+        # REPLACE WHERE would empty a partition whose query returned no rows, so every
+        # partition is checked for data before anything is replaced
+        if partitions_without_data := self._get_partitions_without_data(
+            partition_field=partition_field, partitions=partitions, query=query
+        ):
+            msg = f'Attempted to write to partitions: {", ".join(partitions_without_data)} in table: {table_name}, but their queries returned no data.'
+            raise QueryReturnedNoDataError(msg)
+
+        literals = ', '.join(f"'{partition}'" for partition in partitions)
+        insert_sql = (
+            f'INSERT INTO {table_name} '
+            f'REPLACE WHERE CAST({partition_field} AS DATE) IN ({literals}) {query}'
+        )
+        self._execute_statement(statement=insert_sql)
+
+    def _get_partitions_without_data(
+        self, partition_field: str, partitions: list[str], query: str
+    ) -> list[str]:
+        rows_sql = ', '.join(f"('{partition}')" for partition in partitions)
+        select_sql = (
+            f'SELECT partition_date FROM VALUES {rows_sql} AS expected(partition_date) '
+            f'WHERE CAST(partition_date AS DATE) NOT IN '
+            f'(SELECT CAST({partition_field} AS DATE) FROM ({query}) AS source '
+            f'WHERE {partition_field} IS NOT NULL)'
+        )
+        response = self._execute_statement(statement=select_sql)
+        rows: list[list[str]] = (response.result and response.result.data_array) or []
+        return [row[0] for row in rows if row and row[0]]
+
     def write_query_results_to_table(self, table_name: str, query: str) -> None:
         insert_sql = f'INSERT INTO {table_name} {query}'
         self.client.statement_execution.execute(insert_sql)
 
+    def add_columns(self, table_name: str, columns: Collection[dict[str, Any]]) -> None:
+        alter_sql = f"""
+        ALTER TABLE {table_name} ADD COLUMNS (
+            {", ".join(f"{col['name']} {col['type']}" for col in columns)}
+        )
+        """.strip()
+        self._execute_statement(statement=alter_sql)
+
+    def update_definition(self, table_name: str, definition: str) -> None:
+        comment_sql = (
+            f"COMMENT ON TABLE {table_name} IS '{self.format_definition(definition=definition)}'"
+        )
+        self._execute_statement(statement=comment_sql)
+
     def format_definition(self, definition: str) -> str:
-        return str(utils.hash_string(string=definition))[:63]
+        return utils.hash_definition(definition=definition)
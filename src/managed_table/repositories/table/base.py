@@ -1,5 +1,8 @@
 import abc
 import datetime
+from collections.abc import Collection, Mapping
+from concurrent import futures
+from typing import Any
 
 from src.managed_table.domain import value_objects
 
@@ -32,8 +35,115 @@ class AbstractTableRepository(abc.ABC):
         self, table_name: str, query: str, partition: str
     ): ...
 
+    @abc.abstractmethod
+    def write_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ): ...
+
     @abc.abstractmethod
     def write_query_results_to_table(self, table_name: str, query: str): ...
 
     @abc.abstractmethod
     def format_definition(self, definition: str) -> str: ...
+
+    @abc.abstractmethod
+    def add_columns(self, table_name: str, columns: Collection[dict[str, Any]]) -> None:
+        """Appends nullable columns to a table's schema, leaving its data in place."""
+
+    @abc.abstractmethod
+    def update_definition(self, table_name: str, definition: str) -> None:
+        """Records the definition a table was built from, see `format_definition`."""
+
+    def clear_cache(self) -> None:
+        """Drops cached table metadata. Repositories without a cache have nothing to drop."""
+
+    def get_table_timestamps(
+        self, table_names: Collection[str]
+    ) -> dict[str, value_objects.TableTimestamps]:
+        """Gets when tables were created and last updated, keyed by table name.
+
+        Raises `TableDoesNotExistError` if any of the tables does not exist. Repositories that
+        can read timestamps without the rest of the metadata should override this.
+        """
+        timestamps: dict[str, value_objects.TableTimestamps] = {}
+        for table_name in table_names:
+            metadata: value_objects.TableMetadata = self.get_table_metadata(table_name=table_name)
+            timestamps[table_name] = value_objects.TableTimestamps(
+                table_name=table_name, created=metadata.created, updated=metadata.updated
+            )
+        return timestamps
+
+    def get_partition_stats(self, table_name: str) -> dict[str, value_objects.PartitionStats]:
+        """Gets the non-empty partitions of a table, keyed by partition.
+
+        Repositories that do not track partitions individually report the table's last update
+        as the last modification of every partition, and no row counts.
+        """
+        metadata: value_objects.TableMetadata = self.get_table_metadata(table_name=table_name)
+        return {
+            partition: value_objects.PartitionStats(
+                partition=partition, last_modified=metadata.updated
+            )
+            for partition in metadata.partitions
+        }
+
+
+class AbstractAsyncTableRepository(AbstractTableRepository):
+    """Table repository whose writes are submitted without waiting for them to finish.
+
+    Each `submit_*` method returns a future that completes once the write has finished, so many
+    writes can be in flight without a thread waiting on each. The blocking writes of
+    `AbstractTableRepository` wait on these futures.
+    """
+
+    @abc.abstractmethod
+    def submit_copy_table(
+        self,
+        source_table_name: str,
+        destination_table_name: str,
+        expires: datetime.datetime | None = None,
+    ) -> futures.Future[None]: ...
+
+    @abc.abstractmethod
+    def submit_query_results_to_table_partition(
+        self, table_name: str, query: str, partition: str
+    ) -> futures.Future[None]: ...
+
+    @abc.abstractmethod
+    def submit_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ) -> futures.Future[None]: ...
+
+    @abc.abstractmethod
+    def submit_query_results_to_table(
+        self, table_name: str, query: str
+    ) -> futures.Future[None]: ...
+
+    def copy_table(
+        self,
+        source_table_name: str,
+        destination_table_name: str,
+        expires: datetime.datetime | None = None,
+    ):
+        self.submit_copy_table(
+            source_table_name=source_table_name,
+            destination_table_name=destination_table_name,
+            expires=expires,
+        ).result()
+
+    def write_query_results_to_table_partition(self, table_name: str, query: str, partition: str):
+        self.submit_query_results_to_table_partition(
+            table_name=table_name, query=query, partition=partition
+        ).result()
+
+    def write_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ):
+        self.submit_query_results_to_table_partitions(
+            table_name=table_name,
+            partition_field=partition_field,
+            partition_queries=partition_queries,
+        ).result()
+
+    def write_query_results_to_table(self, table_name: str, query: str):
+        self.submit_query_results_to_table(table_name=table_name, query=query).result()
@@ -0,0 +1,14 @@
+class PartitionUpdatesFailedError(Exception):
+    def __init__(
+        self, table_name: str, failed: dict[str, Exception], skipped: list[str] | None = None
+    ) -> None:
+        self.table_name: str = table_name
+        self.failed: dict[str, Exception] = failed
+        self.skipped: list[str] = skipped or []
+        failures: str = '\n'.join(
+            f'\t{partition}: {error!r}' for partition, error in sorted(failed.items())
+        )
+        super().__init__(
+            f'Failed to update {len(failed)} partition(s) of table: {table_name}, '
+            f'skipped {len(self.skipped)} dependent partition(s).\n{failures}'
+        )
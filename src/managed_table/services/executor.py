@@ -0,0 +1,113 @@
+"Concurrent execution of ordered chains of work."
+
+from collections.abc import Callable, Iterator, Sequence
+from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+from src.managed_table import utils
+
+logger = utils.get_logger('executor')
+
+Item = TypeVar('Item')
+
+
+@dataclass
+class ExecutionReport(Generic[Item]):
+    """Outcome of every item submitted to `execute_chains`."""
+
+    completed: list[Item] = field(default_factory=list)
+    failed: list[tuple[Item, Exception]] = field(default_factory=list)
+    skipped: list[Item] = field(default_factory=list)
+
+    def merge(self, other: 'ExecutionReport[Item]') -> None:
+        self.completed.extend(other.completed)
+        self.failed.extend(other.failed)
+        self.skipped.extend(other.skipped)
+
+
+def execute_chains(
+    chains: Sequence[Sequence[Item]],
+    action: Callable[[Item], None],
+    max_concurrency: int,
+) -> ExecutionReport[Item]:
+    """Runs `action` on every item, chain by chain.
+
+    Items within a chain are run in order and a failure skips the rest of its chain. Chains are
+    independent of each other and run on a pool of `max_concurrency` threads, so at most
+    `max_concurrency` actions are in flight at once. Failures never cancel other chains.
+    """
+    report: ExecutionReport[Item] = ExecutionReport()
+    with futures.ThreadPoolExecutor(max_workers=max(max_concurrency, 1)) as pool:
+        for chain_future in futures.as_completed(
+            [pool.submit(_execute_chain, chain, action) for chain in chains]
+        ):
+            report.merge(chain_future.result())
+    return report
+
+
+def execute_submitted_chains(
+    chains: Sequence[Sequence[Item]],
+    submit: Callable[[Item], futures.Future[None]],
+    max_concurrency: int,
+) -> ExecutionReport[Item]:
+    """Like `execute_chains`, for actions that are submitted and complete a future when done.
+
+    The calling thread submits the next item of a chain when the future of its previous item
+    completes, so `max_concurrency` chains are in flight without a thread per chain.
+    """
+    report: ExecutionReport[Item] = ExecutionReport()
+    max_chains: int = max(max_concurrency, 1)
+    pending_chains: Iterator[Sequence[Item]] = iter(chains)
+    # items to submit next, each holding the place of its chain among the chains in flight
+    ready: list[tuple[Sequence[Item], int]] = []
+    # each in flight future maps to its chain and the position of its item in the chain
+    in_flight: dict[futures.Future[None], tuple[Sequence[Item], int]] = {}
+
+    def _fail(chain: Sequence[Item], position: int, error: Exception) -> None:
+        logger.error(f'Failed to execute: {chain[position]}', exc_info=error)
+        report.failed.append((chain[position], error))
+        report.skipped.extend(chain[position + 1 :])
+
+    while True:
+        while (
+            len(in_flight) + len(ready) < max_chains
+            and (chain := next(pending_chains, None)) is not None
+        ):
+            if chain:
+                ready.append((chain, 0))
+        if not ready and not in_flight:
+            return report
+
+        for chain, position in ready:
+            try:
+                in_flight[submit(chain[position])] = (chain, position)
+            except Exception as e:
+                _fail(chain=chain, position=position, error=e)
+        ready.clear()
+        if not in_flight:
+            continue
+
+        done, _ = futures.wait(in_flight, return_when=futures.FIRST_COMPLETED)
+        for future in done:
+            chain, position = in_flight.pop(future)
+            if (error := future.exception()) is not None:
+                _fail(chain=chain, position=position, error=error)  # pyright: ignore[reportArgumentType]
+            else:
+                report.completed.append(chain[position])
+                if position + 1 < len(chain):
+                    ready.append((chain, position + 1))
+
+
+def _execute_chain(chain: Sequence[Item], action: Callable[[Item], None]) -> ExecutionReport[Item]:
+    report: ExecutionReport[Item] = ExecutionReport()
+    for position, item in enumerate(chain):
+        try:
+            action(item)
+        except Exception as e:
+            logger.exception(f'Failed to execute: {item}')
+            report.failed.append((item, e))
+            report.skipped.extend(chain[position + 1 :])
+            break
+        report.completed.append(item)
+    return report
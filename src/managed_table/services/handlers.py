@@ -1,12 +1,23 @@
-from collections.abc import Callable, MutableSequence, Sequence
-from datetime import datetime
+import itertools
+import re
+from collections.abc import Callable, Sequence
+from concurrent import futures
+from datetime import date, datetime, timedelta
 from typing import Any
 
+from src.managed_table import utils
 from src.managed_table.domain import commands, errors, events, value_objects
 from src.managed_table.repositories.config.base import AbstractTableConfigRepository
 from src.managed_table.repositories.query.base import AbstractQueryRepository
 from src.managed_table.repositories.table import exceptions
-from src.managed_table.repositories.table.base import AbstractTableRepository
+from src.managed_table.repositories.table.base import (
+    AbstractAsyncTableRepository,
+    AbstractTableRepository,
+)
+from src.managed_table.services import exceptions as service_exceptions
+from src.managed_table.services import executor
+
+logger = utils.get_logger(name='handlers')
 
 
 def trigger_table_creation(
@@ -24,6 +35,12 @@ def trigger_backfill_plan(
     )
 
 
+def trigger_stale_partitions_backfill_plan(
+    error: errors.NewUpstreamDependenciesSinceLastUpdate,
+) -> commands.PlanBackfill:
+    return commands.PlanBackfill(table_name=error.table_name, partitions=error.stale_partitions)
+
+
 def trigger_sideload_plan(
     error: (errors.PartitionFieldDoesNotMatchExpectation | errors.SchemaDoesNotMatchExpectation),
 ) -> commands.PlanSideload:
@@ -106,47 +123,29 @@ def check_table_partitions(
     table_config_repository: AbstractTableConfigRepository,
     table_repository: AbstractTableRepository,
 ) -> errors.Error | events.Event:
-    table_partitions: Sequence[str] = table_repository.get_table_metadata(
-        table_name=cmd.table_name
-    ).partitions
-    table_config_partitions: Sequence[str] = table_config_repository.get_table_config(
-        table_name=cmd.table_name
-    ).partitions
-
-    if table_config_partitions:
-        config_start_date = datetime.strptime(min(table_config_partitions), '%Y-%m-%d')
-
-        past_excess_partitions = [
-            partition
-            for partition in table_partitions
-            if datetime.strptime(partition, '%Y-%m-%d') < config_start_date
-        ]
+    diff = value_objects.PartitionDiff.from_partitions(
+        expected=table_config_repository.get_table_config(table_name=cmd.table_name).partitions,
+        actual=table_repository.get_table_metadata(table_name=cmd.table_name).partitions,
+    )
 
-        if past_excess_partitions:
-            return errors.ExistingPartitionsExceedExpectations(table_name=cmd.table_name)
-    if table_partitions != table_config_partitions:
+    if diff.excess_past:
+        return errors.ExistingPartitionsExceedExpectations(table_name=cmd.table_name)
+    if diff.missing:
         return errors.PartitionsDoNotMatchExpectation(
-            table_name=cmd.table_name,
-            missing_partitions=[
-                partition
-                for partition in table_config_partitions
-                if partition not in table_partitions
-            ],
+            table_name=cmd.table_name, missing_partitions=diff.missing
         )
+    if diff.excess_future:
+        # partitions past the expected range are left for a later run day to claim
+        logger.info(f'Table: {cmd.table_name} has partitions beyond expected: {diff.excess_future}')
     return events.TablePartitionsUpToDate(table_name=cmd.table_name)
 
 
-# TODO: add logic for backfilling recursive tables, e.g. if missing partitions are discontinuous
 def check_table_state(
     cmd: commands.CheckTableState, table_config_repository: AbstractTableConfigRepository
 ) -> Sequence[commands.Command | events.Event]:
     table_config_repository.add_table_config(table_config=cmd.expected_metadata)
     return [
         commands.CheckTableExists(table_name=cmd.expected_metadata.table_name),
-        commands.CheckForNewUpstreamDependencies(
-            table_name=cmd.expected_metadata.table_name,
-            upstream_table_names=cmd.expected_metadata.upstream_table_names,
-        ),
         commands.CheckTableDefinition(
             table_name=cmd.expected_metadata.table_name,
         ),
@@ -157,6 +156,11 @@ def check_table_state(
             table_name=cmd.expected_metadata.table_name,
             expected_schema=cmd.expected_metadata.schema,
         ),
+        # stale partitions are backfilled in place, so only once the table's shape is up to date
+        commands.CheckForNewUpstreamDependencies(
+            table_name=cmd.expected_metadata.table_name,
+            upstream_table_names=cmd.expected_metadata.upstream_table_names,
+        ),
         commands.CheckTablePartitionsAreNotEmpty(table_name=cmd.expected_metadata.table_name),
         commands.CheckTablePartitions(
             table_name=cmd.expected_metadata.table_name,
@@ -191,17 +195,41 @@ def create_table(
 def check_for_new_upstream_dependencies(
     cmd: commands.CheckForNewUpstreamDependencies,
     table_repository: AbstractTableRepository,
-):
-    upstream_tables: list[value_objects.TableMetadata] = [
-        table_repository.get_table_metadata(table_name) for table_name in cmd.upstream_table_names
-    ]
-    downstream_table: value_objects.TableMetadata = table_repository.get_table_metadata(
+) -> errors.NewUpstreamDependenciesSinceLastUpdate | events.NoNewUpstreamDependencies:
+    """Finds partitions of the table last modified before the upstream data they are built from.
+
+    A partition is built from the partitions of the same day in its upstream tables. Upstream
+    tables without that partition, e.g. unpartitioned tables, only make it stale by being
+    recreated after it was last modified.
+    """
+    # raises for missing tables, so partitions are only listed for tables that exist
+    timestamps: dict[str, value_objects.TableTimestamps] = table_repository.get_table_timestamps(
+        table_names=[*cmd.upstream_table_names, cmd.table_name]
+    )
+    partitions: dict[str, value_objects.PartitionStats] = table_repository.get_partition_stats(
         table_name=cmd.table_name
     )
-    if any(
-        [upstream_table.created > downstream_table.updated for upstream_table in upstream_tables]
-    ):
-        return errors.NewUpstreamDependenciesSinceLastUpdate(table_name=cmd.table_name)
+    stale_partitions: set[str] = set()
+    for upstream_table_name in cmd.upstream_table_names:
+        upstream_partitions: dict[str, value_objects.PartitionStats] = (
+            table_repository.get_partition_stats(table_name=upstream_table_name)
+        )
+        for partition, stats in partitions.items():
+            upstream_modified: datetime = timestamps[upstream_table_name].created
+            if upstream_partition := upstream_partitions.get(partition):
+                upstream_modified = max(upstream_modified, upstream_partition.last_modified)
+            if upstream_modified > stats.last_modified:
+                stale_partitions.add(partition)
+
+    if stale_partitions:
+        logger.info(
+            f'Table: {cmd.table_name} has {len(stale_partitions)} partitions older than their '
+            f'upstream data: {sorted(stale_partitions)}'
+        )
+        return errors.NewUpstreamDependenciesSinceLastUpdate(
+            table_name=cmd.table_name,
+            stale_partitions=value_objects.Partitions.from_partitions(stale_partitions),
+        )
     return events.NoNewUpstreamDependencies(table_name=cmd.table_name)
 
 
@@ -221,10 +249,32 @@ def plan_sideload(
     cmd: commands.PlanSideload,
     query_repository: AbstractQueryRepository,
     table_config_repository: AbstractTableConfigRepository,
+    table_repository: AbstractTableRepository,
 ) -> Sequence[commands.Command]:
     table_config: value_objects.TableConfig = table_config_repository.get_table_config(
         table_name=cmd.table_name
     )
+    table_metadata: value_objects.TableMetadata = table_repository.get_table_metadata(
+        table_name=cmd.table_name
+    )
+    if new_columns := _get_additive_columns(
+        table_config=table_config, table_metadata=table_metadata
+    ):
+        # the table keeps its data and its existing partitions are rebuilt in place, which
+        # avoids copying the whole table but gives up the atomic swap of a sideload: until the
+        # backfill finishes readers see a mix of partitions with and without the new columns'
+        # values, and a failure part way leaves the table mixed until the next sync, which finds
+        # the columns already added and rebuilds the table through a full sideload
+        logger.info(f'Table: {cmd.table_name} only gains nullable columns, rebuilding in place.')
+        return [
+            commands.AddTableColumns(table_name=cmd.table_name, columns=new_columns),
+            commands.PlanBackfill(
+                table_name=cmd.table_name,
+                partitions=value_objects.Partitions.from_partitions(table_metadata.partitions),
+            ),
+            commands.UpdateTableDefinition(table_name=cmd.table_name),
+        ]
+
     sideload_table_name: str = f'{cmd.table_name}_sideload_{query_repository.get_query_hash(query_name=table_config.table_name)}'
     backup_table_name: str = f'{cmd.table_name}_backup'
 
@@ -237,6 +287,8 @@ def plan_sideload(
         partition_field=table_config.partition_field,
         partitions=table_config.partitions,
         definition=table_config.definition,
+        backfill_concurrency=table_config.backfill_concurrency,
+        backfill_batch_size=table_config.backfill_batch_size,
     )
 
     return [
@@ -253,6 +305,52 @@ def plan_sideload(
     ]
 
 
+def _get_additive_columns(
+    table_config: value_objects.TableConfig, table_metadata: value_objects.TableMetadata
+) -> list[dict[str, Any]]:
+    """Gets the columns the config appends to the table's schema, if the table can be brought up
+    to date by adding them and rebuilding its existing partitions.
+
+    That is when only nullable columns are appended to an otherwise unchanged, non-empty schema,
+    the partition field is unchanged, and the table holds no partitions the config does not
+    expect.
+    """
+    schema: list[dict[str, Any]] = list(table_metadata.schema)
+    expected_schema: list[dict[str, Any]] = list(table_config.schema)
+    if (
+        not schema
+        or not table_metadata.partition_field
+        or table_metadata.partition_field != table_config.partition_field
+        or expected_schema[: len(schema)] != schema
+        or value_objects.Partitions.from_partitions(table_metadata.partitions)
+        - value_objects.Partitions.from_partitions(table_config.partitions)
+    ):
+        return []
+    new_columns: list[dict[str, Any]] = expected_schema[len(schema) :]
+    if any(column.get('mode', 'NULLABLE').upper() != 'NULLABLE' for column in new_columns):
+        return []
+    return new_columns
+
+
+def add_table_columns(
+    cmd: commands.AddTableColumns, table_repository: AbstractTableRepository
+) -> events.TableColumnsAdded:
+    table_repository.add_columns(table_name=cmd.table_name, columns=cmd.columns)
+    return events.TableColumnsAdded(table_name=cmd.table_name, columns=cmd.columns)
+
+
+def update_table_definition(
+    cmd: commands.UpdateTableDefinition,
+    table_config_repository: AbstractTableConfigRepository,
+    table_repository: AbstractTableRepository,
+) -> events.TableDefinitionUpdated:
+    table_repository.update_definition(
+        table_name=cmd.table_name,
+        definition=table_config_repository.get_table_config(table_name=cmd.table_name).definition,
+    )
+    return events.TableDefinitionUpdated(table_name=cmd.table_name)
+
+
 def replace_table(cmd: commands.ReplaceTable) -> Sequence[commands.Command | events.Event]:
     return [
         commands.DeleteTable(table_name=cmd.table_name),
@@ -266,21 +364,117 @@ def replace_table(cmd: commands.ReplaceTable) -> Sequence[commands.Command | eve
 def plan_backfill(
     cmd: commands.PlanBackfill,
     query_repository: AbstractQueryRepository,
+    table_config_repository: AbstractTableConfigRepository,
 ) -> Sequence[commands.Command]:
-    cmds: MutableSequence[commands.Command] = []
-    for partition in cmd.partitions:
-        cmds.append(
-            commands.UpdateTablePartition(
-                table_name=cmd.table_name,
-                query=query_repository.get_query(
-                    query_name=cmd.table_name,
-                    run_day=partition,
-                    run_time_template_fields={'table_name': cmd.table_name},
-                ),
-                partition=partition,
-            )
+    table_config: value_objects.TableConfig = table_config_repository.get_table_config(
+        table_name=cmd.table_name
+    )
+    updates: dict[str, commands.UpdateTablePartition] = {
+        partition: _get_partition_update(
+            table_name=cmd.table_name, partition=partition, query_repository=query_repository
+        )
+        for partition in sorted(cmd.partitions)
+    }
+    if updates and any(
+        _is_self_referential(table_name=cmd.table_name, query=update.query)
+        for update in updates.values()
+    ):
+        # partitions built from the previous partition are stale after any gap, so the
+        # table is rebuilt from its earliest gap onwards instead of from its start date.
+        earliest_gap: str = min(updates)
+        for partition in table_config.partitions:
+            if partition > earliest_gap and partition not in updates:
+                updates[partition] = _get_partition_update(
+                    table_name=cmd.table_name,
+                    partition=partition,
+                    query_repository=query_repository,
+                )
+        updates = dict(sorted(updates.items()))
+
+    chains: list[list[commands.UpdateTablePartition | commands.UpdateTablePartitionBatch]] = (
+        _batch_independent_partitions(
+            chains=_get_partition_chains(updates=list(updates.values())),
+            table_config=table_config,
         )
-    return cmds
+    )
+    if table_config.backfill_concurrency <= 1:
+        return list(itertools.chain.from_iterable(chains))
+    return [
+        commands.UpdateTablePartitions(
+            table_name=cmd.table_name,
+            chains=chains,
+            max_concurrency=table_config.backfill_concurrency,
+        )
+    ]
+
+
+def _get_partition_update(
+    table_name: str, partition: str, query_repository: AbstractQueryRepository
+) -> commands.UpdateTablePartition:
+    return commands.UpdateTablePartition(
+        table_name=table_name,
+        query=query_repository.get_query(
+            query_name=table_name,
+            run_day=partition,
+            run_time_template_fields={'table_name': table_name},
+        ),
+        partition=partition,
+    )
+
+
+def _is_self_referential(table_name: str, query: str) -> bool:
+    """Whether the query reads from the table it writes to, e.g. recursive templates."""
+    return re.search(pattern=rf'\.`?{re.escape(table_name)}\b', string=query) is not None
+
+
+def _get_partition_chains(
+    updates: Sequence[commands.UpdateTablePartition],
+) -> list[list[commands.UpdateTablePartition]]:
+    """Groups date ordered partition updates into chains that must run sequentially.
+
+    A self-referential update depends on the update of the previous day, if it is part of the
+    backfill. All other updates start a chain of their own and can run in parallel.
+    """
+    chains: list[list[commands.UpdateTablePartition]] = []
+    for update in updates:
+        if (
+            chains
+            and _is_self_referential(table_name=update.table_name, query=update.query)
+            and date.fromisoformat(chains[-1][-1].partition) + timedelta(days=1)
+            == date.fromisoformat(update.partition)
+        ):
+            chains[-1].append(update)
+        else:
+            chains.append([update])
+    return chains
+
+
+def _batch_independent_partitions(
+    chains: list[list[commands.UpdateTablePartition]], table_config: value_objects.TableConfig
+) -> list[list[commands.UpdateTablePartition | commands.UpdateTablePartitionBatch]]:
+    """Merges consecutive single partition chains into batches written by one query job."""
+    batched_chains: list[
+        list[commands.UpdateTablePartition | commands.UpdateTablePartitionBatch]
+    ] = [list(chain) for chain in chains if len(chain) > 1]
+    independent_updates: list[commands.UpdateTablePartition] = [
+        chain[0] for chain in chains if len(chain) == 1
+    ]
+    batch_size: int = max(table_config.backfill_batch_size, 1)
+    for start in range(0, len(independent_updates), batch_size):
+        batch: list[commands.UpdateTablePartition] = independent_updates[start : start + batch_size]
+        if len(batch) == 1:
+            batched_chains.append([batch[0]])
+        else:
+            batched_chains.append(
+                [
+                    commands.UpdateTablePartitionBatch(
+                        table_name=table_config.table_name,
+                        partition_field=table_config.partition_field,
+                        updates=batch,
+                    )
+                ]
+            )
+    return sorted(batched_chains, key=lambda chain: _get_partitions(update=chain[0])[0])
 
 
 def update_table_partition(
@@ -290,10 +484,110 @@ def update_table_partition(
         table_name=cmd.table_name, query=cmd.query, partition=cmd.partition
     )
     return events.TablePartitionUpdated(
-        table_name=cmd.table_name, query=cmd.query, partition=cmd.partition
+        table_name=cmd.table_name,
+        query_hash=utils.hash_definition(definition=cmd.query),
+        partition=cmd.partition,
+    )
+
+
+def update_table_partition_batch(
+    cmd: commands.UpdateTablePartitionBatch, table_repository: AbstractTableRepository
+) -> events.TablePartitionsUpdated:
+    table_repository.write_query_results_to_table_partitions(
+        table_name=cmd.table_name,
+        partition_field=cmd.partition_field,
+        partition_queries={update.partition: update.query for update in cmd.updates},
+    )
+    return events.TablePartitionsUpdated(
+        table_name=cmd.table_name,
+        partitions=value_objects.Partitions.from_partitions(
+            update.partition for update in cmd.updates
+        ),
+    )
+
+
+def update_table_partitions(
+    cmd: commands.UpdateTablePartitions, table_repository: AbstractTableRepository
+) -> events.TablePartitionsUpdated:
+    def _update(update: commands.UpdateTablePartition | commands.UpdateTablePartitionBatch):
+        match update:
+            case commands.UpdateTablePartitionBatch():
+                update_table_partition_batch(cmd=update, table_repository=table_repository)
+            case commands.UpdateTablePartition():
+                update_table_partition(cmd=update, table_repository=table_repository)
+            case _:
+                raise NotImplementedError(f'Cannot update partitions with: {type(update)}')
+
+    report: executor.ExecutionReport[
+        commands.UpdateTablePartition | commands.UpdateTablePartitionBatch
+    ]
+    if isinstance(table_repository, AbstractAsyncTableRepository):
+        # writes are in flight as submitted jobs, instead of each holding a thread
+        report = executor.execute_submitted_chains(
+            chains=cmd.chains,
+            submit=lambda update: _submit_update(update=update, table_repository=table_repository),
+            max_concurrency=cmd.max_concurrency,
+        )
+    else:
+        report = executor.execute_chains(
+            chains=cmd.chains, action=_update, max_concurrency=cmd.max_concurrency
+        )
+    if report.failed:
+        raise service_exceptions.PartitionUpdatesFailedError(
+            table_name=cmd.table_name,
+            failed={
+                partition: error
+                for update, error in report.failed
+                for partition in _get_partitions(update=update)
+            },
+            skipped=sorted(
+                partition
+                for update in report.skipped
+                for partition in _get_partitions(update=update)
+            ),
+        )
+    return events.TablePartitionsUpdated(
+        table_name=cmd.table_name,
+        partitions=value_objects.Partitions.from_partitions(
+            partition for update in report.completed for partition in _get_partitions(update=update)
+        ),
     )
 
 
+def _submit_update(
+    update: commands.UpdateTablePartition | commands.UpdateTablePartitionBatch,
+    table_repository: AbstractAsyncTableRepository,
+) -> futures.Future[None]:
+    match update:
+        case commands.UpdateTablePartitionBatch():
+            return table_repository.submit_query_results_to_table_partitions(
+                table_name=update.table_name,
+                partition_field=update.partition_field,
+                partition_queries={
+                    partition_update.partition: partition_update.query
+                    for partition_update in update.updates
+                },
+            )
+        case commands.UpdateTablePartition():
+            return table_repository.submit_query_results_to_table_partition(
+                table_name=update.table_name, query=update.query, partition=update.partition
+            )
+        case _:
+            raise NotImplementedError(f'Cannot update partitions with: {type(update)}')
+
+
+def _get_partitions(
+    update: commands.UpdateTablePartition | commands.UpdateTablePartitionBatch,
+) -> list[str]:
+    match update:
+        case commands.UpdateTablePartitionBatch(updates=updates):
+            return [partition_update.partition for partition_update in updates]
+        case commands.UpdateTablePartition(partition=partition):
+            return [partition]
+        case _:
+            raise NotImplementedError(f'Cannot get partitions of: {type(update)}')
+
+
 def delete_table(cmd: commands.DeleteTable, table_repository: AbstractTableRepository):
     table_repository.delete_table(table_name=cmd.table_name, not_found_ok=cmd.not_found_ok)
     return events.TableDeleted(table_name=cmd.table_name)
@@ -340,6 +634,8 @@ ErrorHandlers = dict[type[errors.Error], Callable[..., commands.Command]]
 default_command_handlers: CommandHandlers = {
     commands.CheckTableState: check_table_state,
     commands.UpdateTablePartition: update_table_partition,
+    commands.UpdateTablePartitions: update_table_partitions,
+    commands.UpdateTablePartitionBatch: update_table_partition_batch,
     commands.PlanBackfill: plan_backfill,
     commands.CreateTable: create_table,
     commands.CopyTable: copy_table,
@@ -354,6 +650,8 @@ default_command_handlers: CommandHandlers = {
     commands.CheckForNewUpstreamDependencies: check_for_new_upstream_dependencies,
     commands.AddQuery: add_query,
     commands.ReplaceTable: replace_table,
+    commands.AddTableColumns: add_table_columns,
+    commands.UpdateTableDefinition: update_table_definition,
     commands.SyncPartitionedTable: sync_partitioned_table,
     commands.SyncUnpartitionedTable: sync_unpartitioned_table,
 }
@@ -365,7 +663,7 @@ default_error_handlers: ErrorHandlers = {
     errors.SchemaDoesNotMatchExpectation: trigger_sideload_plan,
     errors.DefinitionDoesNotMatchExpectation: trigger_sideload_plan,
     errors.TableDoesNotExist: trigger_table_creation,
-    errors.NewUpstreamDependenciesSinceLastUpdate: trigger_sideload_plan,
+    errors.NewUpstreamDependenciesSinceLastUpdate: trigger_stale_partitions_backfill_plan,
     # TODO: ExistingPartitionsExceedExpectations handling needs to be formalized.
     # Do we always want to sideload if existing table has excess partition?
     # (usually occurs when start date is moved up.)
@@ -1,7 +1,10 @@
+import collections
 import functools
-from collections.abc import Callable, Sequence
+import os
+from collections import deque
+from collections.abc import Callable, Hashable, Sequence
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Final
 
 from src.managed_table import utils
 from src.managed_table.domain.commands import Command
@@ -17,75 +20,127 @@ from src.managed_table.services.handlers import (
 
 logger = utils.get_logger('message_bus')
 
+# number of most recently dispatched messages summarised in `MessageBus.log`
+DEFAULT_LOG_SIZE: Final[int] = int(os.environ.get('ALGO_FEATURES_MESSAGE_LOG_SIZE', default='1000'))
+
+
+Handler = Callable[..., Message | Sequence[Message] | None]
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    """Summary of a dispatched message, without the SQL, schemas or configs it may carry."""
+
+    message_type: str
+    table_name: str | None = None
+    partition: str | None = None
+
+    @classmethod
+    def from_message(cls, message: Message) -> 'LogEntry':
+        return cls(
+            message_type=type(message).__name__,
+            table_name=getattr(message, 'table_name', None),
+            partition=getattr(message, 'partition', None),
+        )
+
 
 @dataclass
 class MessageBus:
+    """Dispatches messages depth first from a single work queue.
+
+    Responses are handled before the rest of the queue, in the order they were returned. When
+    a handler responds with an error, its message is queued to be retried after the error has
+    been handled. Each message is retried at most `max_retries` times, messages being told
+    apart by equality.
+
+    `log` keeps a `LogEntry` for each of the last `log_size` messages dispatched, rather than
+    the messages themselves, which may hold rendered SQL. Messages carry hashes of the SQL they
+    ran rather than the SQL itself, or leave it out of their repr.
+    """
+
     event_handlers: EventHandlers
     command_handlers: CommandHandlers
     error_handlers: ErrorHandlers
-    log: list[Message] = field(default_factory=list)
-    retry_count: int = 0
+    log_size: int = DEFAULT_LOG_SIZE
+    max_retries: int = 4
+    log: deque[LogEntry] = field(init=False, repr=False, compare=False)
+    _handlers: dict[type, Handler] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.log = deque(maxlen=self.log_size)
+        self._handlers = {**self.event_handlers, **self.command_handlers, **self.error_handlers}
 
     def dispatch(self, message: Message) -> None:
-        message_queue: list[Message] = [message]
-        dead_letter_queue: list[Message] = []
-        while queue := (dead_letter_queue or message_queue):
+        # used as a stack, the most recently queued message is handled first
+        queue: deque[Message] = deque([message])
+        retries: collections.Counter[Hashable] = collections.Counter()
+        while queue:
             message = queue.pop()
 
-            self.log.append(message)
-            logger.info(message)
+            entry = LogEntry.from_message(message=message)
+            self.log.append(entry)
+            logger.info(
+                'Handling %s',
+                message,
+                extra={'message_type': entry.message_type, 'table_name': entry.table_name},
+            )
             if response := self.handle(message=message):
                 if isinstance(response, Error):
-                    if self.retry_count <= 3:
-                        self.retry_count += 1
-                        extend_queue(message, dead_letter_queue)
-                        self.dispatch(message=response)
-                    else:
+                    retry_key: Hashable = _get_retry_key(message=message)
+                    if retries[retry_key] >= self.max_retries:
                         # log the error/ maximum retries reached
                         # terminate processing
                         raise SystemExit('Maximum number of retries reached, terminating program')
-                else:
-                    if not isinstance(response, Command):
-                        self.retry_count = 0
-                    extend_queue(response, queue)
+                    retries[retry_key] += 1
+                    queue.append(message)
+                extend_queue(response, queue)
 
-    def handle(self, message: Message) -> Message | Sequence[Message]:
-        handler: Callable[..., Message | Sequence[Message]] = self.get_handler(message=message)
+    def handle(self, message: Message) -> Message | Sequence[Message] | None:
+        handler: Handler = self.get_handler(message=message)
         return handler(message)
 
-    def get_handler(self, message: Message) -> Callable[..., Message | Sequence[Message]]:
+    def get_handler(self, message: Message) -> Handler:
+        handler: Handler | None = self._handlers.get(type(message))
+        if handler is not None:
+            return handler
         match message:
             case Event():
-                return self.event_handlers.get(type(message), handlers.complete_event_loop)
-
-            case Command():
-                return self.command_handlers[type(message)]
-            case Error():
-                return self.error_handlers[type(message)]
+                return handlers.complete_event_loop
+            case Command() | Error():
+                raise KeyError(type(message))
             case _:
                 raise NotImplementedError(f'No handler exists for object of type: {type(message)}')
 
 
+def _get_retry_key(message: Message) -> Hashable:
+    try:
+        hash(message)
+    except TypeError:
+        # e.g. commands holding schemas or query renderers, which compare by value
+        return (type(message), repr(message))
+    return message
+
+
 @functools.singledispatch
-def extend_queue(candidate: Any, queue: list[Message]) -> None:
+def extend_queue(candidate: Any, queue: deque[Message]) -> None:
     raise NotImplementedError(f'Unable to extend queue for type: {type(candidate)}')
 
 
 @extend_queue.register
-def _(candidate: list, queue: list[Message]) -> None:
+def _(candidate: list, queue: deque[Message]) -> None:
     queue.extend(reversed(candidate))
 
 
 @extend_queue.register
-def _(candidate: Event, queue: list[Message]) -> None:
+def _(candidate: Event, queue: deque[Message]) -> None:
     queue.append(candidate)
 
 
 @extend_queue.register
-def _(candidate: Command, queue: list[Message]) -> None:
+def _(candidate: Command, queue: deque[Message]) -> None:
     queue.append(candidate)
 
 
 @extend_queue.register
-def _(candidate: Error, queue: list[Message]) -> None:
+def _(candidate: Error, queue: deque[Message]) -> None:
     queue.append(candidate)
@@ -1,51 +1,26 @@
 import hashlib
 import logging
-from pathlib import Path
-from typing import Any, NoReturn
+from typing import TYPE_CHECKING
 
-import jinja2
-from google.cloud.bigquery import client as bq_client
-from google.cloud.bigquery import job, schema
+from src.common import clients, templates
 
-from src.common import environment
+if TYPE_CHECKING:
+    from google.cloud.bigquery import schema
 
+TemplateException = templates.TemplateException
+raise_template_exception = templates.raise_template_exception
+jinja2_environment = templates.jinja2_environment
+read_template = templates.read_template
 
-class TemplateException(Exception):
-    pass
 
-
-def raise_template_exception(message: str) -> NoReturn:
-    raise TemplateException(message)
-
-
-jinja2_environment = jinja2.environment.Environment()
-jinja2_environment.globals['raise_template_exception'] = raise_template_exception
-
-
-def read_template(template_path: Path, template_fields: dict[str, Any] | None = None) -> str:
-    """Function for reading and formatting a jinja template.
-
-    Args:
-        template_path (list[str]): path to the template
-        template_fields (Optional[dict], optional): fields to template. Defaults to None.
-
-    Returns:
-        (str): formatted template
-    """
-
-    with template_path.open() as file:
-        template: jinja2.Template = jinja2_environment.from_string(source=file.read())
-        rendered: str = template.render(**(template_fields or {}))
-    return rendered
-
-
-def default_client() -> bq_client.Client:
-    return bq_client.Client(project=environment.BQ_BILLING_PROJECT)
+default_client = clients.get_bigquery_client
 
 
 def get_schema_from_query_dry_run(
     query: str,
-) -> list[schema.SchemaField]:
+) -> 'list[schema.SchemaField]':
+    from google.cloud.bigquery import job, schema  # noqa: PLC0415
+
     client = default_client()
     query_job: job.QueryJob = client.query(
         query=query,
@@ -94,3 +69,7 @@ def hash_string(string: str) -> int:
             16,
         )
     )
+
+
+def hash_definition(definition: str) -> str:
+    return str(hash_string(string=definition))[:63]  # bq labels have to be < 63 characters
@@ -0,0 +1,97 @@
+"Concurrent execution of DAG nodes as soon as their dependencies finish."
+
+from collections.abc import Callable
+from concurrent import futures
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Generic
+
+from src.pipelines._internal import graph
+
+
+@dataclass(frozen=True)
+class NodeRun(Generic[graph.NodeType]):
+    """Record of a single node having been run."""
+
+    node: graph.NodeType
+    started_at: datetime
+    ended_at: datetime
+    error: Exception | None = None
+
+
+def execute_dag(
+    dag: graph.DAG[graph.NodeType],
+    action: Callable[[graph.NodeType], None],
+    max_concurrency: int,
+    on_finished: Callable[[NodeRun[graph.NodeType]], None] | None = None,
+) -> list[NodeRun[graph.NodeType]]:
+    """Runs `action` on every node of `dag`, starting each node once its dependencies finish.
+
+    At most `max_concurrency` nodes run at once, on a pool of threads. Dependencies on nodes
+    outside of the DAG are treated as already satisfied. Once a node fails no further nodes are
+    started, nodes already running are waited for, and the first failure is raised.
+
+    Args:
+        on_finished: called with each run as it finishes, including failed runs
+
+    Returns:
+        list[NodeRun]: runs in the order they finished
+    """
+    node_map: dict[str, graph.NodeType] = dag.node_map
+    # topological order also decides which of several ready nodes is started first
+    order: dict[str, int] = {node.name: position for position, node in enumerate(dag)}
+    pending: dict[str, set[str]] = {
+        node.name: {dependency for dependency in node.depends_on if dependency in order}
+        for node in dag.nodes
+    }
+    dependents: dict[str, list[str]] = {name: [] for name in order}
+    for name, dependencies in pending.items():
+        for dependency in dependencies:
+            dependents[dependency].append(name)
+
+    max_workers: int = max(max_concurrency, 1)
+    ready: list[str] = sorted(
+        (name for name, deps in pending.items() if not deps), key=order.__getitem__
+    )
+    runs: list[NodeRun[graph.NodeType]] = []
+    error: Exception | None = None
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # each running future maps to the name of its node
+        running: dict[futures.Future[NodeRun[graph.NodeType]], str] = {}
+        while ready or running:
+            while ready and len(running) < max_workers:
+                name: str = ready.pop(0)
+                running[pool.submit(_run_node, node_map[name], action)] = name
+
+            done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in sorted(done, key=lambda future: order[running[future]]):
+                del running[future]
+                run: NodeRun[graph.NodeType] = future.result()
+                runs.append(run)
+                if on_finished is not None:
+                    on_finished(run)
+                if run.error is not None:
+                    error = error or run.error
+                for dependent in dependents[run.node.name]:
+                    pending[dependent].discard(run.node.name)
+                    if not pending[dependent] and run.error is None:
+                        ready.append(dependent)
+
+            if error is not None:
+                ready.clear()
+            ready.sort(key=order.__getitem__)
+
+    if error is not None:
+        raise error
+    return runs
+
+
+def _run_node(
+    node: graph.NodeType, action: Callable[[graph.NodeType], None]
+) -> NodeRun[graph.NodeType]:
+    started_at: datetime = datetime.now(tz=UTC)
+    try:
+        action(node)
+    except Exception as e:
+        return NodeRun(node=node, started_at=started_at, ended_at=datetime.now(tz=UTC), error=e)
+    return NodeRun(node=node, started_at=started_at, ended_at=datetime.now(tz=UTC))
@@ -20,40 +20,78 @@ NodeType = TypeVar('NodeType', bound=Node)
 
 @dataclass
 class DAG(Generic[NodeType]):
-    """DAG Class."""
+    """DAG Class.
+
+    The graph and the name index are built on first use and kept up to date by `add_node` and
+    `add_dependency`. Any other change to `nodes`, or to their dependencies, needs a call to
+    `invalidate`.
+    """
 
     nodes: list[NodeType]
-    _graph: nx.DiGraph = field(default_factory=nx.DiGraph)
+    _graph: nx.DiGraph | None = field(default=None, init=False, repr=False, compare=False)
+    _node_map: dict[str, NodeType] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __getitem__(self, key: str) -> NodeType:
         return self.node_map[key]
 
     def __iter__(self) -> Iterator[NodeType]:
+        node_map: dict[str, NodeType] = self.node_map
         for node in nx.topological_sort(G=self.graph):
-            yield self.node_map[node]
+            # dependencies on nodes outside of the DAG are edges, but not nodes to yield
+            if node in node_map:
+                yield node_map[node]
 
     @property
     def graph(self) -> nx.DiGraph:
         """Internal networkx DiGraph."""
-
-        for node in self.nodes:
-            self._graph.add_node(node_for_adding=node.name)
-            if node.depends_on:
-                self._graph.add_edges_from(
-                    ebunch_to_add=set(zip(node.depends_on, itertools.repeat(object=node.name)))
-                )
+        if self._graph is None:
+            self._graph = nx.DiGraph()
+            for node in self.nodes:
+                _add_to_graph(graph=self._graph, node=node)
         return self._graph
 
     @property
     def node_map(self) -> dict[str, NodeType]:
-        return {node.name: node for node in self.nodes}
+        if self._node_map is None:
+            self._node_map = {node.name: node for node in self.nodes}
+        return self._node_map
 
     @property
     def roots(self) -> list[str]:
         """Gets roots of DAG."""
-        return [node for node in self.graph.nodes() if self.graph.in_degree(nbunch=node) == 0]
+        graph: nx.DiGraph = self.graph
+        return [node for node, degree in graph.in_degree() if degree == 0]
 
     @property
     def leaves(self) -> list[str]:
         """Gets leaf nodes of DAG."""
-        return [node for node in self.graph.nodes() if self.graph.out_degree(nbunch=node) == 0]
+        graph: nx.DiGraph = self.graph
+        return [node for node, degree in graph.out_degree() if degree == 0]
+
+    def add_node(self, node: NodeType) -> None:
+        self.nodes.append(node)
+        if self._node_map is not None:
+            self._node_map[node.name] = node
+        if self._graph is not None:
+            _add_to_graph(graph=self._graph, node=node)
+
+    def add_dependency(self, node_name: str, dependency: str) -> None:
+        """Makes the node named `node_name` depend on `dependency`."""
+        self.node_map[node_name].depends_on.append(dependency)
+        if self._graph is not None:
+            self._graph.add_edge(u_of_edge=dependency, v_of_edge=node_name)
+
+    def invalidate(self) -> None:
+        """Drops the graph and the name index, so they are rebuilt from `nodes` on next use."""
+        self._graph = None
+        self._node_map = None
+
+
+def _add_to_graph(graph: nx.DiGraph, node: Node) -> None:
+    graph.add_node(node_for_adding=node.name)
+    if node.depends_on:
+        graph.add_edges_from(
+            ebunch_to_add=set(zip(node.depends_on, itertools.repeat(object=node.name)))
+        )
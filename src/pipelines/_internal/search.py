@@ -1,17 +1,108 @@
 "Utility functions for searching for and parsing python objects in directories."
 
 import ast
+import functools
+import hashlib
 import importlib
+import json
+import os
 import sys
+import tempfile
 import types
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import Any, Final, NoReturn
 
 ROOT: Path = Path(__file__).parent.parent
 
 SEARCH_EXCLUSIONS: set[Path] = {Path('.venv'), Path('venv'), Path('.*'), Path('*.ipynb')}
 
+# Directory to persist function indexes in, so unchanged files are not parsed again by other
+# processes. Indexes are only kept in memory when unset.
+INDEX_CACHE_DIR: Final[str | None] = os.environ.get('ALGO_FEATURES_FUNCTION_INDEX_CACHE')
+
+
+@dataclass(frozen=True)
+class FunctionIndex:
+    """Functions defined in the python files under a directory, keyed by function name.
+
+    Each name maps to the module path of the first file, in search order, that defines it.
+    `files` records the modification time, size and defined functions of every file, so a
+    persisted index only parses files that have changed since it was written.
+    """
+
+    directory: Path
+    functions: Mapping[str, str]
+    files: Mapping[str, tuple[int, int, tuple[str, ...]]]
+
+    @classmethod
+    def build(
+        cls,
+        directory: Path,
+        previous_files: Mapping[str, tuple[int, int, tuple[str, ...]]] | None = None,
+    ) -> 'FunctionIndex':
+        functions: dict[str, str] = {}
+        files: dict[str, tuple[int, int, tuple[str, ...]]] = {}
+        for path in directory.rglob(pattern='*.py'):
+            relative_path: Path = path.relative_to(directory)
+            if _is_excluded(relative_path=relative_path):
+                continue
+            stat: os.stat_result = path.stat()
+            previous = (previous_files or {}).get(relative_path.as_posix())
+            if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                defined_functions: tuple[str, ...] = previous[2]
+            else:
+                defined_functions = _get_defined_functions(path=path)
+            files[relative_path.as_posix()] = (stat.st_mtime_ns, stat.st_size, defined_functions)
+
+            module_path: str = module_path_from_pathlib_path(
+                full_module_path=directory, base_path=path
+            )
+            for name in defined_functions:
+                functions.setdefault(name, module_path)
+        return cls(directory=directory, functions=functions, files=files)
+
+    @classmethod
+    def load(cls, directory: Path, cache_dir: Path) -> 'FunctionIndex':
+        """Builds the index, reusing and then updating the one persisted in `cache_dir`."""
+        cache_path: Path = cache_dir / f'{hashlib.md5(str(directory).encode()).hexdigest()}.json'
+        try:
+            with cache_path.open() as file:
+                previous_files = {
+                    name: (mtime, size, tuple(functions))
+                    for name, (mtime, size, functions) in json.load(fp=file).items()
+                }
+        except (OSError, ValueError):
+            previous_files = None
+
+        index: FunctionIndex = cls.build(directory=directory, previous_files=previous_files)
+        if index.files != previous_files:
+            index._write(cache_path=cache_path)
+        return index
+
+    def get_function(self, name: str) -> Callable[..., Any] | NoReturn:
+        if name not in self.functions:
+            raise NotImplementedError(
+                f'Action: {name} not found in any subdirectory of action_path: {self.directory}'
+            )
+        if str(self.directory) not in sys.path:
+            sys.path.insert(0, str(self.directory))
+        module: types.ModuleType = importlib.import_module(name=self.functions[name])
+        return getattr(module, name)
+
+    def _write(self, cache_path: Path) -> None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode='w', dir=cache_path.parent, suffix='.tmp', delete=False
+            ) as file:
+                json.dump(obj=self.files, fp=file)
+            os.replace(src=file.name, dst=cache_path)
+        except OSError:
+            # the cache is an optimisation, a read-only filesystem should not fail the search
+            pass
+
 
 def find_function(name: str, directory: Path) -> Callable[..., Any] | NoReturn:
     """
@@ -28,28 +119,24 @@ def find_function(name: str, directory: Path) -> Callable[..., Any] | NoReturn:
         Callable[..., Any]: the requested function, if found.
     """
     base = Path(__file__).parent.parent.parent.parent
-    directory = base / directory
+    return get_function_index(directory=base / directory).get_function(name=name)
+
+
+@functools.cache
+def _get_function_index(directory: Path) -> FunctionIndex:
+    if INDEX_CACHE_DIR is None:
+        return FunctionIndex.build(directory=directory)
+    return FunctionIndex.load(directory=directory, cache_dir=Path(INDEX_CACHE_DIR))
+
+
+def get_function_index(directory: Path) -> FunctionIndex:
+    """Gets the index of a directory, building it once per process."""
+    return _get_function_index(directory=directory.resolve())
 
-    for path in directory.rglob(pattern='*.py'):
-        if path not in SEARCH_EXCLUSIONS:
-            module_path: str = module_path_from_pathlib_path(
-                full_module_path=directory, base_path=path
-            )
-            if module_path in sys.modules:
-                module: types.ModuleType = sys.modules[module_path]
-                if hasattr(module, name):
-                    return getattr(module, name)
-            sys.path.insert(0, str(directory))
-            parsed_module: ast.Module = _parse_module(path=path)
-
-            for node in ast.walk(node=parsed_module):
-                if isinstance(node, ast.FunctionDef) and node.name == name:
-                    module: types.ModuleType = importlib.import_module(name=module_path)
-                    return getattr(module, name)
-
-    raise NotImplementedError(
-        f'Action: {name} not found in any subdirectory of action_path: {directory}'
-    )
+
+def invalidate_function_index() -> None:
+    """Drops every built index. Call after adding or changing python files."""
+    _get_function_index.cache_clear()
 
 
 def module_path_from_pathlib_path(full_module_path: Path, base_path: Path) -> str:
@@ -59,3 +146,19 @@ def module_path_from_pathlib_path(full_module_path: Path, base_path: Path) -> st
 def _parse_module(path: Path) -> ast.Module:
     with path.open() as module:
         return ast.parse(source=module.read())
+
+
+def _get_defined_functions(path: Path) -> tuple[str, ...]:
+    return tuple(
+        node.name
+        for node in ast.walk(node=_parse_module(path=path))
+        if isinstance(node, ast.FunctionDef)
+    )
+
+
+def _is_excluded(relative_path: Path) -> bool:
+    return any(
+        Path(part).match(str(exclusion))
+        for part in relative_path.parts
+        for exclusion in SEARCH_EXCLUSIONS
+    )
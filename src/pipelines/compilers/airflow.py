@@ -1,23 +1,28 @@
+import collections
 import dataclasses
+import hashlib
 import inspect
 import json
 import pathlib
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any
+from typing import Any, Final
 
 from airflow import models
 from airflow.models import variable
 from airflow.providers.google.cloud.operators import kubernetes_engine
 from airflow.providers.slack.hooks.slack_webhook import SlackWebhookHook
 
-from src.pipelines import pipeline, port, utils
+from src.pipelines import pipeline, port, task, utils
+from src.pipelines._internal import graph
 
 TEMPLATE_PATH: pathlib.Path = pathlib.Path(__file__).parent / 'templates'
 ACCESS_CONTROL: dict[str, set[str]] = {
     'Algo_Engineer': {'can_edit', 'can_read'},
     'Consci_Engineer': {'can_edit', 'can_read'},
 }
+# Airflow rejects longer task ids
+MAX_TASK_ID_LENGTH: Final[int] = 250
 SLACK_WEBHOOK = SlackWebhookHook(slack_webhook_conn_id='slack_connection_id')
 EMOJI_MAP: dict[str, str] = {
     'failed': 'red-siren',
@@ -122,8 +127,22 @@ def get_operator(
 # TODO: need abstraction for run time parameters that gets compiled
 @dataclass
 class Airflow:
+    """Compiles pipelines to Airflow DAG definitions.
+
+    With `group_linear_tasks`, each run of tasks that depend only on the task before them is
+    compiled to a single pod that runs the tasks one after another through `run_actions`, so
+    the run pays for one pod start up instead of one per task.
+    """
+
+    group_linear_tasks: bool = False
+
     def compile(self, object: object) -> str:
         if isinstance(object, pipeline.Pipeline):
+            task_groups: list[list[task.Task]] = (
+                get_linear_task_groups(tasks=object.tasks)
+                if self.group_linear_tasks
+                else [[pipeline_task] for pipeline_task in object.tasks]
+            )
             return utils.read_template(
                 template_path=TEMPLATE_PATH / 'dag.py.jinja2',  # TODO: should be a function
                 template_fields={
@@ -134,6 +153,15 @@ class Airflow:
                     'access_control': ACCESS_CONTROL,
                     'operator': inspect.getsource(get_operator),
                     'pipeline': object,
+                    'task_groups': task_groups,
+                    'group_names': {
+                        group_task.name: group[0].name.lower()
+                        for group in task_groups
+                        for group_task in group
+                    },
+                    'group_task_ids': {
+                        group[0].name: get_group_task_id(group=group) for group in task_groups
+                    },
                     'run_time_parameters': {'run_day': '{{ ds }}'},
                 },
             )
@@ -142,3 +170,31 @@ class Airflow:
 
     def decompile(self, artifact: str, object: type) -> port.Port:
         raise NotImplementedError
+
+
+def get_linear_task_groups(tasks: list[task.Task]) -> list[list[task.Task]]:
+    """Groups tasks into runs where each task depends only on the task before it, and is its
+    only dependent."""
+    dependents: collections.Counter[str] = collections.Counter(
+        dependency for pipeline_task in tasks for dependency in pipeline_task.depends_on
+    )
+    groups: dict[str, list[task.Task]] = {}
+    for pipeline_task in graph.DAG(nodes=tasks):
+        match pipeline_task.depends_on:
+            # a task depending on one outside of `tasks` starts a group of its own
+            case [dependency] if dependency in groups and dependents[dependency] == 1:
+                groups[pipeline_task.name] = groups[dependency]
+                groups[pipeline_task.name].append(pipeline_task)
+            case _:
+                groups[pipeline_task.name] = [pipeline_task]
+    return list({id(group): group for group in groups.values()}.values())
+
+
+def get_group_task_id(group: list[task.Task]) -> str:
+    """Joins the names of the grouped tasks, shortening ids too long for Airflow to their start
+    followed by a hash of the full id."""
+    task_id: str = '__'.join(pipeline_task.name for pipeline_task in group)
+    if len(task_id) <= MAX_TASK_ID_LENGTH:
+        return task_id
+    digest: str = hashlib.sha256(task_id.encode()).hexdigest()[:8]
+    return f'{task_id[: MAX_TASK_ID_LENGTH - len(digest) - 2]}__{digest}'
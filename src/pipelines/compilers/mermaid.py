@@ -3,7 +3,6 @@ import pathlib
 from collections.abc import Iterable
 
 from src.pipelines import pipeline, port, utils
-from src.pipelines._internal import graph
 
 TEMPLATE_PATH: pathlib.Path = pathlib.Path(__file__).parent / 'templates' / 'mermaid.jinja2'
 
@@ -13,7 +12,7 @@ TEMPLATE_PATH: pathlib.Path = pathlib.Path(__file__).parent / 'templates' / 'mer
 class Mermaid:
     def compile(self, object: object) -> str:
         if isinstance(object, pipeline.Pipeline):
-            dag = graph.DAG(nodes=object.tasks)
+            dag = object.dag
             all_nodes: set[str] = set(dag.graph.nodes)
             edges: Iterable[str] = dag.graph.edges
             connected_nodes: set[str] = set(itertools.chain.from_iterable(edges))
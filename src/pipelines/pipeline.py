@@ -7,7 +7,7 @@ from typing import Any
 from src.common import paths
 from src.pipelines import adapters, port, task, utils
 from src.pipelines import trigger as trigger_base
-from src.pipelines._internal import graph
+from src.pipelines._internal import executor, graph
 
 logger = utils.get_logger(name='port')
 
@@ -17,27 +17,49 @@ class Pipeline(port.Port):
     name: str
     trigger: trigger_base.Trigger | None = None
     tasks: list[task.Task] = field(default_factory=list)
-    log: list[task.Task] = field(default_factory=list, init=False, compare=False)
+    log: list[executor.NodeRun[task.Task]] = field(default_factory=list, init=False, compare=False)
+    _dag: graph.DAG[task.Task] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __getitem__(self, key: str) -> task.Task:
         return self.task_dict[key]
 
-    @property  # TODO: cache?
+    @property
+    def dag(self) -> graph.DAG[task.Task]:
+        """DAG of the pipeline's tasks, kept up to date by `add_task` and `remove_task`."""
+        if self._dag is None or self._dag.nodes is not self.tasks:
+            self._dag = graph.DAG(nodes=self.tasks)
+        return self._dag
+
+    @property
     def task_dict(self) -> dict[str, task.Task]:
-        return {task.name: task for task in self.tasks}
+        return self.dag.node_map
 
     def run(
         self,
         run_time_parameters: dict[str, Any] | None = None,
         task_names: list[str] | None = None,
+        max_concurrency: int = 1,
     ) -> None:
-        nodes: list[task.Task] = (
-            [self.task_dict[name] for name in task_names] if task_names else self.tasks
+        """Runs tasks, each as soon as the tasks it depends on have finished.
+
+        Tasks run one at a time in topological order unless `max_concurrency` is raised, in
+        which case they share the process' default config, repositories and clients across
+        threads. When `task_names` is given only those tasks are run, and their dependencies on
+        other tasks are ignored. A failed task stops further tasks from starting and is raised
+        once the running tasks finish. Every finished task is recorded in `log` with its start
+        and end time.
+        """
+        dag: graph.DAG[task.Task] = (
+            graph.DAG(nodes=[self.task_dict[name] for name in task_names])
+            if task_names
+            else self.dag
+        )
+        executor.execute_dag(
+            dag=dag,
+            action=lambda node: node.action(**node.parameters | (run_time_parameters or {})),
+            max_concurrency=max_concurrency,
+            on_finished=self.log.append,
         )
-        dag = graph.DAG(nodes=nodes)
-        for node in dag:
-            self.log.append(node)
-            node.action(**node.parameters | (run_time_parameters or {}))
 
     def show(self) -> utils.RenderMermaid:
         """Renders a graphical representation of the pipeline."""
@@ -62,7 +84,7 @@ class Pipeline(port.Port):
             tasks_to_modify=self._convert_to_list(candidate=before),
         )
 
-        self.tasks.append(
+        self.dag.add_node(
             task.Task(
                 name=name,
                 action=action,
@@ -78,19 +100,21 @@ class Pipeline(port.Port):
 
     def remove_task(self, name: str) -> None:
         self.tasks = [task for task in self.tasks if task.name != name]
+        self._dag = None
 
     def _add_upstream_dependency(
         self, new_dependency_name: str, tasks_to_modify: list[str]
     ) -> None:
         self._validate_dependencies(task_name=new_dependency_name, dependencies=tasks_to_modify)
         for task_name in tasks_to_modify:
-            self.task_dict[task_name].depends_on.append(new_dependency_name)
+            self.dag.add_dependency(node_name=task_name, dependency=new_dependency_name)
 
     def _validate_dependencies(self, task_name: str, dependencies: list[str]) -> None:
-        for node in dependencies:  # TODO: use sets, and issubset
-            if node not in self.task_dict:
+        task_dict: dict[str, task.Task] = self.task_dict
+        for node in dependencies:
+            if node not in task_dict:
                 raise ValueError(
-                    f'Cannot run: {task_name} after: {node} because node does not exist in the pipeline.\nExisting nodes: {self.task_dict.keys()}'
+                    f'Cannot run: {task_name} after: {node} because node does not exist in the pipeline.\nExisting nodes: {task_dict.keys()}'
                 )
 
     @staticmethod
@@ -105,15 +129,11 @@ class Pipeline(port.Port):
     ):
         config_directory = config_directory or paths.get_path('configs')
         adapter = adapter or adapters.Adapters.YAML
-        artifact_candidates = list(
-            config_directory.glob(f'*/{self.name}.*')
-        )  # TODO: need helper for finding config by name
-        if len(artifact_candidates) > 1:
-            msg = f'More than one config found matching the name: {self.name}. Found: {artifact_candidates}.'
-            raise ValueError(msg)
-
-        if len(artifact_candidates) == 1:
-            artifact_path = artifact_candidates[0]
+        artifact_path = paths.get_config_index(config_directory=config_directory).get_pipeline_path(
+            name=self.name
+        )
+
+        if artifact_path is not None:
             msg = f'Config found matching the name: {self.name} at path: {artifact_path}.'
             logger.warning(msg)
         else:
@@ -121,6 +141,7 @@ class Pipeline(port.Port):
             artifact_dir.mkdir(parents=True)
             artifact_path = artifact_dir / f'{self.name}.yaml'
             artifact_path.touch()
+            paths.invalidate_config_index()
 
         with artifact_path.open('w') as f:
             f.write(self.compile(adapter=adapter))
@@ -16,11 +16,12 @@ class Port:
     def compile(
         self,
         adapter: adapters.Adapters,
+        **compiler_options: Any,
     ) -> str:
         # TODO: these will eventually need to be injected probably
         compiler_module = importlib.import_module(root_module.format(adapter.value))
         compiler = getattr(compiler_module, adapter.value.capitalize())
-        return compiler().compile(object=self)
+        return compiler(**compiler_options).compile(object=self)
 
     @classmethod
     def decompile(cls, artifact: Any, adapter: adapters.Adapters):
@@ -36,20 +37,14 @@ class Port:
         adapter: adapters.Adapters | None = None,
         config_directory: Path | None = None,
     ):
-        config_directory = config_directory or paths.get_path('configs')
         adapter = adapter or adapters.Adapters.YAML
-        artifact_candidates = list(
-            config_directory.glob(f'*/{name}.*')
-        )  # TODO: need helper for finding config by name
-        if len(artifact_candidates) > 1:
-            msg = f'More than one config found matching the name: {name}. Found: {artifact_candidates}.'
-            raise ValueError(msg)
-        if len(artifact_candidates) == 0:
+        artifact_path = paths.get_config_index(config_directory=config_directory).get_pipeline_path(
+            name=name
+        )
+        if artifact_path is None:
             msg = f'No configs found matching the name: {name}.'
             raise ValueError(msg)
 
-        artifact_path = artifact_candidates[0]
-
         with artifact_path.open() as f:
             artifact = f.read()
         return cls.decompile(artifact=artifact, adapter=adapter)
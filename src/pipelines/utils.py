@@ -1,38 +1,12 @@
 import logging
 import uuid
-from pathlib import Path
-from typing import Any, NoReturn
 
-import jinja2
+from src.common import templates
 
-
-class TemplateException(Exception):
-    pass
-
-
-def raise_template_exception(message: str) -> NoReturn:
-    raise TemplateException(message)
-
-
-jinja2_environment = jinja2.environment.Environment()
-jinja2_environment.globals['raise_template_exception'] = raise_template_exception
-
-
-def read_template(template_path: Path, template_fields: dict[str, Any] | None = None) -> str:
-    """Function for reading and formatting a jinja template.
-
-    Args:
-                    template_path (list[str]): path to the template
-                    template_fields (Optional[dict], optional): fields to template. Defaults to None.
-
-    Returns:
-                    (str): formatted template
-    """
-
-    with template_path.open() as file:
-        template: jinja2.Template = jinja2_environment.from_string(source=file.read())
-        rendered: str = template.render(**(template_fields or {}))
-    return rendered
+TemplateException = templates.TemplateException
+raise_template_exception = templates.raise_template_exception
+jinja2_environment = templates.jinja2_environment
+read_template = templates.read_template
 
 
 class RenderMermaid:
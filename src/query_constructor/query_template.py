@@ -1,23 +1,31 @@
+import functools
 from dataclasses import dataclass, field
-from typing import Any, NoReturn
+from typing import Any
 
-from jinja2 import Template, environment, meta, nodes
+from jinja2 import Template, meta, nodes
 
+from src.common import templates
 from src.query_constructor import template_registry
 
 RUNTIME_TEMPLATE_FIELDS: set[str] = {'run_day'}
 
+TemplateException = templates.TemplateException
+raise_template_exception = templates.raise_template_exception
+jinja2_environment = templates.jinja2_environment
 
-class TemplateException(Exception):
-    pass
+TEMPLATE_CACHE_SIZE: int = 128
 
 
-def raise_template_exception(message: str) -> NoReturn:
-    raise TemplateException(message)
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_template(source: str) -> Template:
+    """Compiles a template once per distinct source, shared by all QueryTemplates."""
+    return jinja2_environment.from_string(source=source)
 
 
-jinja2_environment = environment.Environment()
-jinja2_environment.globals['raise_template_exception'] = raise_template_exception
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def find_undeclared_variables(source: str) -> frozenset[str]:
+    ast: nodes.Template = jinja2_environment.parse(source=source)
+    return frozenset(meta.find_undeclared_variables(ast=ast))
 
 
 @dataclass
@@ -40,7 +48,7 @@ class QueryTemplate:
         template_fields: dict[str, Any] = (
             self.provided_template_fields | {'run_day': run_day} | (run_time_template_fields or {})
         )
-        template: Template = jinja2_environment.from_string(source=self.template)
+        template: Template = compile_template(source=self.template)
         return template.render(**template_fields)
 
     @property
@@ -49,8 +57,7 @@ class QueryTemplate:
 
     @property
     def required_template_fields(self) -> set[str]:
-        ast: nodes.Template = jinja2_environment.parse(source=self.template)
-        return meta.find_undeclared_variables(ast=ast) - RUNTIME_TEMPLATE_FIELDS
+        return set(find_undeclared_variables(source=self.template) - RUNTIME_TEMPLATE_FIELDS)
 
     @classmethod
     def from_registry(
@@ -1,5 +1,6 @@
 import inspect
 from collections.abc import Callable
+from concurrent import futures
 from logging import Logger
 from typing import Any
 
@@ -10,7 +11,6 @@ from src.scripts import utils
 LOGGER: Logger = utils.get_logger(name='check_configs')
 
 
-# TODO: should be async
 # TODO: this is really slapdash, should be formalized when time permits
 def check_actions_have_all_parameters(
     config_name: str,
@@ -37,22 +37,70 @@ def check_actions_have_all_parameters(
     return errors
 
 
-def check_configs() -> None:
+def check_query_template(
+    config_name: str,
+    task_name: str,
+    parameters: dict[str, Any],
+    errors: list[str],
+) -> list[str]:
+    """Renders the query of a `sync_partitioned_table` task for its start date, without querying.
+
+    Building the template checks that every field it requires is provided.
+    """
+    from src.actions import actions  # noqa: PLC0415
+
+    table_name: str = parameters['table_name']
+    start_date: str = parameters['start_date']
+    try:
+        actions.get_query(
+            query_name=table_name,
+            environment_template_fields=actions.default_environment_template_fields(
+                start_date=start_date, table_name=table_name
+            ),
+        ).render(run_day=start_date)
+    except Exception as e:
+        errors.append(
+            f'Config: {config_name}, task: {task_name}, query: {table_name} failed to render for start_date: {start_date}. {e!r}'
+        )
+    return errors
+
+
+def check_config(name: str) -> list[str]:
+    """Checks every task of a config, returning the errors found."""
     errors: list[str] = []
-    for name in paths.get_config_names():
-        LOGGER.info(f'Checking config: {name}...')
-        p: pipeline.Pipeline = pipeline.Pipeline.from_config(name=name)
-        for task in p.tasks:
-            errors = check_actions_have_all_parameters(
+    p: pipeline.Pipeline = pipeline.Pipeline.from_config(name=name)
+    for task in p.tasks:
+        errors = check_actions_have_all_parameters(
+            config_name=p.name,
+            task_name=task.name,
+            action=task.action,
+            parameters=task.parameters,
+            errors=errors,
+        )
+        if task.action.__name__ == 'sync_partitioned_table' and {
+            'table_name',
+            'start_date',
+        }.issubset(task.parameters):
+            errors = check_query_template(
                 config_name=p.name,
                 task_name=task.name,
-                action=task.action,
                 parameters=task.parameters,
                 errors=errors,
             )
+    return errors
+
+
+def check_configs(max_workers: int | None = None) -> None:
+    """Checks every config, spreading configs across a pool of processes."""
+    names: list[str] = list(paths.get_config_names())
+    errors: list[str] = []
+    with futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for name, config_errors in zip(names, pool.map(check_config, names), strict=True):
+            LOGGER.info(f'Checked config: {name}, found {len(config_errors)} errors.')
+            errors.extend(config_errors)
     if errors:
         formatted_errors = '\n'.join(errors)
-        msg = f'Some actions are missing parameters.\n{formatted_errors}'
+        msg = f'Some configs are invalid.\n{formatted_errors}'
         raise TypeError(msg)
 
 
@@ -8,6 +8,7 @@ from dynaconf import Dynaconf
 class AlgoFeaturesConfig:
     dags_dir: Path
     is_manual_test_env: bool
+    group_linear_tasks: bool = False
 
 
 _dynaconf_settings = Dynaconf(
@@ -22,4 +23,5 @@ _dynaconf_settings = Dynaconf(
 settings = AlgoFeaturesConfig(
     dags_dir=Path(_dynaconf_settings.dags_dir),
     is_manual_test_env=bool(_dynaconf_settings.is_manual_test_env),
+    group_linear_tasks=bool(_dynaconf_settings.get('group_linear_tasks', False)),
 )
@@ -1,4 +1,8 @@
+import functools
+import hashlib
 import shutil
+from concurrent import futures
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final
 
@@ -8,6 +12,106 @@ from src.scripts import config, utils
 
 LOGGER: Final = utils.get_logger(name='create_dag_files')
 
+SOURCE_HASH_HEADER: Final[str] = '# algo_features source hash: '
+PIPELINES_DIR: Final[Path] = Path(pipeline.__file__).parent
+# sources every generated DAG depends on, besides its own config: the YAML decompiler that
+# reads the config, the pipeline and task definitions with their defaults (e.g. retries),
+# and the Airflow compiler with its template
+COMPILER_SOURCES: Final[tuple[Path, ...]] = (
+    PIPELINES_DIR / 'compilers' / 'yaml.py',
+    PIPELINES_DIR / 'pipeline.py',
+    PIPELINES_DIR / 'task.py',
+    PIPELINES_DIR / 'trigger.py',
+    PIPELINES_DIR / 'compilers' / 'airflow.py',
+    PIPELINES_DIR / 'compilers' / 'templates' / 'dag.py.jinja2',
+)
+
+
+@dataclass
+class DagFileReport:
+    regenerated: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+
+def get_source_hash(config_name: str, group_linear_tasks: bool) -> str:
+    """Hashes everything a generated DAG is compiled from: its config, the `COMPILER_SOURCES`
+    and the compiler options."""
+    config_path: Path | None = paths.get_config_index().get_pipeline_path(name=config_name)
+    if config_path is None:
+        msg: str = f'No configs found matching the name: {config_name}.'
+        raise ValueError(msg)
+
+    digest = hashlib.sha256()
+    for path in (config_path, *COMPILER_SOURCES):
+        digest.update(path.read_bytes())
+    digest.update(f'group_linear_tasks={group_linear_tasks}'.encode())
+    return digest.hexdigest()
+
+
+def _read_source_hash(dag_path: Path) -> str | None:
+    try:
+        with dag_path.open() as f:
+            header: str = f.readline()
+    except OSError:
+        return None
+    return (
+        header.removeprefix(SOURCE_HASH_HEADER).strip()
+        if header.startswith(SOURCE_HASH_HEADER)
+        else None
+    )
+
+
+def _compile_dag(config_name: str, group_linear_tasks: bool) -> str:
+    return pipeline.Pipeline.from_config(name=config_name).compile(
+        adapter=adapters.Adapters.AIRFLOW,
+        group_linear_tasks=group_linear_tasks,
+    )
+
+
+def generate_dag_files(
+    config_names: list[str],
+    target_dir: Path,
+    group_linear_tasks: bool = False,
+    max_workers: int | None = None,
+) -> DagFileReport:
+    """Writes a DAG file per config, skipping configs whose DAG file is up to date.
+
+    Each DAG file starts with a hash of its sources, see `get_source_hash`. Configs whose hash
+    differs from the one in their DAG file are compiled in parallel across processes.
+    """
+    report = DagFileReport()
+    source_hashes: dict[str, str] = {}
+    for config_name in config_names:
+        source_hash: str = get_source_hash(
+            config_name=config_name, group_linear_tasks=group_linear_tasks
+        )
+        if _read_source_hash(dag_path=target_dir / f'{config_name}_dag.py') == source_hash:
+            report.unchanged.append(config_name)
+        else:
+            source_hashes[config_name] = source_hash
+
+    if len(source_hashes) > 1 and max_workers != 1:
+        with futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            dags: list[str] = list(
+                pool.map(
+                    functools.partial(_compile_dag, group_linear_tasks=group_linear_tasks),
+                    source_hashes,
+                )
+            )
+    else:
+        dags = [
+            _compile_dag(config_name=config_name, group_linear_tasks=group_linear_tasks)
+            for config_name in source_hashes
+        ]
+
+    for (config_name, source_hash), dag in zip(source_hashes.items(), dags, strict=True):
+        dag_path: Path = target_dir / f'{config_name}_dag.py'
+        with dag_path.open('w') as f:
+            f.write(f'{SOURCE_HASH_HEADER}{source_hash}\n{dag}')
+        LOGGER.info(f'DAG file created at: `{dag_path}`')
+        report.regenerated.append(config_name)
+    return report
+
 
 def main() -> None:
     target_dir = config.settings.dags_dir.resolve()
@@ -15,16 +119,15 @@ def main() -> None:
         msg: str = f'target_dir does not exist, cannot create dag files: `{target_dir}`'
         raise ValueError(msg)
 
-    for config_name in paths.get_config_names():
-        dag: str = pipeline.Pipeline.from_config(name=config_name).compile(
-            adapter=adapters.Adapters.AIRFLOW
-        )
-        dag_path = target_dir / f'{config_name}_dag.py'
-        dag_path.touch()
-        with dag_path.open('w') as f:
-            f.write(dag)
-        if dag_path.exists():
-            LOGGER.info(f'DAG file created at: `{dag_path}`')
+    report: DagFileReport = generate_dag_files(
+        config_names=list(paths.get_config_names()),
+        target_dir=target_dir,
+        group_linear_tasks=config.settings.group_linear_tasks,
+    )
+    LOGGER.info(
+        f'Regenerated {len(report.regenerated)} DAG files: {report.regenerated}. '
+        f'{len(report.unchanged)} DAG files were up to date.'
+    )
 
     # TODO: create solution for `frozen` dags that are not regenerated.
     source: Path = Path(__file__).parent / 'user_features_v1_dag.py'
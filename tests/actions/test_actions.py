@@ -1,3 +1,6 @@
+import subprocess
+import sys
+from pathlib import Path
 from unittest import mock
 
 import pytest
@@ -18,3 +21,100 @@ class TestCheckBQPartition:
                 retry=1,
                 retry_delay=1,
             )
+
+
+class TestRunAction:
+    def test_runs_action_with_its_parameters_only(self):
+        stub_action = mock.create_autospec(lambda table_name: None)
+
+        with mock.patch.dict(actions.ACTIONS, {'stub_action': stub_action}):
+            actions.run_action(
+                action='stub_action', parameters={'table_name': 'table', 'unused': 1}
+            )
+
+        stub_action.assert_called_once_with(table_name='table')
+
+    def test_runs_actions_in_order(self):
+        calls: list[str] = []
+
+        def stub_action(table_name: str) -> None:
+            calls.append(table_name)
+
+        with mock.patch.dict(actions.ACTIONS, {'stub_action': stub_action}):
+            actions.run_actions(
+                requests=[
+                    {'action': 'stub_action', 'parameters': {'table_name': 'first'}},
+                    {'action': 'stub_action', 'parameters': {'table_name': 'second'}},
+                ]
+            )
+
+        assert calls == ['first', 'second']
+
+
+class TestSyncPartitionedTable:
+    @pytest.fixture(autouse=True)
+    def stub_query(self):
+        with mock.patch.object(actions, 'get_query') as get_query:
+            get_query.return_value.render.return_value = 'SELECT 1'
+            yield
+
+    def sync(self, entrypoint: mock.MagicMock) -> None:
+        actions.sync_partitioned_table(
+            table_name='table',
+            start_date='2024-01-01',
+            run_day='2024-01-02',
+            partition_field='day',
+            upstream_table_names=[],
+            managed_table_entrypoint=entrypoint,
+        )
+
+    def test_reuses_schema_of_table_built_from_same_definition(self):
+        entrypoint = mock.MagicMock()
+        entrypoint.get_table_schema.return_value = [{'name': 'day', 'type': 'DATE'}]
+
+        with mock.patch.object(actions.bq_utils, 'get_bq_schema_api_repr') as get_schema:
+            self.sync(entrypoint=entrypoint)
+
+        get_schema.assert_not_called()
+        assert entrypoint.sync_partitioned_table.call_args.kwargs['schema'] == [
+            {'name': 'day', 'type': 'DATE'}
+        ]
+
+    def test_dry_runs_query_when_definition_changed(self):
+        entrypoint = mock.MagicMock()
+        entrypoint.get_table_schema.return_value = None
+
+        with mock.patch.object(actions.bq_utils, 'get_bq_schema_api_repr') as get_schema:
+            self.sync(entrypoint=entrypoint)
+
+        get_schema.assert_called_once_with(query='SELECT 1', definition='SELECT 1')
+
+
+class TestMain:
+    import_budget_us = 250_000
+    heavy_modules = ('pandas', 'yaml', 'databricks', 'google.cloud.bigquery')
+
+    def test_unknown_action_raises_error(self):
+        with (
+            mock.patch.object(sys, 'argv', ['actions.py', 'get_query']),
+            pytest.raises(ValueError, match='does not exist'),
+        ):
+            actions.main()
+
+    @pytest.mark.slow
+    def test_cold_start_import_stays_within_budget(self):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import src.actions.actions'],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parents[2],
+            text=True,
+        )
+        cumulative_us: dict[str, int] = {
+            columns[2].strip(): int(columns[1])
+            for line in result.stderr.splitlines()
+            if line.startswith('import time:') and (columns := line.split('|'))[1].strip().isdigit()
+        }
+
+        assert not [module for module in cumulative_us if module.startswith(self.heavy_modules)]
+        assert cumulative_us['src.actions.actions'] < self.import_budget_us
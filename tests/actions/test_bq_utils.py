@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from google.cloud.bigquery import schema
 
@@ -26,3 +28,51 @@ def test_get_schema_from_query_dry_run_can_handle_repeated_fields() -> None:
     )
 
     assert actual_schema == expected_schema
+
+
+class TestGetBqSchemaApiRepr:
+    schema_api_repr = [{'name': 'a', 'type': 'STRING', 'mode': 'NULLABLE'}]
+
+    @pytest.fixture(autouse=True)
+    def clear_schema_cache(self):
+        utils._schema_cache.clear()
+        yield
+        utils._schema_cache.clear()
+
+    def get_client(self) -> mock.MagicMock:
+        client = mock.MagicMock()
+        client.query.return_value._properties = {
+            'statistics': {'query': {'schema': {'fields': self.schema_api_repr}}}
+        }
+        return client
+
+    def test_dry_runs_once_per_definition(self, tmp_path) -> None:
+        client = self.get_client()
+
+        for _ in range(2):
+            actual_schema = utils.get_bq_schema_api_repr(
+                query='SELECT 1', definition='definition', client=client, cache_dir=tmp_path
+            )
+
+        assert actual_schema == self.schema_api_repr
+        assert client.query.call_count == 1
+
+        utils.get_bq_schema_api_repr(
+            query='SELECT 2', definition='changed definition', client=client, cache_dir=tmp_path
+        )
+
+        assert client.query.call_count == 2
+
+    def test_reads_schema_persisted_by_another_process(self, tmp_path) -> None:
+        utils.get_bq_schema_api_repr(
+            query='SELECT 1', definition='definition', client=self.get_client(), cache_dir=tmp_path
+        )
+        utils._schema_cache.clear()
+        client = self.get_client()
+
+        actual_schema = utils.get_bq_schema_api_repr(
+            query='SELECT 1', definition='definition', client=client, cache_dir=tmp_path
+        )
+
+        assert actual_schema == self.schema_api_repr
+        client.query.assert_not_called()
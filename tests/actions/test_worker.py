@@ -0,0 +1,40 @@
+import io
+import json
+from unittest import mock
+
+from src.actions import actions, worker
+
+
+class TestServe:
+    def test_answers_each_request_and_survives_failures(self):
+        calls: list[str] = []
+
+        def stub_action(table_name: str) -> None:
+            calls.append(table_name)
+
+        def failing_action() -> None:
+            raise ValueError('failed')
+
+        requests: list[str] = [
+            json.dumps({'action': 'stub_action', 'parameters': {'table_name': 'table'}}),
+            '',
+            json.dumps({'action': 'failing_action'}),
+            json.dumps({'action': 'missing_action'}),
+        ]
+        responses = io.StringIO()
+
+        with mock.patch.dict(
+            actions.ACTIONS, {'stub_action': stub_action, 'failing_action': failing_action}
+        ):
+            worker.serve(requests=requests, responses=responses)
+
+        statuses: list[dict] = [json.loads(line) for line in responses.getvalue().splitlines()]
+        assert calls == ['table']
+        assert statuses == [
+            {'status': 'succeeded', 'action': 'stub_action'},
+            {'status': 'failed', 'error': "ValueError('failed')"},
+            {
+                'status': 'failed',
+                'error': 'ValueError("Function \'missing_action\' does not exist.")',
+            },
+        ]
@@ -0,0 +1,46 @@
+import pytest
+
+from src.common import paths
+
+
+class TestConfigIndex:
+    def test_resolves_sql_query_over_pipeline_config(self, tmp_path, create_file):
+        pipeline_path = create_file(
+            filename='features.yaml', body='name: features', parent_dir='features'
+        )
+        sql_path = create_file(
+            filename='features.sql.jinja2', body='SELECT 1', parent_dir='features/sql'
+        )
+
+        index = paths.ConfigIndex.build(config_directory=tmp_path)
+
+        assert index.get_query_path(name='features') == sql_path
+        assert index.get_query_path(name='features.sql') == sql_path
+        assert index.get_pipeline_path(name='features') == pipeline_path
+        assert index.get_pipeline_path(name='missing') is None
+
+    def test_records_duplicate_queries_when_built(self, tmp_path, create_file):
+        create_file(filename='query.yaml', body='', parent_dir='a')
+        create_file(filename='query.jinja2', body='', parent_dir='b')
+
+        index = paths.ConfigIndex.build(config_directory=tmp_path)
+
+        assert set(index.duplicate_queries) == {'query'}
+        with pytest.raises(ValueError, match='Multiple candidates'):
+            index.get_query_path(name='query')
+        with pytest.raises(NotImplementedError):
+            index.get_query_path(name='missing')
+
+    def test_index_is_built_once_until_invalidated(self, tmp_path, create_file):
+        create_file(filename='first.yaml', body='', parent_dir='first')
+        index = paths.get_config_index(config_directory=tmp_path)
+        create_file(filename='second.yaml', body='', parent_dir='second')
+
+        assert paths.get_config_index(config_directory=tmp_path) is index
+        assert index.get_pipeline_path(name='second') is None
+
+        paths.invalidate_config_index()
+
+        assert paths.get_config_index(config_directory=tmp_path).get_pipeline_path(
+            name='second'
+        ) == (tmp_path / 'second' / 'second.yaml')
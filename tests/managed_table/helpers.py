@@ -12,6 +12,8 @@ def get_table_config(  # noqa: PLR0913
     definition: str = '',
     upstream_table_names: list[str] = [],
     expires: datetime | None = None,
+    backfill_concurrency: int = 1,
+    backfill_batch_size: int = 1,
 ) -> value_objects.TableConfig:
     return value_objects.TableConfig(
         table_name=table_name,
@@ -21,6 +23,8 @@ def get_table_config(  # noqa: PLR0913
         definition=definition,
         upstream_table_names=upstream_table_names,
         expires=expires,
+        backfill_concurrency=backfill_concurrency,
+        backfill_batch_size=backfill_batch_size,
     )
 
 
@@ -34,6 +38,8 @@ def get_table_metadata(  # noqa: PLR0913
     updated: datetime = datetime(year=2024, month=1, day=1),
     upstream_table_names: list[str] = [],
     expires: datetime | None = None,
+    backfill_concurrency: int = 1,
+    backfill_batch_size: int = 1,
 ) -> value_objects.TableMetadata:
     return value_objects.TableMetadata(
         table_name=table_name,
@@ -45,4 +51,6 @@ def get_table_metadata(  # noqa: PLR0913
         updated=updated,
         upstream_table_names=upstream_table_names,
         expires=expires,
+        backfill_concurrency=backfill_concurrency,
+        backfill_batch_size=backfill_batch_size,
     )
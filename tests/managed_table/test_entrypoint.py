@@ -6,7 +6,10 @@ from typing import Final
 from unittest import mock
 
 from src.managed_table.domain import commands
+from src.managed_table.entrypoints import local
+from src.managed_table.repositories.table import exceptions
 from src.managed_table.services import handlers
+from tests.managed_table import helpers
 
 ROOT_DIR: Final[Path] = Path(__file__).parent.parent.parent.parent.parent
 ENTRYPOINT_DIR: Final[Path] = ROOT_DIR / 'pipelines' / 'resources' / 'bigquery'
@@ -25,3 +28,45 @@ def test_sync_table() -> None:
             args=cmd,
             check=False,
         )
+
+
+class TestGetTableSchema:
+    schema: Final[list[dict[str, str]]] = [{'name': 'day', 'type': 'DATE'}]
+
+    def get_entrypoint(self, table_repository: mock.MagicMock) -> local.Entrypoint:
+        table_repository.format_definition.side_effect = lambda definition: f'hash({definition})'
+        return local.Entrypoint(bus=mock.MagicMock(), table_repository=table_repository)
+
+    def test_gets_schema_of_table_built_from_definition(self) -> None:
+        table_repository = mock.MagicMock()
+        table_repository.get_table_metadata.return_value = helpers.get_table_metadata(
+            schema=self.schema, definition='hash(definition)'
+        )
+
+        actual_schema = self.get_entrypoint(table_repository=table_repository).get_table_schema(
+            table_name='table', definition='definition'
+        )
+
+        assert actual_schema == self.schema
+
+    def test_gets_no_schema_if_definition_changed(self) -> None:
+        table_repository = mock.MagicMock()
+        table_repository.get_table_metadata.return_value = helpers.get_table_metadata(
+            schema=self.schema, definition='hash(old definition)'
+        )
+
+        actual_schema = self.get_entrypoint(table_repository=table_repository).get_table_schema(
+            table_name='table', definition='definition'
+        )
+
+        assert actual_schema is None
+
+    def test_gets_no_schema_if_table_does_not_exist(self) -> None:
+        table_repository = mock.MagicMock()
+        table_repository.get_table_metadata.side_effect = exceptions.TableDoesNotExistError()
+
+        actual_schema = self.get_entrypoint(table_repository=table_repository).get_table_schema(
+            table_name='table', definition='definition'
+        )
+
+        assert actual_schema is None
@@ -0,0 +1,127 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent import futures
+
+from src.managed_table.services import executor
+
+
+def test_execute_chains_runs_items_within_a_chain_in_order() -> None:
+    executed: list[int] = []
+
+    report = executor.execute_chains(chains=[[1, 2, 3]], action=executed.append, max_concurrency=4)
+
+    assert executed == [1, 2, 3]
+    assert report.completed == [1, 2, 3]
+
+
+def test_execute_chains_runs_chains_concurrently() -> None:
+    in_flight: list[int] = []
+    max_in_flight: list[int] = [0]
+    lock = threading.Lock()
+
+    def action(item: int) -> None:
+        with lock:
+            in_flight.append(item)
+            max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(item)
+
+    report = executor.execute_chains(
+        chains=[[item] for item in range(6)], action=action, max_concurrency=3
+    )
+
+    assert max_in_flight[0] == 3
+    assert sorted(report.completed) == list(range(6))
+
+
+def test_execute_chains_skips_rest_of_chain_after_failure_without_stopping_other_chains() -> None:
+    error = ValueError('stub error')
+
+    def action(item: int) -> None:
+        if item == 2:
+            raise error
+
+    report = executor.execute_chains(chains=[[1, 2, 3], [4, 5]], action=action, max_concurrency=2)
+
+    assert sorted(report.completed) == [1, 4, 5]
+    assert report.failed == [(2, error)]
+    assert report.skipped == [3]
+
+
+def _submit_later(
+    submitted: list[int], in_flight: list[int], fail_on: int | None = None
+) -> Callable[[int], futures.Future[None]]:
+    def submit(item: int) -> futures.Future[None]:
+        submitted.append(item)
+        in_flight.append(item)
+        future: futures.Future[None] = futures.Future()
+
+        def complete() -> None:
+            in_flight.remove(item)
+            if item == fail_on:
+                future.set_exception(ValueError('stub error'))
+            else:
+                future.set_result(None)
+
+        threading.Timer(interval=0.01, function=complete).start()
+        return future
+
+    return submit
+
+
+def test_execute_submitted_chains_submits_items_within_a_chain_in_order() -> None:
+    submitted: list[int] = []
+
+    report = executor.execute_submitted_chains(
+        chains=[[1, 2, 3]],
+        submit=_submit_later(submitted=submitted, in_flight=[]),
+        max_concurrency=4,
+    )
+
+    assert submitted == [1, 2, 3]
+    assert report.completed == [1, 2, 3]
+
+
+def test_execute_submitted_chains_bounds_chains_in_flight() -> None:
+    in_flight: list[int] = []
+    max_in_flight: list[int] = [0]
+    submit = _submit_later(submitted=[], in_flight=in_flight)
+
+    def submit_and_count(item: int) -> futures.Future[None]:
+        future = submit(item)
+        max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+        return future
+
+    report = executor.execute_submitted_chains(
+        chains=[[item] for item in range(6)], submit=submit_and_count, max_concurrency=3
+    )
+
+    assert max_in_flight[0] == 3
+    assert sorted(report.completed) == list(range(6))
+
+
+def test_execute_submitted_chains_skips_rest_of_chain_after_failure() -> None:
+    report = executor.execute_submitted_chains(
+        chains=[[1, 2, 3], [4, 5]],
+        submit=_submit_later(submitted=[], in_flight=[], fail_on=2),
+        max_concurrency=2,
+    )
+
+    assert sorted(report.completed) == [1, 4, 5]
+    assert [item for item, _ in report.failed] == [2]
+    assert report.skipped == [3]
+
+
+def test_execute_submitted_chains_reports_many_failed_submits_without_recursing() -> None:
+    def submit(item: int) -> futures.Future[None]:
+        raise RuntimeError(f'rate limited: {item}')
+
+    report = executor.execute_submitted_chains(
+        chains=[[item, item + 10_000] for item in range(2_000)], submit=submit, max_concurrency=2
+    )
+
+    assert [item for item, _ in report.failed] == list(range(2_000))
+    assert len(report.skipped) == 2_000
+    assert not report.completed
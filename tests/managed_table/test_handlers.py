@@ -1,6 +1,7 @@
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from concurrent import futures
 from contextlib import nullcontext as does_not_raise
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from datetime import datetime
 from typing import Any
 
@@ -12,7 +13,11 @@ from src.managed_table.repositories.config.adapters import local
 from src.managed_table.repositories.query.adapters.local import InMemoryQueryRepository
 from src.managed_table.repositories.query.base import AbstractQueryRepository
 from src.managed_table.repositories.table import exceptions
-from src.managed_table.repositories.table.base import AbstractTableRepository
+from src.managed_table.repositories.table.base import (
+    AbstractAsyncTableRepository,
+    AbstractTableRepository,
+)
+from src.managed_table.services import exceptions as service_exceptions
 from src.managed_table.services import handlers, message_bus
 from src.query_constructor import query_template
 from tests.managed_table import helpers
@@ -42,12 +47,18 @@ class MockQueryRepository(AbstractQueryRepository):
 
 
 class MockTableRepository(AbstractTableRepository):
-    def __init__(self, table_metadata: Iterable[value_objects.TableMetadata]) -> None:
+    def __init__(
+        self,
+        table_metadata: Iterable[value_objects.TableMetadata],
+        partition_stats: Mapping[str, dict[str, value_objects.PartitionStats]] | None = None,
+    ) -> None:
         self.tables: dict[str, value_objects.TableMetadata] = {
             metadata.table_name: metadata for metadata in table_metadata
         }
+        self.partition_stats = partition_stats or {}
         self._copy_table_called_with = {}
         self._write_query_results_to_table_partition_calls = []
+        self._write_query_results_to_table_partitions_calls = []
 
     def __getitem__(self, key: str):
         return self.tables[key]
@@ -57,6 +68,11 @@ class MockTableRepository(AbstractTableRepository):
             return table
         raise exceptions.TableDoesNotExistError()
 
+    def get_partition_stats(self, table_name: str) -> dict[str, value_objects.PartitionStats]:
+        if table_name in self.partition_stats:
+            return self.partition_stats[table_name]
+        return super().get_partition_stats(table_name=table_name)
+
     def table_exists(self, table_name: str) -> None:
         try:
             self.tables[table_name]
@@ -100,24 +116,113 @@ class MockTableRepository(AbstractTableRepository):
             return
 
     def write_query_results_to_table_partition(self, table_name: str, query: str, partition: str):
-        self.tables[table_name].partitions.append(partition)
+        self._add_partitions(table_name=table_name, partitions=[partition])
         self._write_query_results_to_table_partition_calls.append(partition)
 
+    def write_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ):
+        self._add_partitions(table_name=table_name, partitions=partition_queries)
+        self._write_query_results_to_table_partitions_calls.append(list(partition_queries))
+
     def write_query_results_to_table(self, table_name: str, query: str):
         pass
 
+    def _add_partitions(self, table_name: str, partitions: Iterable[str]) -> None:
+        self.tables[table_name] = replace(
+            self.tables[table_name],
+            partitions=self.tables[table_name].partitions
+            | value_objects.Partitions.from_partitions(partitions),
+            updated=datetime.now(),
+        )
+
     def format_definition(self, definition: str) -> str:
         return definition
 
+    def add_columns(self, table_name: str, columns: Collection[dict[str, Any]]) -> None:
+        self.tables[table_name] = replace(
+            self.tables[table_name], schema=[*self.tables[table_name].schema, *columns]
+        )
+
+    def update_definition(self, table_name: str, definition: str) -> None:
+        self.tables[table_name] = replace(
+            self.tables[table_name], definition=self.format_definition(definition=definition)
+        )
+
+
+class MockAsyncTableRepository(MockTableRepository, AbstractAsyncTableRepository):
+    """Completes submitted writes immediately, recording that they were submitted."""
+
+    def __init__(self, table_metadata: Iterable[value_objects.TableMetadata]) -> None:
+        super().__init__(table_metadata=table_metadata)
+        self._submitted_partitions: list[str] = []
+
+    def _complete(self, write: Callable[[], None]) -> futures.Future[None]:
+        future: futures.Future[None] = futures.Future()
+        try:
+            write()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+        return future
+
+    def submit_copy_table(
+        self,
+        source_table_name: str,
+        destination_table_name: str,
+        expires: datetime | None = None,
+    ) -> futures.Future[None]:
+        return self._complete(
+            write=lambda: self.copy_table(
+                source_table_name=source_table_name,
+                destination_table_name=destination_table_name,
+                expires=expires,
+            )
+        )
+
+    def submit_query_results_to_table_partition(
+        self, table_name: str, query: str, partition: str
+    ) -> futures.Future[None]:
+        self._submitted_partitions.append(partition)
+        return self._complete(
+            write=lambda: self.write_query_results_to_table_partition(
+                table_name=table_name, query=query, partition=partition
+            )
+        )
+
+    def submit_query_results_to_table_partitions(
+        self, table_name: str, partition_field: str, partition_queries: Mapping[str, str]
+    ) -> futures.Future[None]:
+        self._submitted_partitions.extend(partition_queries)
+        return self._complete(
+            write=lambda: self.write_query_results_to_table_partitions(
+                table_name=table_name,
+                partition_field=partition_field,
+                partition_queries=partition_queries,
+            )
+        )
+
+    def submit_query_results_to_table(self, table_name: str, query: str) -> futures.Future[None]:
+        return self._complete(
+            write=lambda: self.write_query_results_to_table(table_name=table_name, query=query)
+        )
+
 
 def setup_dependencies(
     table_metadata: Iterable[value_objects.TableMetadata] | None = None,
     query_map: dict[str, str] | None = None,
+    table_configs: Iterable[value_objects.TableConfig] | None = None,
 ) -> tuple[message_bus.MessageBus, MockTableRepository, MockQueryRepository]:
     table_repository = MockTableRepository(table_metadata=table_metadata or [])
     query_repository = MockQueryRepository(query_map=query_map or {})
+    table_config_repository = local.InMemoryTableConfigRepository()
+    for table_config in table_configs or []:
+        table_config_repository.add_table_config(table_config=table_config)
     bus: message_bus.MessageBus = bootstrap.bootstrap(
-        table_repository=table_repository, query_repository=query_repository
+        table_repository=table_repository,
+        query_repository=query_repository,
+        table_config_repository=table_config_repository,
     )
     return bus, table_repository, query_repository
 
@@ -146,12 +251,31 @@ def test_update_table_updates_table():
     assert '2024-01-01' in table_repository[table_name].partitions
 
 
+def test_update_table_partition_reports_query_hash_instead_of_query():
+    table_name = 'test_table'
+    query = 'SELECT 1 AS a_very_long_query'
+    bus, _, _ = setup_dependencies(
+        table_metadata=[helpers.get_table_metadata(table_name=table_name)]
+    )
+    cmd = commands.UpdateTablePartition(table_name=table_name, query=query, partition='2024-01-01')
+
+    event = bus.handle(cmd)
+
+    assert event == events.TablePartitionUpdated(
+        table_name=table_name,
+        query_hash=utils.hash_definition(definition=query),
+        partition='2024-01-01',
+    )
+    assert query not in repr(cmd)
+
+
 def test_plan_backfill_produces_plan_to_update_all_partitions_in_the_specified_table_in_order():
     expected_table_metadata = helpers.get_table_metadata(
         table_name='test_table', partitions=('2024-01-01', '2024-01-02', '2024-01-03')
     )
     bus, _, _ = setup_dependencies(
         query_map={expected_table_metadata.table_name: 'SELECT 1'},
+        table_configs=[helpers.get_table_config(table_name=expected_table_metadata.table_name)],
     )
     expected_commands = [
         commands.UpdateTablePartition(
@@ -181,6 +305,288 @@ def test_plan_backfill_produces_plan_to_update_all_partitions_in_the_specified_t
     assert actual_commands == expected_commands
 
 
+class TestConcurrentBackfill:
+    def test_plan_backfill_produces_concurrent_update_when_concurrency_is_configured(self):
+        table_config = helpers.get_table_config(table_name='test_table', backfill_concurrency=4)
+        bus, _, _ = setup_dependencies(
+            query_map={table_config.table_name: 'SELECT 1'}, table_configs=[table_config]
+        )
+
+        actual_commands = bus.handle(
+            message=commands.PlanBackfill(
+                table_name=table_config.table_name, partitions=['2024-01-01', '2024-01-02']
+            ),
+        )
+
+        assert actual_commands == [
+            commands.UpdateTablePartitions(
+                table_name=table_config.table_name,
+                chains=[
+                    [
+                        commands.UpdateTablePartition(
+                            table_name=table_config.table_name,
+                            query='SELECT 1',
+                            partition=partition,
+                        )
+                    ]
+                    for partition in ['2024-01-01', '2024-01-02']
+                ],
+                max_concurrency=4,
+            )
+        ]
+
+    def test_table_is_backfilled_concurrently(self):
+        expected_partitions = [f'2024-01-{day:02}' for day in range(1, 11)]
+        table_config = helpers.get_table_config(
+            table_name='test_table', partitions=expected_partitions, backfill_concurrency=4
+        )
+        bus, table_repository, _ = setup_dependencies(
+            table_metadata=[helpers.get_table_metadata(table_name='test_table', partitions=[])],
+        )
+
+        bus.dispatch(
+            message=commands.SyncPartitionedTable(
+                expected_metadata=table_config, query_renderer=lambda _: 'SELECT {run_day}'
+            )
+        )
+
+        assert sorted(table_repository._write_query_results_to_table_partition_calls) == (
+            expected_partitions
+        )
+        assert (
+            message_bus.LogEntry(message_type='TablePartitionsUpdated', table_name='test_table')
+            in bus.log
+        )
+
+    def test_failed_partitions_are_reported_after_all_other_partitions_are_updated(self):
+        table_repository = MockTableRepository(
+            table_metadata=[helpers.get_table_metadata(table_name='test_table', partitions=[])]
+        )
+        write_partition = table_repository.write_query_results_to_table_partition
+
+        def failing_write(table_name: str, query: str, partition: str):
+            if partition == '2024-01-02':
+                raise ValueError('stub error')
+            write_partition(table_name=table_name, query=query, partition=partition)
+
+        table_repository.write_query_results_to_table_partition = failing_write
+        cmd = commands.UpdateTablePartitions(
+            table_name='test_table',
+            chains=[
+                [commands.UpdateTablePartition('test_table', 'unused', partition)]
+                for partition in ['2024-01-01', '2024-01-02', '2024-01-03']
+            ],
+            max_concurrency=3,
+        )
+
+        with pytest.raises(service_exceptions.PartitionUpdatesFailedError) as exc_info:
+            handlers.update_table_partitions(cmd=cmd, table_repository=table_repository)
+
+        assert list(exc_info.value.failed) == ['2024-01-02']
+        assert sorted(table_repository._write_query_results_to_table_partition_calls) == [
+            '2024-01-01',
+            '2024-01-03',
+        ]
+
+    def test_async_repository_writes_are_submitted(self):
+        table_repository = MockAsyncTableRepository(
+            table_metadata=[helpers.get_table_metadata(table_name='test_table', partitions=[])]
+        )
+        cmd = commands.UpdateTablePartitions(
+            table_name='test_table',
+            chains=[
+                [
+                    commands.UpdateTablePartition('test_table', 'unused', '2024-01-01'),
+                    commands.UpdateTablePartition('test_table', 'unused', '2024-01-02'),
+                ],
+                [
+                    commands.UpdateTablePartitionBatch(
+                        table_name='test_table',
+                        partition_field='day',
+                        updates=[
+                            commands.UpdateTablePartition('test_table', 'unused', '2024-01-03')
+                        ],
+                    )
+                ],
+            ],
+            max_concurrency=2,
+        )
+
+        event = handlers.update_table_partitions(cmd=cmd, table_repository=table_repository)
+
+        assert sorted(table_repository._submitted_partitions) == [
+            '2024-01-01',
+            '2024-01-02',
+            '2024-01-03',
+        ]
+        assert list(event.partitions) == ['2024-01-01', '2024-01-02', '2024-01-03']
+
+
+class TestSelfReferentialBackfill:
+    @staticmethod
+    def recursive_query(run_day: str) -> str:
+        return f"SELECT * FROM `project.dataset.test_table` WHERE day = DATE('{run_day}') - 1"
+
+    def test_self_referential_table_is_rebuilt_from_earliest_gap_in_a_single_chain(self):
+        table_config = helpers.get_table_config(
+            table_name='test_table',
+            partitions=[f'2024-01-0{day}' for day in range(1, 6)],
+            backfill_concurrency=4,
+        )
+        bus, _, _ = setup_dependencies(
+            query_map={'test_table': self.recursive_query}, table_configs=[table_config]
+        )
+
+        actual_commands = bus.handle(
+            message=commands.PlanBackfill(
+                table_name='test_table', partitions=['2024-01-04', '2024-01-02']
+            )
+        )
+
+        assert actual_commands == [
+            commands.UpdateTablePartitions(
+                table_name='test_table',
+                chains=[
+                    [
+                        commands.UpdateTablePartition(
+                            table_name='test_table',
+                            query=self.recursive_query(run_day=partition),
+                            partition=partition,
+                        )
+                        for partition in ['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05']
+                    ]
+                ],
+                max_concurrency=4,
+            )
+        ]
+
+    def test_self_referential_table_is_backfilled_in_date_order(self):
+        expected_partitions = [f'2024-01-0{day}' for day in range(1, 6)]
+        table_config = helpers.get_table_config(
+            table_name='test_table', partitions=expected_partitions, backfill_concurrency=4
+        )
+        bus, table_repository, _ = setup_dependencies(
+            table_metadata=[helpers.get_table_metadata(table_name='test_table', partitions=[])],
+        )
+
+        bus.dispatch(
+            message=commands.SyncPartitionedTable(
+                expected_metadata=table_config, query_renderer=self.recursive_query
+            )
+        )
+
+        assert table_repository._write_query_results_to_table_partition_calls == (
+            expected_partitions
+        )
+
+    def test_start_date_partition_heads_the_chain_of_the_partitions_reading_it(self):
+        def start_date_query(run_day: str) -> str:
+            if run_day == '2024-01-01':
+                return 'SELECT 1'
+            return self.recursive_query(run_day=run_day)
+
+        table_config = helpers.get_table_config(
+            table_name='test_table',
+            partitions=['2024-01-01', '2024-01-02'],
+            backfill_concurrency=4,
+        )
+        bus, _, _ = setup_dependencies(
+            query_map={'test_table': start_date_query}, table_configs=[table_config]
+        )
+
+        actual_commands = bus.handle(
+            message=commands.PlanBackfill(
+                table_name='test_table', partitions=['2024-01-01', '2024-01-02']
+            )
+        )
+
+        assert [[update.partition for update in chain] for chain in actual_commands[0].chains] == [
+            ['2024-01-01', '2024-01-02']
+        ]
+
+
+class TestBatchedBackfill:
+    def test_plan_backfill_batches_independent_partitions(self):
+        table_config = helpers.get_table_config(
+            table_name='test_table', backfill_concurrency=2, backfill_batch_size=2
+        )
+        bus, _, _ = setup_dependencies(
+            query_map={table_config.table_name: 'SELECT 1'}, table_configs=[table_config]
+        )
+
+        actual_commands = bus.handle(
+            message=commands.PlanBackfill(
+                table_name=table_config.table_name,
+                partitions=['2024-01-03', '2024-01-01', '2024-01-02'],
+            ),
+        )
+
+        def update(partition: str) -> commands.UpdateTablePartition:
+            return commands.UpdateTablePartition(
+                table_name=table_config.table_name, query='SELECT 1', partition=partition
+            )
+
+        assert actual_commands == [
+            commands.UpdateTablePartitions(
+                table_name=table_config.table_name,
+                chains=[
+                    [
+                        commands.UpdateTablePartitionBatch(
+                            table_name=table_config.table_name,
+                            partition_field=table_config.partition_field,
+                            updates=[update('2024-01-01'), update('2024-01-02')],
+                        )
+                    ],
+                    [update('2024-01-03')],
+                ],
+                max_concurrency=2,
+            )
+        ]
+
+    def test_table_is_backfilled_in_batches(self):
+        expected_partitions = [f'2024-01-0{day}' for day in range(1, 6)]
+        table_config = helpers.get_table_config(
+            table_name='test_table',
+            partitions=expected_partitions,
+            backfill_concurrency=1,
+            backfill_batch_size=2,
+        )
+        bus, table_repository, _ = setup_dependencies(
+            table_metadata=[helpers.get_table_metadata(table_name='test_table', partitions=[])],
+        )
+
+        bus.dispatch(
+            message=commands.SyncPartitionedTable(
+                expected_metadata=table_config, query_renderer=lambda _: 'SELECT {run_day}'
+            )
+        )
+
+        assert table_repository._write_query_results_to_table_partitions_calls == [
+            ['2024-01-01', '2024-01-02'],
+            ['2024-01-03', '2024-01-04'],
+        ]
+        assert table_repository._write_query_results_to_table_partition_calls == ['2024-01-05']
+
+    def test_self_referential_partitions_are_not_batched(self):
+        table_config = helpers.get_table_config(
+            table_name='test_table',
+            partitions=['2024-01-01', '2024-01-02'],
+            backfill_batch_size=2,
+        )
+        bus, _, _ = setup_dependencies(
+            query_map={'test_table': TestSelfReferentialBackfill.recursive_query},
+            table_configs=[table_config],
+        )
+
+        actual_commands = bus.handle(
+            message=commands.PlanBackfill(
+                table_name='test_table', partitions=['2024-01-01', '2024-01-02']
+            )
+        )
+
+        assert all(isinstance(cmd, commands.UpdateTablePartition) for cmd in actual_commands)
+
+
 class TestCheckForNewUpstreamDependencies:
     def test_check_for_new_upstream_dependencies_returns_error_if_upstream_created_after_downstream_last_update(
         self, uid: int
@@ -189,7 +595,9 @@ class TestCheckForNewUpstreamDependencies:
             table_name=f'upstream_table_{uid}', created=datetime(year=2024, month=1, day=2)
         )
         downstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
-            table_name=f'downstream_table_{uid}', updated=datetime(year=2024, month=1, day=1)
+            table_name=f'downstream_table_{uid}',
+            partitions=['2024-01-01', '2024-01-02'],
+            updated=datetime(year=2024, month=1, day=1),
         )
 
         table_repository = MockTableRepository(table_metadata=[upstream_table, downstream_table])
@@ -203,7 +611,58 @@ class TestCheckForNewUpstreamDependencies:
         )
 
         assert response == errors.NewUpstreamDependenciesSinceLastUpdate(
-            table_name=downstream_table.table_name
+            table_name=downstream_table.table_name,
+            stale_partitions=value_objects.Partitions.from_partitions(['2024-01-01', '2024-01-02']),
+        )
+
+    def test_check_for_new_upstream_dependencies_returns_only_partitions_modified_upstream(self):
+        upstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
+            table_name='upstream_table', partitions=['2024-01-01', '2024-01-02', '2024-01-03']
+        )
+        downstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
+            table_name='downstream_table', partitions=['2024-01-01', '2024-01-02', '2024-01-03']
+        )
+        table_repository = MockTableRepository(
+            table_metadata=[upstream_table, downstream_table],
+            partition_stats={
+                upstream_table.table_name: {
+                    partition: value_objects.PartitionStats(
+                        partition=partition, last_modified=datetime(year=2024, month=1, day=day)
+                    )
+                    for partition, day in [('2024-01-01', 2), ('2024-01-02', 5), ('2024-01-03', 3)]
+                },
+                downstream_table.table_name: {
+                    partition: value_objects.PartitionStats(
+                        partition=partition, last_modified=datetime(year=2024, month=1, day=4)
+                    )
+                    for partition in downstream_table.partitions
+                },
+            },
+        )
+
+        response = handlers.check_for_new_upstream_dependencies(
+            cmd=commands.CheckForNewUpstreamDependencies(
+                table_name=downstream_table.table_name,
+                upstream_table_names=[upstream_table.table_name],
+            ),
+            table_repository=table_repository,
+        )
+
+        assert response == errors.NewUpstreamDependenciesSinceLastUpdate(
+            table_name=downstream_table.table_name,
+            stale_partitions=value_objects.Partitions.from_partitions(['2024-01-02']),
+        )
+
+    def test_stale_partitions_are_backfilled_instead_of_sideloaded(self):
+        error = errors.NewUpstreamDependenciesSinceLastUpdate(
+            table_name='downstream_table',
+            stale_partitions=value_objects.Partitions.from_partitions(['2024-01-02']),
+        )
+
+        actual_command = handlers.default_error_handlers[type(error)](error)
+
+        assert actual_command == commands.PlanBackfill(
+            table_name='downstream_table', partitions=error.stale_partitions
         )
 
     def test_check_for_new_upstream_dependencies_returns_event_if_upstream_not_created_after_downstream_last_update(
@@ -369,19 +828,22 @@ class TestSyncPartitionedTable:
             assert actual_metadata.partitions == expected_table_metadata.partitions
             assert actual_metadata.definition == expected_table_metadata.definition
 
-        def test_table_is_backfilled_via_sideload_if_new_upstream_dependency(self, uid: int):
+        def test_stale_partitions_are_backfilled_if_new_upstream_dependency(self, uid: int):
             upstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
                 table_name=f'upstream_table_{uid}', created=datetime(year=2024, month=1, day=2)
             )
             downstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
-                table_name=f'downstream_table_{uid}', updated=datetime(year=2024, month=1, day=1)
+                table_name=f'downstream_table_{uid}',
+                partitions=['2024-01-01', '2024-01-02'],
+                updated=datetime(year=2024, month=1, day=1),
             )
             downstream_table_config = helpers.get_table_config(
                 table_name=downstream_table.table_name,
+                partitions=['2024-01-01', '2024-01-02'],
                 upstream_table_names=[upstream_table.table_name],
             )
 
-            bus, table_repository, query_repository = setup_dependencies(
+            bus, table_repository, _ = setup_dependencies(
                 table_metadata=[upstream_table, downstream_table],
             )
 
@@ -391,20 +853,51 @@ class TestSyncPartitionedTable:
             )
             bus.dispatch(message=cmd)
 
-            actual_metadata: value_objects.TableMetadata | None = (
-                table_repository.get_table_metadata(table_name=downstream_table.table_name)
+            assert table_repository._copy_table_called_with == {}
+            assert sorted(table_repository._write_query_results_to_table_partition_calls) == [
+                '2024-01-01',
+                '2024-01-02',
+            ]
+
+        def test_changed_definition_is_sideloaded_before_stale_partitions_are_backfilled(
+            self, uid: int
+        ):
+            upstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
+                table_name=f'upstream_table_{uid}', created=datetime(year=2024, month=1, day=2)
+            )
+            downstream_table: value_objects.TableMetadata = helpers.get_table_metadata(
+                table_name=f'downstream_table_{uid}',
+                partitions=['2024-01-01', '2024-01-02'],
+                definition='different_definition',
+                updated=datetime(year=2024, month=1, day=1),
+            )
+            downstream_table_config = helpers.get_table_config(
+                table_name=downstream_table.table_name,
+                partitions=['2024-01-01', '2024-01-02'],
+                upstream_table_names=[upstream_table.table_name],
             )
-            assert table_repository._copy_table_called_with == {
-                'source_table_name': f'{downstream_table.table_name}_sideload_{query_repository.get_query_hash(query_name=downstream_table.table_name)}',
-                'destination_table_name': downstream_table.table_name,
-            }
 
-            assert actual_metadata
-            assert actual_metadata.table_name == downstream_table_config.table_name
-            assert actual_metadata.schema == downstream_table_config.schema
-            assert actual_metadata.partition_field == downstream_table_config.partition_field
-            assert actual_metadata.partitions == downstream_table_config.partitions
-            assert actual_metadata.definition == downstream_table_config.definition
+            bus, table_repository, _ = setup_dependencies(
+                table_metadata=[upstream_table, downstream_table],
+            )
+
+            bus.dispatch(
+                message=commands.SyncPartitionedTable(
+                    expected_metadata=downstream_table_config,
+                    query_renderer=lambda _: 'SELECT {run_day}',
+                )
+            )
+
+            # the sideload rebuilds every partition, so none is backfilled into the old table
+            assert table_repository._copy_table_called_with['destination_table_name'] == (
+                downstream_table.table_name
+            )
+            assert (
+                message_bus.LogEntry(
+                    message_type='PlanBackfill', table_name=downstream_table.table_name
+                )
+                not in bus.log
+            )
 
         @pytest.mark.regression
         def test_sideload_can_continue_if_sideload_table_already_exists(self):
@@ -480,6 +973,62 @@ class TestSyncPartitionedTable:
             assert actual_metadata.partitions == expected_table_metadata.partitions
             assert actual_metadata.definition == expected_table_metadata.definition
 
+        def test_table_is_rebuilt_in_place_if_only_nullable_columns_are_added(self):
+            schema: list[dict[str, Any]] = [{'name': 'field_1', 'type': 'INTEGER'}]
+            expected_table_metadata = helpers.get_table_metadata(
+                table_name='test_table',
+                schema=[*schema, {'name': 'field_2', 'type': 'STRING', 'mode': 'NULLABLE'}],
+                partitions=['2024-01-01', '2024-01-02'],
+                definition='new_definition',
+            )
+            bus, table_repository, _ = setup_dependencies(
+                table_metadata=[
+                    helpers.get_table_metadata(
+                        **asdict(expected_table_metadata)
+                        | {'schema': schema, 'definition': 'old_definition'}
+                    )
+                ],
+            )
+            cmd = commands.SyncPartitionedTable(
+                expected_metadata=expected_table_metadata,
+                query_renderer=lambda _: 'SELECT {run_day}',
+            )
+            bus.dispatch(message=cmd)
+
+            actual_metadata: value_objects.TableMetadata = table_repository.get_table_metadata(
+                table_name='test_table'
+            )
+
+            assert not table_repository._copy_table_called_with
+            assert sorted(table_repository._write_query_results_to_table_partition_calls) == [
+                '2024-01-01',
+                '2024-01-02',
+            ]
+            assert actual_metadata.schema == expected_table_metadata.schema
+            assert actual_metadata.definition == expected_table_metadata.definition
+
+        def test_table_is_sideloaded_if_added_column_is_required(self):
+            schema: list[dict[str, Any]] = [{'name': 'field_1', 'type': 'INTEGER'}]
+            expected_table_metadata = helpers.get_table_metadata(
+                table_name='test_table',
+                schema=[*schema, {'name': 'field_2', 'type': 'STRING', 'mode': 'REQUIRED'}],
+                partitions=['2024-01-01', '2024-01-02'],
+            )
+            bus, table_repository, _ = setup_dependencies(
+                table_metadata=[
+                    helpers.get_table_metadata(
+                        **asdict(expected_table_metadata) | {'schema': schema}
+                    )
+                ],
+            )
+            cmd = commands.SyncPartitionedTable(
+                expected_metadata=expected_table_metadata,
+                query_renderer=lambda _: 'SELECT {run_day}',
+            )
+            bus.dispatch(message=cmd)
+
+            assert table_repository._copy_table_called_with
+
         def test_table_is_backfilled_in_place_if_missing_all_partitions(self):
             expected_table_metadata = helpers.get_table_metadata(
                 table_name='test_table',
@@ -612,6 +1161,111 @@ def test_check_table_partitions_triggers_sideload_if_table_partitions_exceed_con
     assert message.table_name == stub_table_config.table_name
 
 
+class TestCheckTablePartitions:
+    @staticmethod
+    def check_table_partitions(
+        table_partitions: Sequence[str], config_partitions: Sequence[str]
+    ) -> errors.Error | events.Event:
+        stub_table_config: value_objects.TableConfig = helpers.get_table_config(
+            partitions=config_partitions
+        )
+        stub_config_repo = local.InMemoryTableConfigRepository()
+        stub_config_repo.add_table_config(table_config=stub_table_config)
+        return handlers.check_table_partitions(
+            cmd=commands.CheckTablePartitions(
+                table_name=stub_table_config.table_name, expected_partitions=config_partitions
+            ),
+            table_config_repository=stub_config_repo,
+            table_repository=MockTableRepository(
+                table_metadata=[helpers.get_table_metadata(partitions=table_partitions)]
+            ),
+        )
+
+    def test_reports_missing_partitions_as_ranges(self):
+        message = self.check_table_partitions(
+            table_partitions=['2024-01-03', '2024-01-01'],
+            config_partitions=[
+                '2024-01-01',
+                '2024-01-02',
+                '2024-01-03',
+                '2024-01-04',
+                '2024-01-05',
+            ],
+        )
+
+        assert isinstance(message, errors.PartitionsDoNotMatchExpectation)
+        assert list(message.missing_partitions) == ['2024-01-02', '2024-01-04', '2024-01-05']
+        assert message.missing_partitions.ranges == (
+            value_objects.PartitionRange(start='2024-01-02', end='2024-01-02'),
+            value_objects.PartitionRange(start='2024-01-04', end='2024-01-05'),
+        )
+
+    def test_partition_order_does_not_matter(self):
+        message = self.check_table_partitions(
+            table_partitions=['2024-01-02', '2024-01-01'],
+            config_partitions=['2024-01-01', '2024-01-02'],
+        )
+
+        assert isinstance(message, events.TablePartitionsUpToDate)
+
+    def test_future_excess_partitions_are_up_to_date(self):
+        message = self.check_table_partitions(
+            table_partitions=['2024-01-01', '2024-01-02', '2024-01-03'],
+            config_partitions=['2024-01-01'],
+        )
+
+        assert isinstance(message, events.TablePartitionsUpToDate)
+
+    def test_partition_diff_splits_excess_around_expected_start(self):
+        diff = value_objects.PartitionDiff.from_partitions(
+            expected=['2024-01-03', '2024-01-04'],
+            actual=['2023-12-31', '2024-01-01', '2024-01-03', '2024-01-06'],
+        )
+
+        assert diff == value_objects.PartitionDiff(
+            missing=value_objects.Partitions.from_partitions(['2024-01-04']),
+            excess_past=value_objects.Partitions.from_range(start='2023-12-31', end='2024-01-01'),
+            excess_future=value_objects.Partitions.from_partitions(['2024-01-06']),
+        )
+
+
+class TestPartitions:
+    partitions = value_objects.Partitions.from_partitions(
+        ['2024-01-05', '2024-01-01', '2024-01-02', '2024-01-03', '2024-01-05']
+    )
+
+    def test_is_stored_as_sorted_ranges(self):
+        assert self.partitions.ranges == (
+            value_objects.PartitionRange(start='2024-01-01', end='2024-01-03'),
+            value_objects.PartitionRange(start='2024-01-05', end='2024-01-05'),
+        )
+        assert list(self.partitions) == ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-05']
+        assert len(self.partitions) == 4
+
+    def test_supports_membership_indexing_and_slicing(self):
+        assert '2024-01-02' in self.partitions
+        assert '2024-01-04' not in self.partitions
+        assert self.partitions[3] == self.partitions[-1] == '2024-01-05'
+        assert self.partitions[2:] == value_objects.Partitions.from_partitions(
+            ['2024-01-03', '2024-01-05']
+        )
+
+    def test_difference_is_computed_over_ranges(self):
+        difference = (
+            value_objects.Partitions.from_range(start='2023-12-30', end='2024-01-06')
+            - self.partitions
+        )
+
+        assert list(difference) == ['2023-12-30', '2023-12-31', '2024-01-04', '2024-01-06']
+
+    def test_table_config_partitions_are_converted(self):
+        table_config = helpers.get_table_config(partitions=['2024-01-02', '2024-01-01'])
+
+        assert table_config.partitions == value_objects.Partitions.from_range(
+            start='2024-01-01', end='2024-01-02'
+        )
+
+
 @pytest.mark.regression
 def test_plan_backfill_replaces_table_name_in_query():
     stub_table_name = 'stub_table_name'
@@ -629,10 +1283,14 @@ def test_plan_backfill_replaces_table_name_in_query():
             partition='2024-01-01',
         )
     ]
+    stub_config_repo = local.InMemoryTableConfigRepository()
+    stub_config_repo.add_table_config(
+        table_config=helpers.get_table_config(table_name=stub_table_name)
+    )
     cmd = commands.PlanBackfill(table_name=stub_table_name, partitions=['2024-01-01'])
 
     actual_backfill_plan: Sequence[commands.Command] = handlers.plan_backfill(
-        cmd=cmd, query_repository=stub_query_repo
+        cmd=cmd, query_repository=stub_query_repo, table_config_repository=stub_config_repo
     )
 
     assert actual_backfill_plan == expected_backfill_plan
@@ -1,9 +1,12 @@
+import dataclasses
+import sys
 from collections.abc import Iterator
 from contextlib import nullcontext as does_not_raise
 
 import pytest
 
 from src.managed_table.domain import commands, errors, events
+from src.managed_table.domain.messages import Message
 from src.managed_table.services import message_bus
 
 
@@ -25,6 +28,10 @@ class PassEvent(events.Event): ...
 class TestError(errors.Error): ...
 
 
+def log_entries(*messages: Message) -> list[message_bus.LogEntry]:
+    return [message_bus.LogEntry.from_message(message=message) for message in messages]
+
+
 def test_message_bus_inserts_responses_into_queue() -> None:
     command = TestCommand()
     first_event = FirstEvent()
@@ -48,7 +55,7 @@ def test_message_bus_inserts_responses_into_queue() -> None:
 
     bus.dispatch(message=command)
 
-    assert bus.log == [command, first_event, middle_event, later_event]
+    assert list(bus.log) == log_entries(command, first_event, middle_event, later_event)
 
 
 @pytest.mark.regression
@@ -87,7 +94,7 @@ def test_message_bus_handles_errors_first_then_dead_letter_queue_then_queue() ->
     with does_not_raise():
         bus.dispatch(message=command)
 
-        assert bus.log == [
+        assert list(bus.log) == log_entries(
             command,
             first_event,
             error,
@@ -95,7 +102,7 @@ def test_message_bus_handles_errors_first_then_dead_letter_queue_then_queue() ->
             error_command_event,
             first_event,  # retried from dead_letter_queue
             later_event,
-        ]
+        )
 
 
 @pytest.mark.regression
@@ -132,3 +139,133 @@ def test_message_bus_dead_letter_queue_recurring_error_raises_sys_exit() -> None
 
     with pytest.raises(SystemExit, match='Maximum number of retries reached, terminating program'):
         bus.dispatch(message=command)
+
+
+@dataclasses.dataclass(frozen=True)
+class StepCommand(commands.Command):
+    step: int
+
+
+@dataclasses.dataclass
+class StepError(errors.Error):
+    step: int
+
+
+def test_message_bus_handles_error_chains_deeper_than_recursion_limit() -> None:
+    depth: int = 2 * sys.getrecursionlimit()
+    failed_steps: set[int] = set()
+
+    def step_handler(cmd: StepCommand) -> StepError | None:
+        # every step fails once, and is fixed by the next step
+        if cmd.step < depth and cmd.step not in failed_steps:
+            failed_steps.add(cmd.step)
+            return StepError(step=cmd.step)
+        return None
+
+    def step_error_handler(error: StepError) -> StepCommand:
+        return StepCommand(step=error.step + 1)
+
+    bus = message_bus.MessageBus(
+        event_handlers={},
+        command_handlers={StepCommand: step_handler},
+        error_handlers={StepError: step_error_handler},
+        log_size=3 * depth + 1,
+    )
+
+    bus.dispatch(message=StepCommand(step=0))
+
+    assert bus.log[-1] == message_bus.LogEntry(message_type='StepCommand')
+    assert len(bus.log) == 3 * depth + 1
+
+
+def test_message_bus_counts_retries_per_message() -> None:
+    command = TestCommand()
+    error = TestError()
+    failing_events: list[FirstEvent] = [FirstEvent() for _ in range(5)]
+    error_counts: dict[int, int] = {}
+
+    def command_handler(cmd: TestCommand) -> list[events.Event]:
+        return failing_events
+
+    def first_event_handler(event: FirstEvent) -> TestError | None:
+        # each event fails twice before succeeding
+        error_counts[id(event)] = error_counts.get(id(event), 0) + 1
+        return error if error_counts[id(event)] <= 2 else None
+
+    bus = message_bus.MessageBus(
+        event_handlers={FirstEvent: first_event_handler},
+        command_handlers={TestCommand: command_handler},
+        error_handlers={TestError: pass_event},
+        max_retries=2,
+    )
+
+    with does_not_raise():
+        bus.dispatch(message=command)
+
+    assert list(error_counts.values()) == [3] * len(failing_events)
+
+
+def test_message_bus_log_keeps_most_recent_messages() -> None:
+    command = TestCommand()
+    pass_events: list[events.Event] = [PassEvent() for _ in range(5)]
+
+    def command_handler(cmd: TestCommand) -> list[events.Event]:
+        return pass_events
+
+    bus = message_bus.MessageBus(
+        event_handlers={PassEvent: pass_event},
+        command_handlers={TestCommand: command_handler},
+        error_handlers={},
+        log_size=3,
+    )
+
+    bus.dispatch(message=command)
+
+    assert list(bus.log) == log_entries(*pass_events[-3:])
+
+
+def test_message_bus_log_summarises_messages_without_their_sql() -> None:
+    command = commands.UpdateTablePartition(
+        table_name='test_table', query='SELECT 1', partition='2024-01-01'
+    )
+    bus = message_bus.MessageBus(
+        event_handlers={},
+        command_handlers={commands.UpdateTablePartition: pass_event},
+        error_handlers={},
+    )
+
+    bus.dispatch(message=command)
+
+    assert list(bus.log) == [
+        message_bus.LogEntry(
+            message_type='UpdateTablePartition', table_name='test_table', partition='2024-01-01'
+        )
+    ]
+
+
+def test_message_bus_handles_each_message_once_from_the_handler_table(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    n_events: int = 20_000
+    command = TestCommand()
+    pass_events: list[events.Event] = [PassEvent() for _ in range(n_events)]
+    handled: list[events.Event] = []
+
+    def command_handler(cmd: TestCommand) -> list[events.Event]:
+        return pass_events
+
+    def fallback_handler(message: object) -> None:
+        raise AssertionError(f'{message} was not found in the handler table')
+
+    monkeypatch.setattr(message_bus.handlers, 'complete_event_loop', fallback_handler)
+    bus = message_bus.MessageBus(
+        event_handlers={PassEvent: handled.append},
+        command_handlers={TestCommand: command_handler},
+        error_handlers={},
+        log_size=n_events + 1,
+    )
+
+    bus.dispatch(message=command)
+
+    assert len(bus.log) == n_events + 1
+    assert handled == pass_events
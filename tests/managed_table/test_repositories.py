@@ -1,6 +1,9 @@
 import datetime
+import time
 from collections.abc import Callable
+from concurrent import futures
 from contextlib import nullcontext as does_not_raise
+from unittest.mock import MagicMock
 
 import pytest
 from google.api_core import exceptions as google_exceptions
@@ -8,11 +11,12 @@ from google.cloud.bigquery import client as bq_client
 from google.cloud.bigquery import table as bq_table
 
 from src.managed_table import utils
-from src.managed_table.domain import value_objects
+from src.managed_table.domain import commands, value_objects
 from src.managed_table.repositories.config.adapters import local as local_config_repo
 from src.managed_table.repositories.query.adapters import local
 from src.managed_table.repositories.table import exceptions
 from src.managed_table.repositories.table.adapters import bigquery
+from src.managed_table.services import handlers
 from tests.managed_table import helpers
 
 
@@ -43,7 +47,7 @@ class TestBigQueryTableRepository:
 
         assert actual_metadata.table_name == expected_table_name
         assert actual_metadata.partition_field == expected_partition_field
-        assert actual_metadata.partitions == expected_partitions
+        assert list(actual_metadata.partitions) == expected_partitions
         assert actual_metadata.definition == expected_definition
         assert actual_metadata.schema == expected_schema
 
@@ -186,6 +190,336 @@ class TestBigQueryTableRepository:
         assert actual_results['number'] == 1
 
 
+class TestBigQueryTableRepositoryMetadataCache:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.mock_client = MagicMock()
+        self.mock_client.get_table.return_value = MagicMock(
+            spec=bq_table.Table,
+            schema=[],
+            labels={'definition': 'stub_definition'},
+            time_partitioning=None,
+            created=datetime.datetime(2024, 1, 1),
+            modified=datetime.datetime(2024, 1, 1),
+        )
+        self.mock_client.query.return_value.result.return_value = [
+            {
+                'table_name': 'stub_table',
+                'day': datetime.date(2024, 1, 1),
+                'total_rows': 10,
+                'last_modified_time': datetime.datetime(2024, 1, 2),
+            }
+        ]
+        self.repo = bigquery.BigQueryTableRepository(client=self.mock_client)
+
+    def test_get_table_metadata_fetches_each_table_once(self):
+        for _ in range(3):
+            self.repo.get_table_metadata(table_name='stub_table')
+
+        assert self.mock_client.get_table.call_count == 1
+        assert self.mock_client.query.call_count == 1
+
+    def test_write_to_partition_adds_partition_without_refetching_partitions(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.mock_client.query.return_value.result.return_value = MagicMock(total_rows=1)
+
+        self.repo.write_query_results_to_table_partition(
+            table_name='stub_table', query='unused', partition='2024-01-02'
+        )
+        actual_metadata = self.repo.get_table_metadata(table_name='stub_table')
+
+        assert list(actual_metadata.partitions) == ['2024-01-01', '2024-01-02']
+        assert self.mock_client.get_table.call_count == 2
+        assert self.mock_client.query.call_count == 2  # partitions query + write
+
+    def test_concurrent_partition_writes_all_patch_partition_listing(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.mock_client.query.return_value.result.return_value = MagicMock(total_rows=1)
+        partitions: list[str] = [
+            (datetime.date(2024, 1, 2) + datetime.timedelta(days=day)).isoformat()
+            for day in range(200)
+        ]
+
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            list(
+                pool.map(
+                    lambda partition: self.repo.write_query_results_to_table_partition(
+                        table_name='stub_table', query='unused', partition=partition
+                    ),
+                    partitions,
+                )
+            )
+        actual_metadata = self.repo.get_table_metadata(table_name='stub_table')
+
+        assert list(actual_metadata.partitions) == ['2024-01-01', *partitions]
+        assert self.mock_client.query.call_count == 1 + len(partitions)
+
+    def test_delete_table_invalidates_only_deleted_table(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.repo.get_table_metadata(table_name='other_stub_table')
+
+        self.repo.delete_table(table_name='stub_table')
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.repo.get_table_metadata(table_name='other_stub_table')
+
+        assert self.mock_client.get_table.call_count == 3
+        assert self.mock_client.query.call_count == 3
+
+    def test_table_not_found_is_not_cached(self):
+        self.mock_client.get_table.side_effect = [
+            google_exceptions.NotFound('missing'),
+            MagicMock(),
+        ]
+
+        with pytest.raises(expected_exception=exceptions.TableDoesNotExistError):
+            self.repo.table_exists(table_name='stub_table')
+
+        with does_not_raise():
+            self.repo.table_exists(table_name='stub_table')
+
+    def test_write_to_partitions_merges_all_partitions_in_one_job(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+
+        self.repo.write_query_results_to_table_partitions(
+            table_name='stub_table',
+            partition_field='day',
+            partition_queries={
+                '2024-01-02': "SELECT DATE('2024-01-02') AS day;",
+                '2024-01-01': "SELECT DATE('2024-01-01') AS day",
+            },
+        )
+        merge_query: str = self.mock_client.query.call_args.kwargs['query']
+        self.repo.get_table_metadata(table_name='stub_table')
+
+        assert "(SELECT DATE('2024-01-01') AS day)" in merge_query
+        assert "UNION ALL (SELECT DATE('2024-01-02') AS day)" in merge_query
+        assert "UNNEST(['2024-01-01', '2024-01-02']) AS partition_date" in merge_query
+        assert merge_query.index('RAISE') < merge_query.index('MERGE')
+        assert "DATE(target.day) IN UNNEST([DATE('2024-01-01'), DATE('2024-01-02')])" in merge_query
+        assert self.mock_client.query.call_count == 3  # partitions query is refetched
+
+    def test_write_to_partitions_fails_if_any_partition_query_returned_no_data(self):
+        self.mock_client.query.return_value.result.side_effect = google_exceptions.BadRequest(
+            f'Query error: {bigquery.NO_DATA_MESSAGE}2024-01-02 at [20:9]'
+        )
+
+        with pytest.raises(bigquery.QueryReturnedNoDataError, match='2024-01-02'):
+            self.repo.write_query_results_to_table_partitions(
+                table_name='stub_table',
+                partition_field='day',
+                partition_queries={
+                    '2024-01-01': "SELECT DATE('2024-01-01') AS day",
+                    '2024-01-02': 'SELECT 1 LIMIT 0',
+                },
+            )
+
+    def test_write_to_partitions_reraises_other_query_errors(self):
+        self.mock_client.query.return_value.result.side_effect = google_exceptions.BadRequest(
+            'Syntax error'
+        )
+
+        with pytest.raises(google_exceptions.BadRequest):
+            self.repo.write_query_results_to_table_partitions(
+                table_name='stub_table',
+                partition_field='day',
+                partition_queries={'2024-01-01': 'SELECT'},
+            )
+
+    def test_partitions_of_a_dataset_are_listed_in_one_scan(self):
+        self.mock_client.query.return_value.result.return_value = [
+            {
+                'table_name': table_name,
+                'day': day,
+                'total_rows': 10,
+                'last_modified_time': datetime.datetime(2024, 1, 2),
+            }
+            for table_name in ('stub_table', 'other_stub_table')
+            for day in (datetime.date(2024, 1, 2), datetime.date(2024, 1, 1))
+        ] + [
+            {
+                'table_name': 'empty_stub_table',
+                'day': None,
+                'total_rows': 0,
+                'last_modified_time': datetime.datetime(2024, 1, 2),
+            }
+        ]
+
+        actual_partitions = {
+            table_name: self.repo.get_table_metadata(table_name=table_name).partitions
+            for table_name in ('stub_table', 'other_stub_table', 'empty_stub_table')
+        }
+        actual_stats = self.repo.get_partition_stats(table_name='other_stub_table')
+        scan_query: str = self.mock_client.query.call_args.kwargs['query']
+
+        assert list(actual_partitions['stub_table']) == ['2024-01-01', '2024-01-02']
+        assert list(actual_partitions['other_stub_table']) == ['2024-01-01', '2024-01-02']
+        assert list(actual_partitions['empty_stub_table']) == []
+        assert actual_stats['2024-01-01'] == value_objects.PartitionStats(
+            partition='2024-01-01', last_modified=datetime.datetime(2024, 1, 2), total_rows=10
+        )
+        assert 'WHERE' not in scan_query
+        assert self.mock_client.query.call_count == 1
+
+    def test_get_partition_stats_does_not_fetch_tables(self):
+        self.repo.get_partition_stats(table_name='stub_table')
+        self.repo.get_partition_stats(table_name='other_stub_table')
+
+        self.mock_client.get_table.assert_not_called()
+        assert self.mock_client.query.call_count == 2  # dataset scan + missing table
+
+    def test_upstream_dependency_check_fetches_no_tables_one_by_one(self):
+        def query(query: str) -> MagicMock:
+            job = MagicMock()
+            if '__TABLES__' in query:
+                job.result.return_value = [
+                    {
+                        'table_id': table_id,
+                        'created': datetime.datetime(2024, 1, 1),
+                        'updated': datetime.datetime(2024, 1, 3),
+                    }
+                    for table_id in ('stub_table', 'upstream_stub_table')
+                ]
+            else:
+                job.result.return_value = [
+                    {
+                        'table_name': table_name,
+                        'day': datetime.date(2024, 1, 1),
+                        'total_rows': 10,
+                        'last_modified_time': datetime.datetime(2024, 1, 2),
+                    }
+                    for table_name in ('stub_table', 'upstream_stub_table')
+                ]
+            return job
+
+        self.mock_client.query.side_effect = query
+
+        handlers.check_for_new_upstream_dependencies(
+            cmd=commands.CheckForNewUpstreamDependencies(
+                table_name='stub_table', upstream_table_names=['upstream_stub_table']
+            ),
+            table_repository=self.repo,
+        )
+
+        self.mock_client.get_table.assert_not_called()
+        assert self.mock_client.query.call_count == 2  # timestamps + dataset scan
+
+    def test_tables_missing_from_dataset_scan_are_listed_on_their_own(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.repo.get_table_metadata(table_name='new_stub_table')
+        table_query: str = self.mock_client.query.call_args.kwargs['query']
+
+        assert "table_name = 'new_stub_table'" in table_query
+        assert self.mock_client.query.call_count == 2
+
+    def test_get_table_timestamps_queries_uncached_tables_once_per_dataset(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+        self.mock_client.query.return_value.result.return_value = [
+            {
+                'table_id': table_id,
+                'created': datetime.datetime(2024, 1, 2),
+                'updated': datetime.datetime(2024, 1, 3),
+            }
+            for table_id in ('other_stub_table', 'another_stub_table')
+        ]
+
+        actual_timestamps = self.repo.get_table_timestamps(
+            table_names=['stub_table', 'other_stub_table', 'another_stub_table']
+        )
+        timestamps_query: str = self.mock_client.query.call_args.kwargs['query']
+
+        assert actual_timestamps['stub_table'].created == datetime.datetime(2024, 1, 1)
+        assert actual_timestamps['other_stub_table'].updated == datetime.datetime(2024, 1, 3)
+        assert "IN UNNEST(['other_stub_table', 'another_stub_table'])" in timestamps_query
+        assert self.mock_client.get_table.call_count == 1
+        assert self.mock_client.query.call_count == 2  # partitions query + timestamps query
+
+    def test_get_table_timestamps_raises_if_table_not_found(self):
+        self.mock_client.query.return_value.result.return_value = []
+
+        with pytest.raises(expected_exception=exceptions.TableDoesNotExistError):
+            self.repo.get_table_timestamps(table_names=['stub_table'])
+
+    def test_add_columns_appends_to_schema_and_refetches_table(self):
+        self.repo.get_table_metadata(table_name='stub_table')
+
+        self.repo.add_columns(
+            table_name='stub_table', columns=[{'name': 'new_field', 'type': 'STRING'}]
+        )
+        self.repo.get_table_metadata(table_name='stub_table')
+        updated_table = self.mock_client.update_table.call_args.kwargs['table']
+
+        assert [field.name for field in updated_table.schema] == ['new_field']
+        assert self.mock_client.update_table.call_args.kwargs['fields'] == ['schema']
+        assert self.mock_client.get_table.call_count == 2
+
+
+class TestAsyncBigQueryTableRepository:
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.done_job_ids: list[str] = []
+        self.mock_client.list_jobs.side_effect = lambda **_: [
+            MagicMock(job_id=job_id) for job_id in self.done_job_ids
+        ]
+        self.repo = bigquery.AsyncBigQueryTableRepository(
+            client=self.mock_client, poll_interval=0.01
+        )
+
+    def submit_write(self, job_id: str, total_rows: int):
+        job = MagicMock(job_id=job_id)
+        job.result.return_value = MagicMock(total_rows=total_rows)
+        self.mock_client.query.return_value = job
+        return self.repo.submit_query_results_to_table_partition(
+            table_name='stub_table', query='unused', partition='2024-01-01'
+        )
+
+    def test_write_completes_once_its_job_is_listed_as_done(self):
+        future = self.submit_write(job_id='job_1', total_rows=1)
+        other_future = self.submit_write(job_id='job_2', total_rows=1)
+        time.sleep(0.05)
+        assert not future.done()
+
+        self.done_job_ids.append('job_1')
+
+        assert future.result(timeout=5) is None
+        assert not other_future.done()
+        self.done_job_ids.append('job_2')
+        assert other_future.result(timeout=5) is None
+
+    def test_write_fails_when_query_returned_no_data(self):
+        future = self.submit_write(job_id='job_1', total_rows=0)
+
+        self.done_job_ids.append('job_1')
+
+        with pytest.raises(bigquery.QueryReturnedNoDataError):
+            future.result(timeout=5)
+
+    def test_polling_error_fails_watched_writes_and_poller_restarts(self):
+        self.mock_client.list_jobs.side_effect = ConnectionError('connection reset')
+        future = self.submit_write(job_id='job_1', total_rows=1)
+
+        with pytest.raises(ConnectionError):
+            future.result(timeout=5)
+
+        self.mock_client.list_jobs.side_effect = lambda **_: [MagicMock(job_id='job_2')]
+        other_future = self.submit_write(job_id='job_2', total_rows=1)
+        assert other_future.result(timeout=5) is None
+
+    @pytest.mark.parametrize('cancel_error', [None, google_exceptions.NotFound('missing')])
+    def test_write_fails_and_its_job_is_cancelled_when_not_done_in_time(self, cancel_error):
+        self.mock_client.cancel_job.side_effect = cancel_error
+        self.repo = bigquery.AsyncBigQueryTableRepository(
+            client=self.mock_client, poll_interval=0.01, job_timeout=datetime.timedelta(0)
+        )
+        future = self.submit_write(job_id='job_1', total_rows=1)
+
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+
+        self.mock_client.cancel_job.assert_called_once_with(
+            job_id='job_1', location=self.mock_client.query.return_value.location
+        )
+
+
 class TestInMemoryTableConfigRepository:
     def test_get_table_config_can_get_existing_config(self):
         repo = local_config_repo.InMemoryTableConfigRepository()
@@ -4,9 +4,14 @@ from unittest.mock import MagicMock
 import pytest
 from databricks.sdk.service.catalog import ColumnInfo, TableInfo
 
-from src.managed_table.domain import value_objects
+from src.managed_table.domain import commands, events, value_objects
+from src.managed_table.repositories.config.adapters import local
 from src.managed_table.repositories.table import exceptions
-from src.managed_table.repositories.table.adapters.unity_catalog import UnityCatalogTableRepository
+from src.managed_table.repositories.table.adapters.unity_catalog import (
+    QueryReturnedNoDataError,
+    UnityCatalogTableRepository,
+)
+from src.managed_table.services import handlers
 
 
 class TestUnityCatalogTableRepository:
@@ -19,7 +24,7 @@ class TestUnityCatalogTableRepository:
         expected_table_name = 'test_table'
         expected_schema = [{'name': 'column_1', 'type': 'TIMESTAMP'}]
         expected_partition_field = 'column_1'
-        expected_partitions = ['column_1']
+        expected_partitions = ['2024-01-01', '2024-01-02']
         expected_definition = 'test_table_definition'
         expected_created = datetime.datetime(2024, 2, 1, 12, 0, 0)
         expected_updated = datetime.datetime(2024, 2, 2, 12, 0, 0)
@@ -40,6 +45,10 @@ class TestUnityCatalogTableRepository:
         self.repo._get_partition_field = MagicMock(return_value=expected_partition_field)
 
         self.mock_client.tables.get.return_value = mock_table_info
+        self.mock_client.statement_execution.execute.return_value.result.data_array = [
+            ['2024-01-02'],
+            ['2024-01-01'],
+        ]
 
         actual_metadata: value_objects.TableMetadata | None = self.repo.get_table_metadata(
             table_name=expected_table_name
@@ -48,7 +57,10 @@ class TestUnityCatalogTableRepository:
         assert actual_metadata.table_name == expected_table_name
         assert actual_metadata.schema == expected_schema
         assert actual_metadata.partition_field == expected_partition_field
-        assert actual_metadata.partitions == expected_partitions
+        assert list(actual_metadata.partitions) == expected_partitions
+        self.mock_client.statement_execution.execute.assert_called_once_with(
+            'SELECT DISTINCT CAST(column_1 AS DATE) FROM test_table WHERE column_1 IS NOT NULL'
+        )
         assert actual_metadata.definition == expected_definition
         assert actual_metadata.created == expected_created
         assert actual_metadata.updated == expected_updated
@@ -75,7 +87,7 @@ class TestUnityCatalogTableRepository:
             table_name='catalog.schema.table',
             schema=[{'name': 'col1', 'type': 'STRING'}],
             partition_field='col1',
-            partitions=['col1'],
+            partitions=['2024-01-01'],
             definition='Test table',
         )
 
@@ -119,9 +131,73 @@ class TestUnityCatalogTableRepository:
             'INSERT INTO catalog.schema.table PARTITION (col1) SELECT * FROM source'
         )
 
+    def test_write_query_results_to_table_partitions(self):
+        self.mock_client.statement_execution.execute.return_value.result.data_array = []
+
+        self.repo.write_query_results_to_table_partitions(
+            'catalog.schema.table',
+            'day',
+            {'2024-01-02': 'SELECT 2 AS day', '2024-01-01': 'SELECT 1 AS day'},
+        )
+
+        check_call, insert_call = self.mock_client.statement_execution.execute.call_args_list
+        assert check_call.args[0] == (
+            "SELECT partition_date FROM VALUES ('2024-01-01'), ('2024-01-02') "
+            'AS expected(partition_date) WHERE CAST(partition_date AS DATE) NOT IN '
+            '(SELECT CAST(day AS DATE) FROM ((SELECT 1 AS day) UNION ALL (SELECT 2 AS day)) '
+            'AS source WHERE day IS NOT NULL)'
+        )
+        assert insert_call.args[0] == (
+            'INSERT INTO catalog.schema.table '
+            "REPLACE WHERE CAST(day AS DATE) IN ('2024-01-01', '2024-01-02') "
+            '(SELECT 1 AS day) UNION ALL (SELECT 2 AS day)'
+        )
+
+    def test_write_query_results_to_table_partitions_fails_if_a_partition_has_no_data(self):
+        self.mock_client.statement_execution.execute.return_value.result.data_array = [
+            ['2024-01-02']
+        ]
+
+        with pytest.raises(QueryReturnedNoDataError, match='2024-01-02'):
+            self.repo.write_query_results_to_table_partitions(
+                'catalog.schema.table',
+                'day',
+                {'2024-01-01': 'SELECT 1 AS day', '2024-01-02': 'SELECT 1 AS day LIMIT 0'},
+            )
+
+        self.mock_client.statement_execution.execute.assert_called_once()
+
     def test_write_query_results_to_table(self):
         self.repo.write_query_results_to_table('catalog.schema.table', 'SELECT * FROM source')
 
         self.mock_client.statement_execution.execute.assert_called_once_with(
             'INSERT INTO catalog.schema.table SELECT * FROM source'
         )
+
+    def test_update_definition_stores_a_definition_the_definition_check_accepts(self):
+        definition = "SELECT 'a' AS col1"
+        table_config_repository = local.InMemoryTableConfigRepository()
+        table_config_repository.add_table_config(
+            table_config=value_objects.TableConfig(
+                table_name='catalog.schema.table',
+                schema=[{'name': 'col1', 'type': 'STRING'}],
+                partition_field='',
+                partitions=[],
+                definition=definition,
+            )
+        )
+
+        self.repo.update_definition(table_name='catalog.schema.table', definition=definition)
+
+        (comment_sql,), _ = self.mock_client.statement_execution.execute.call_args
+        comment: str = comment_sql.removeprefix('COMMENT ON TABLE catalog.schema.table IS ').strip(
+            "'"
+        )
+        self.repo.get_table_metadata = MagicMock(
+            return_value=MagicMock(spec=value_objects.TableMetadata, definition=comment)
+        )
+        assert handlers.check_table_definition(
+            cmd=commands.CheckTableDefinition(table_name='catalog.schema.table'),
+            table_config_repository=table_config_repository,
+            table_repository=self.repo,
+        ) == events.TableDefinitionUpToDate(table_name='catalog.schema.table')
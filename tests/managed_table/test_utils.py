@@ -1,5 +1,9 @@
+import os
 from contextlib import nullcontext as does_not_raise
 
+from google.auth import credentials
+
+from src.common import clients
 from src.managed_table import utils
 
 
@@ -8,3 +12,50 @@ def test_hash_string_can_hash_string():
     with does_not_raise():
         hashed_string = utils.hash_string(string=string)
         assert isinstance(hashed_string, int)
+
+
+def test_read_template_compiles_once_and_reloads_changed_file(tmp_path, mocker):
+    template_path = tmp_path / 'query.sql.jinja2'
+    template_path.write_text('SELECT {{ value }}')
+    compile_spy = mocker.spy(utils.jinja2_environment, 'compile')
+
+    assert utils.read_template(template_path=template_path, template_fields={'value': 1}) == (
+        'SELECT 1'
+    )
+    assert utils.read_template(template_path=template_path, template_fields={'value': 2}) == (
+        'SELECT 2'
+    )
+    assert compile_spy.call_count == 1
+
+    template_path.write_text('SELECT {{ value }} + 1')
+    os.utime(template_path, ns=(0, template_path.stat().st_mtime_ns + 1_000_000_000))
+
+    assert utils.read_template(template_path=template_path, template_fields={'value': 1}) == (
+        'SELECT 1 + 1'
+    )
+    assert compile_spy.call_count == 2
+
+
+def test_default_client_is_shared_and_pooled(mocker):
+    mocker.patch('google.auth.default', return_value=(credentials.AnonymousCredentials(), None))
+    clients.get_bigquery_client.cache_clear()
+
+    client = utils.default_client()
+
+    assert client is utils.default_client()
+    adapter = client._http.get_adapter(url='https://bigquery.googleapis.com')
+    assert adapter._pool_maxsize == clients.BQ_CONNECTION_POOL_SIZE
+    clients.get_bigquery_client.cache_clear()
+
+
+def test_reserving_connections_grows_the_default_client_pool(mocker):
+    mocker.patch('google.auth.default', return_value=(credentials.AnonymousCredentials(), None))
+    clients.get_bigquery_client.cache_clear()
+    concurrency: int = clients.BQ_CONNECTION_POOL_SIZE + 10
+
+    clients.reserve_bigquery_connections(concurrency=concurrency)
+    clients.reserve_bigquery_connections(concurrency=concurrency - 5)
+
+    adapter = utils.default_client()._http.get_adapter(url='https://bigquery.googleapis.com')
+    assert adapter._pool_maxsize == concurrency + clients.BQ_CONNECTION_POOL_HEADROOM
+    clients.get_bigquery_client.cache_clear()
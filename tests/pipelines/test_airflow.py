@@ -82,6 +82,44 @@ class TestPipeline:
         assert set(dag.task_ids) == {stub_task.name, stub_task_2.name}
         assert get_dag_edges(dag=dag) == {(stub_task.name, stub_task_2.name)}
 
+    @pytest.mark.slow
+    def test_can_compile_linear_tasks_into_one_task(
+        self,
+        get_stub_tasks: Callable[..., list[task.Task]],
+        get_stub_pipeline: Callable[..., pipeline.Pipeline],
+        get_dag_from_string: Callable[..., models.DAG],
+    ) -> None:
+        compiler = airflow.Airflow(group_linear_tasks=True)
+        stub_task, stub_task_2 = get_stub_tasks(n=2, connected=True)
+        stub_pipeline: pipeline.Pipeline = get_stub_pipeline(tasks=[stub_task, stub_task_2])
+
+        dag_definition: str = compiler.compile(stub_pipeline)
+        dag: models.DAG = get_dag_from_string(
+            dag_id=stub_pipeline.name, dag_definition=dag_definition
+        )
+
+        assert dag.task_ids == [f'{stub_task.name}__{stub_task_2.name}']
+        assert get_dag_edges(dag=dag) == set()
+
+    @pytest.mark.slow
+    def test_can_compile_long_linear_tasks_depending_on_missing_tasks(
+        self,
+        get_stub_tasks: Callable[..., list[task.Task]],
+        get_stub_pipeline: Callable[..., pipeline.Pipeline],
+        get_dag_from_string: Callable[..., models.DAG],
+    ) -> None:
+        compiler = airflow.Airflow(group_linear_tasks=True)
+        stub_tasks: list[task.Task] = get_stub_tasks(n=30, connected=True)
+        stub_tasks[0].depends_on.append('missing_task')
+        stub_pipeline: pipeline.Pipeline = get_stub_pipeline(tasks=stub_tasks)
+
+        dag_definition: str = compiler.compile(stub_pipeline)
+        dag: models.DAG = get_dag_from_string(
+            dag_id=stub_pipeline.name, dag_definition=dag_definition
+        )
+
+        assert dag.task_ids == [airflow.get_group_task_id(group=stub_tasks)]
+
     @pytest.mark.xfail
     @pytest.mark.slow
     def test_can_decompile_single_task(
@@ -118,3 +156,50 @@ class TestPipeline:
         )
 
         assert actual_pipeline == expected_pipeline
+
+
+class TestGetLinearTaskGroups:
+    def test_groups_chains_and_splits_at_branches(
+        self, get_stub_task: Callable[..., task.Task]
+    ) -> None:
+        a = get_stub_task(name='a')
+        b = get_stub_task(name='b', depends_on=['a'])
+        c = get_stub_task(name='c', depends_on=['b'])
+        d = get_stub_task(name='d', depends_on=['b'])
+        e = get_stub_task(name='e', depends_on=['d'])
+        f = get_stub_task(name='f', depends_on=['c', 'e'])
+
+        groups: list[list[task.Task]] = airflow.get_linear_task_groups(tasks=[f, e, d, c, b, a])
+
+        assert sorted([pipeline_task.name for pipeline_task in group] for group in groups) == [
+            ['a', 'b'],
+            ['c'],
+            ['d', 'e'],
+            ['f'],
+        ]
+
+    def test_task_depending_on_a_task_outside_of_tasks_starts_a_group(
+        self, get_stub_task: Callable[..., task.Task]
+    ) -> None:
+        b = get_stub_task(name='b', depends_on=['a'])
+        c = get_stub_task(name='c', depends_on=['b'])
+
+        groups: list[list[task.Task]] = airflow.get_linear_task_groups(tasks=[b, c])
+
+        assert [[pipeline_task.name for pipeline_task in group] for group in groups] == [['b', 'c']]
+
+
+class TestGetGroupTaskId:
+    def test_joins_task_names(self, get_stub_tasks: Callable[..., list[task.Task]]) -> None:
+        assert airflow.get_group_task_id(group=get_stub_tasks(n=2)) == 'stub_task_1__stub_task_2'
+
+    def test_shortens_ids_longer_than_airflow_allows(
+        self, get_stub_tasks: Callable[..., list[task.Task]]
+    ) -> None:
+        group: list[task.Task] = get_stub_tasks(n=30, connected=True)
+
+        task_id: str = airflow.get_group_task_id(group=group)
+
+        assert len(task_id) == airflow.MAX_TASK_ID_LENGTH
+        assert task_id.startswith('stub_task_1__stub_task_2__')
+        assert task_id != airflow.get_group_task_id(group=group[:-1])
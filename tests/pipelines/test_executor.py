@@ -0,0 +1,81 @@
+import dataclasses
+import threading
+
+import pytest
+
+from src.pipelines._internal import executor, graph
+
+
+@dataclasses.dataclass
+class StubNode:
+    name: str
+    depends_on: list[str] = dataclasses.field(default_factory=list)
+
+
+class TestExecuteDag:
+    def test_runs_each_node_after_its_dependencies(self) -> None:
+        nodes: list[StubNode] = [
+            StubNode(name='lift', depends_on=['user_counts', 'content_counts']),
+            StubNode(name='user_counts', depends_on=['base']),
+            StubNode(name='content_counts', depends_on=['base']),
+            StubNode(name='base'),
+        ]
+
+        runs = executor.execute_dag(
+            dag=graph.DAG(nodes=nodes), action=lambda node: None, max_concurrency=4
+        )
+
+        finished: dict[str, executor.NodeRun[StubNode]] = {run.node.name: run for run in runs}
+        assert len(runs) == len(nodes)
+        for node in nodes:
+            for dependency in node.depends_on:
+                assert finished[dependency].ended_at <= finished[node.name].started_at
+
+    def test_runs_independent_nodes_concurrently(self) -> None:
+        # both branches must be in flight at once for either of them to get past the barrier
+        barrier = threading.Barrier(parties=2, timeout=5)
+        nodes: list[StubNode] = [
+            StubNode(name='base'),
+            StubNode(name='user_counts', depends_on=['base']),
+            StubNode(name='content_counts', depends_on=['base']),
+        ]
+
+        def action(node: StubNode) -> None:
+            if node.name != 'base':
+                barrier.wait()
+
+        runs = executor.execute_dag(dag=graph.DAG(nodes=nodes), action=action, max_concurrency=2)
+
+        assert [run.error for run in runs] == [None, None, None]
+
+    def test_stops_scheduling_after_failure(self) -> None:
+        nodes: list[StubNode] = [
+            StubNode(name='base'),
+            StubNode(name='user_counts', depends_on=['base']),
+            StubNode(name='lift', depends_on=['user_counts']),
+        ]
+        finished: list[executor.NodeRun[StubNode]] = []
+
+        def action(node: StubNode) -> None:
+            if node.name == 'user_counts':
+                raise ValueError(node.name)
+
+        with pytest.raises(ValueError, match='user_counts'):
+            executor.execute_dag(
+                dag=graph.DAG(nodes=nodes),
+                action=action,
+                max_concurrency=2,
+                on_finished=finished.append,
+            )
+
+        assert [run.node.name for run in finished] == ['base', 'user_counts']
+        assert isinstance(finished[-1].error, ValueError)
+
+    def test_ignores_dependencies_outside_of_dag(self) -> None:
+        nodes: list[StubNode] = [StubNode(name='user_counts', depends_on=['base'])]
+
+        runs = executor.execute_dag(
+            dag=graph.DAG(nodes=nodes), action=lambda node: None, max_concurrency=1
+        )
+
+        assert [run.node for run in runs] == nodes
@@ -27,3 +27,35 @@ class TestDAG:
 
     def test_node_map(self) -> None:
         assert self.dag.node_map == {task.name: task for task in self.nodes}  # type: ignore[reportPrivateUsage]
+
+    def test_add_node_updates_built_indexes(self) -> None:
+        dag: graph.DAG[StubNode] = graph.DAG(nodes=list(self.nodes))
+        task_4 = StubNode(name='task_4', depends_on=['task_1'])
+        assert dag.leaves == [self.task_3.name]
+
+        dag.add_node(node=task_4)
+
+        assert dag['task_4'] == task_4
+        assert dag.leaves == [self.task_3.name, task_4.name]
+
+    def test_invalidate_rebuilds_from_nodes(self) -> None:
+        task_4 = StubNode(name='task_4', depends_on=[])
+        dag: graph.DAG[StubNode] = graph.DAG(nodes=list(self.nodes) + [task_4])
+        assert dag.roots == [self.task_1.name, task_4.name]
+
+        task_4.depends_on.append('task_3')
+        dag.invalidate()
+
+        assert dag.roots == [self.task_1.name]
+        assert list(dag) == [*self.nodes, task_4]
+
+    def test_add_dependency_updates_built_graph(self) -> None:
+        task_4 = StubNode(name='task_4', depends_on=[])
+        dag: graph.DAG[StubNode] = graph.DAG(nodes=list(self.nodes) + [task_4])
+        assert dag.roots == [self.task_1.name, task_4.name]
+
+        dag.add_dependency(node_name='task_4', dependency='task_3')
+
+        assert task_4.depends_on == ['task_3']
+        assert dag.roots == [self.task_1.name]
+        assert list(dag) == [*self.nodes, task_4]
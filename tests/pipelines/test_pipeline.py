@@ -1,8 +1,11 @@
 from datetime import timedelta
+from unittest import mock
 
+import networkx as nx
 import pytest
 
-from src.pipelines import pipeline, task
+from src.pipelines import adapters, pipeline, task
+from src.pipelines._internal import graph
 from tests.pipelines import pipelines_helpers
 
 
@@ -31,7 +34,72 @@ class TestPipeline:
 
         stub_pipeline.run()
 
-        assert stub_pipeline.log == [custom_task, default_task]
+        assert [run.node for run in stub_pipeline.log] == [custom_task, default_task]
+
+    def test_runs_tasks_one_at_a_time_in_topological_order_by_default(self) -> None:
+        stub_pipeline = pipeline.Pipeline(name='stub_pipeline')
+        for name, after in [
+            ('extract_a', None),
+            ('extract_b', None),
+            ('transform_a', 'extract_a'),
+            ('join', ['transform_a', 'extract_b']),
+            ('extract_c', None),
+            ('load', ['join', 'extract_c']),
+        ]:
+            stub_pipeline.add_task(name=name, action=pipelines_helpers.stub_action, after=after)
+
+        stub_pipeline.run()
+
+        assert [run.node for run in stub_pipeline.log] == list(stub_pipeline.dag)
+        for run, next_run in zip(stub_pipeline.log, stub_pipeline.log[1:]):
+            assert run.ended_at <= next_run.started_at
+
+    def test_records_start_and_end_times_of_tasks(self) -> None:
+        custom_task = task.Task(name='custom_task', action=pipelines_helpers.stub_action)
+        default_task = task.Task(
+            name='default_task', action=pipelines_helpers.stub_action, depends_on=['custom_task']
+        )
+        stub_pipeline = pipeline.Pipeline(name='stub_pipeline', tasks=[custom_task, default_task])
+
+        stub_pipeline.run()
+
+        custom_run, default_run = stub_pipeline.log
+        assert custom_run.started_at <= custom_run.ended_at <= default_run.started_at
+        assert default_run.started_at <= default_run.ended_at
+
+    def test_task_dict_follows_added_and_removed_tasks(self) -> None:
+        stub_pipeline = pipeline.Pipeline(name='stub_pipeline')
+        stub_pipeline.add_task(name='custom_task', action=pipelines_helpers.stub_action)
+        assert list(stub_pipeline.task_dict) == ['custom_task']
+
+        stub_pipeline.add_task(
+            name='default_task', action=pipelines_helpers.stub_action, before='custom_task'
+        )
+        stub_pipeline.remove_task(name='custom_task')
+
+        assert list(stub_pipeline.task_dict) == ['default_task']
+        assert list(stub_pipeline.dag) == [stub_pipeline['default_task']]
+
+    @pytest.mark.parametrize('dependency', ['after', 'before'])
+    def test_planning_builds_each_node_into_the_graph_once(self, dependency: str) -> None:
+        n: int = 1_000
+        with mock.patch.object(graph, '_add_to_graph', wraps=graph._add_to_graph) as add_to_graph:
+            stub_pipeline = pipeline.Pipeline(name='stub_pipeline')
+            stub_pipeline.add_task(name='task_0', action=pipelines_helpers.stub_action)
+            built_graph: nx.DiGraph = stub_pipeline.dag.graph
+            for i in range(1, n):
+                stub_pipeline.add_task(
+                    name=f'task_{i}',
+                    action=pipelines_helpers.stub_action,
+                    **{dependency: [f'task_{i // 2}']},
+                )
+            stub_pipeline.compile(adapter=adapters.Adapters.MERMAID)
+            assert len(list(stub_pipeline.dag)) == n
+
+        # rebuilding the graph while planning would add nodes more than once
+        assert stub_pipeline.dag.graph is built_graph
+        assert built_graph.number_of_edges() == n - 1
+        assert add_to_graph.call_count == n
 
     def test_add_task(self) -> None:
         stub_task_name = 'stub_task'
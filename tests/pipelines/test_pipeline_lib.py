@@ -29,7 +29,7 @@ class TestPipeline:
 
         stub_pipeline.run()
 
-        assert stub_pipeline.log == [stub_task_1, stub_task_2]
+        assert [run.node for run in stub_pipeline.log] == [stub_task_1, stub_task_2]
 
     def test_add_task(self) -> None:
         stub_task_name = 'stub_task'
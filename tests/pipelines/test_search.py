@@ -33,3 +33,54 @@ class TestFindAction:
             match=r'.*non_existant_function not found.*',
         ):
             search.find_function(name='non_existant_function', directory=tmp_path)
+
+
+class TestFunctionIndex:
+    def test_indexes_functions_by_first_defining_module(self, tmp_path: Path) -> None:
+        (tmp_path / 'a_module.py').write_text('def stub_function(): pass\n')
+        (tmp_path / 'nested').mkdir()
+        (tmp_path / 'nested' / 'b_module.py').write_text(
+            'def stub_function(): pass\ndef other_function(): pass\n'
+        )
+        (tmp_path / '.venv').mkdir()
+        (tmp_path / '.venv' / 'excluded.py').write_text('def excluded_function(): pass\n')
+
+        index = search.FunctionIndex.build(directory=tmp_path)
+
+        assert index.functions['other_function'] == 'nested.b_module'
+        assert index.functions['stub_function'] in {'a_module', 'nested.b_module'}
+        assert 'excluded_function' not in index.functions
+
+    def test_load_parses_only_changed_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        source_dir = tmp_path / 'source'
+        source_dir.mkdir()
+        unchanged_module = source_dir / 'unchanged_module.py'
+        changed_module = source_dir / 'changed_module.py'
+        unchanged_module.write_text('def unchanged_function(): pass\n')
+        changed_module.write_text('def old_function(): pass\n')
+        search.FunctionIndex.load(directory=source_dir, cache_dir=tmp_path / 'cache')
+
+        changed_module.write_text('def new_function(): pass\ndef newer_function(): pass\n')
+        parsed_paths: list[Path] = []
+        parse_module = search._parse_module
+
+        def _record_parse(path: Path):
+            parsed_paths.append(path)
+            return parse_module(path=path)
+
+        monkeypatch.setattr(search, '_parse_module', _record_parse)
+        index = search.FunctionIndex.load(directory=source_dir, cache_dir=tmp_path / 'cache')
+
+        assert parsed_paths == [changed_module]
+        assert set(index.functions) == {'unchanged_function', 'new_function', 'newer_function'}
+
+    def test_index_is_built_once_per_directory(self, tmp_path: Path) -> None:
+        search.invalidate_function_index()
+
+        index = search.get_function_index(directory=tmp_path)
+
+        assert search.get_function_index(directory=tmp_path) is index
+        search.invalidate_function_index()
+        assert search.get_function_index(directory=tmp_path) is not index
@@ -145,3 +145,24 @@ class TestQueryTemplates:
         )
 
         assert actual_query == 'stub_run_time_table_name'
+
+
+def test_template_is_compiled_once_for_all_renders_and_instances() -> None:
+    stub_query_template = '{{ run_day }} {{ stub_variable }}'
+    query_template.compile_template.cache_clear()
+    templates = [
+        query_template.QueryTemplate(
+            template=stub_query_template,
+            environment_template_fields={'stub_variable': value},
+        )
+        for value in ('a', 'b')
+    ]
+
+    actual_queries = [
+        template.render(run_day=run_day)
+        for template in templates
+        for run_day in ('2024-01-01', '2024-01-02')
+    ]
+
+    assert actual_queries == ['2024-01-01 a', '2024-01-02 a', '2024-01-01 b', '2024-01-02 b']
+    assert query_template.compile_template.cache_info().misses == 1
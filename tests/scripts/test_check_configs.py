@@ -0,0 +1,32 @@
+import pytest
+
+from src.scripts import check_configs
+
+
+class TestCheckQueryTemplate:
+    def test_renders_query_for_start_date(self) -> None:
+        errors: list[str] = check_configs.check_query_template(
+            config_name='content_base',
+            task_name='content_base',
+            parameters={'table_name': 'content_base', 'start_date': '2021-01-01'},
+            errors=[],
+        )
+
+        assert errors == []
+
+    def test_reports_query_that_cannot_be_found(self) -> None:
+        errors: list[str] = check_configs.check_query_template(
+            config_name='stub_config',
+            task_name='stub_task',
+            parameters={'table_name': 'non_existent_query', 'start_date': '2021-01-01'},
+            errors=[],
+        )
+
+        assert len(errors) == 1
+        assert 'query: non_existent_query failed to render' in errors[0]
+
+
+@pytest.mark.slow
+class TestCheckConfigs:
+    def test_configs_are_valid(self) -> None:
+        check_configs.check_configs(max_workers=2)
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from src.scripts import create_dag_files
+
+CONFIG_NAMES: list[str] = ['content_affinity', 'content_base']
+
+
+@pytest.mark.slow
+class TestGenerateDagFiles:
+    def test_regenerates_only_changed_dag_files(self, tmp_path: Path) -> None:
+        first_report = create_dag_files.generate_dag_files(
+            config_names=CONFIG_NAMES, target_dir=tmp_path
+        )
+        dag_path: Path = tmp_path / 'content_base_dag.py'
+        dag_path.write_text(dag_path.read_text().replace('content_base', 'stale'))
+        stale_hash_path: Path = tmp_path / 'content_affinity_dag.py'
+        stale_hash_path.write_text(f'{create_dag_files.SOURCE_HASH_HEADER}stale\n')
+
+        second_report = create_dag_files.generate_dag_files(
+            config_names=CONFIG_NAMES, target_dir=tmp_path
+        )
+
+        assert first_report.regenerated == CONFIG_NAMES
+        assert second_report.regenerated == ['content_affinity']
+        assert second_report.unchanged == ['content_base']
+        assert 'stale' in dag_path.read_text()
+        assert "dag_id='content_affinity'" in stale_hash_path.read_text()
+
+    def test_regenerates_when_compiler_options_change(self, tmp_path: Path) -> None:
+        create_dag_files.generate_dag_files(config_names=CONFIG_NAMES[:1], target_dir=tmp_path)
+
+        report = create_dag_files.generate_dag_files(
+            config_names=CONFIG_NAMES[:1], target_dir=tmp_path, group_linear_tasks=True
+        )
+
+        assert report.regenerated == CONFIG_NAMES[:1]
+
+    def test_compiler_sources_exist(self) -> None:
+        assert all(path.is_file() for path in create_dag_files.COMPILER_SOURCES)